@@ -0,0 +1,87 @@
+from time import time
+import numpy as np
+from tdw.add_ons.py_impact import PyImpact
+from tdw.physics_audio.scrape_material import ScrapeMaterial
+
+
+"""
+Benchmark the speed of PyImpact audio synthesis.
+This doesn't require a build.
+"""
+
+
+def scrape(num_events: int) -> float:
+    """
+    :param num_events: The number of scrape events in a single continuous scrape.
+
+    :return: Scrape events per second.
+    """
+
+    py_impact = PyImpact(rng=np.random.RandomState(0))
+    rng = np.random.RandomState(1)
+    velocities = [np.array([0.3 + 0.2 * np.sin(i / 10), 0, 0.1]) * (1 + rng.uniform(-0.1, 0.1))
+                  for i in range(num_events)]
+    # Load the scrape surface before timing anything.
+    py_impact.get_scrape_sound(velocity=velocities[0], contact_normals=[np.array([0, 1, 0])], primary_id=-1,
+                               primary_material="metal_1", primary_amp=0.2, primary_mass=1, secondary_id=-2,
+                               secondary_material="wood_medium_4", secondary_amp=0.5, secondary_mass=100,
+                               primary_resonance=0.45, secondary_resonance=0.5, scrape_material=ScrapeMaterial.plywood)
+    t0 = time()
+    for velocity in velocities:
+        py_impact.get_scrape_sound(velocity=velocity, contact_normals=[np.array([0, 1, 0])], primary_id=1,
+                                   primary_material="metal_1", primary_amp=0.2, primary_mass=1, secondary_id=2,
+                                   secondary_material="wood_medium_4", secondary_amp=0.5, secondary_mass=100,
+                                   primary_resonance=0.45, secondary_resonance=0.5,
+                                   scrape_material=ScrapeMaterial.plywood)
+    return num_events / (time() - t0)
+
+
+def impact(num_events: int) -> float:
+    """
+    :param num_events: The number of impact events.
+
+    :return: Impact events per second.
+    """
+
+    py_impact = PyImpact(rng=np.random.RandomState(0))
+    t0 = time()
+    for i in range(num_events):
+        py_impact.get_impact_sound(velocity=np.array([0, -2 - (i % 5) * 0.1, 0.1]),
+                                   contact_normals=[np.array([0, 1, 0])], primary_id=i % 10,
+                                   primary_material="ceramic_1", primary_amp=0.2, primary_mass=1, secondary_id=None,
+                                   secondary_material="wood_medium_4", secondary_amp=0.5, secondary_mass=100,
+                                   primary_resonance=0.45, secondary_resonance=0.5)
+    return num_events / (time() - t0)
+
+
+def cascade(num_objects: int, num_frames: int) -> float:
+    """
+    :param num_objects: The number of objects that collide with the floor per frame, as if they were falling in a pile.
+    :param num_frames: The number of frames.
+
+    :return: Impact events per second.
+    """
+
+    py_impact = PyImpact(rng=np.random.RandomState(0))
+    materials = ["ceramic_1", "metal_2", "wood_medium_3", "glass_1", "plastic_hard_2"]
+    t0 = time()
+    for frame in range(num_frames):
+        # This is what `py_impact.on_send()` does when there are many impacts on the same frame.
+        impacts = list()
+        for i in range(num_objects):
+            py_impact._add_impact(impacts=impacts, command_index=i, velocity=np.array([0, -2 - (frame % 5) * 0.1, 0.1]),
+                                  contact_points=[np.array([0, 0, 0])], contact_normals=[np.array([0, 1, 0])],
+                                  primary_id=i, primary_material=materials[i % len(materials)], primary_amp=0.2,
+                                  primary_mass=1 + i % 4, secondary_id=None, secondary_material="wood_medium_4",
+                                  secondary_amp=0.5, secondary_mass=100, primary_resonance=0.45,
+                                  secondary_resonance=0.5)
+        py_impact._get_impact_sound_commands(impacts=impacts)
+    return num_objects * num_frames / (time() - t0)
+
+
+if __name__ == "__main__":
+    print("| Test | Events per second |\n| --- | --- |")
+    for n in [100, 1000]:
+        print(f"| Scrape ({n} events) | {round(scrape(num_events=n))} |")
+    print(f"| Impact (1000 events) | {round(impact(num_events=1000))} |")
+    print(f"| Impact cascade (50 objects, 20 frames) | {round(cascade(num_objects=50, num_frames=20))} |")
@@ -0,0 +1,122 @@
+from time import time
+from struct import pack, unpack
+from typing import Dict, List
+import numpy as np
+from tdw.flatbuffers import Builder
+from tdw.FBOutput import DynamicCompositeObjects as DynComp
+from tdw.output_data import DynamicCompositeObjects
+from tdw.object_data.composite_object.composite_object_dynamic import CompositeObjectDynamic
+from tdw.object_data.composite_object.sub_object.hinge_dynamic import HingeDynamic
+from tdw.object_data.composite_object.sub_object.light_dynamic import LightDynamic
+from tdw.add_ons.composite_object_manager import CompositeObjectManager
+
+
+"""
+Benchmark the speed of parsing `DynamicCompositeObjects` output data and finding open hinges.
+This doesn't require a build. The output data is synthetic: many kitchen cabinets, each with several doors and a light.
+"""
+
+
+def get_dynamic_composite_objects(num_objects: int, num_hinges: int) -> bytes:
+    """
+    :param num_objects: The number of composite objects.
+    :param num_hinges: The number of hinges per object. Each object also has one light.
+
+    :return: Synthetic `DynamicCompositeObjects` output data.
+    """
+
+    rng = np.random.RandomState(0)
+    builder = Builder(0)
+    hinge_ids = [[i, num_objects + i * num_hinges + j] for i in range(num_objects) for j in range(num_hinges)]
+    hinges = rng.uniform(0, 90, size=(num_objects * num_hinges, 2)).astype(np.float32)
+    light_ids = [[i, num_objects * (num_hinges + 1) + i] for i in range(num_objects)]
+    vectors: List[int] = list()
+    for values, int32 in zip([np.array(hinge_ids).flatten(), hinges.flatten(), np.array(light_ids).flatten()],
+                             [True, False, True]):
+        builder.StartVector(4, len(values), 4)
+        for v in reversed(values.tolist()):
+            if int32:
+                builder.PrependInt32(v)
+            else:
+                builder.PrependFloat32(v)
+        vectors.append(builder.EndVector(len(values)))
+    builder.StartVector(1, num_objects, 1)
+    for v in reversed(rng.randint(0, 2, size=num_objects).tolist()):
+        builder.PrependBool(bool(v))
+    lights = builder.EndVector(num_objects)
+    DynComp.DynamicCompositeObjectsStart(builder)
+    DynComp.DynamicCompositeObjectsAddHingeIds(builder, vectors[0])
+    DynComp.DynamicCompositeObjectsAddHinges(builder, vectors[1])
+    DynComp.DynamicCompositeObjectsAddLightIds(builder, vectors[2])
+    DynComp.DynamicCompositeObjectsAddLights(builder, lights)
+    builder.Finish(DynComp.DynamicCompositeObjectsEnd(builder))
+    b = bytes(builder.Output())
+    # Insert the output data ID after the root offset.
+    return pack("<I", unpack("<I", b[:4])[0] + 4) + b"dcom" + b[4:]
+
+
+def per_object(resp: List[bytes], num_frames: int) -> float:
+    """
+    Parse the output data the way that `CompositeObjectManager` did in TDW v1.10.0 and then find every open hinge.
+
+    :param resp: The response from the build.
+    :param num_frames: The number of frames.
+
+    :return: Frames per second.
+    """
+
+    t0 = time()
+    for i in range(num_frames):
+        dynamic: Dict[int, CompositeObjectDynamic] = dict()
+        dynamic_composite_objects = DynamicCompositeObjects(resp[0])
+        hinges: Dict[int, List[HingeDynamic]] = dict()
+        lights: Dict[int, List[LightDynamic]] = dict()
+        for j in range(dynamic_composite_objects.get_num_hinges()):
+            object_id = dynamic_composite_objects.get_hinge_parent_id(j)
+            if object_id not in hinges:
+                hinges[object_id] = list()
+            hinges[object_id].append(HingeDynamic(sub_object_id=dynamic_composite_objects.get_hinge_id(j),
+                                                  angle=dynamic_composite_objects.get_hinge_angle(j),
+                                                  velocity=dynamic_composite_objects.get_hinge_velocity(j)))
+        for j in range(dynamic_composite_objects.get_num_lights()):
+            object_id = dynamic_composite_objects.get_light_parent_id(j)
+            if object_id not in lights:
+                lights[object_id] = list()
+            lights[object_id].append(LightDynamic(sub_object_id=dynamic_composite_objects.get_light_id(j),
+                                                  is_on=dynamic_composite_objects.get_light_is_on(j)))
+        object_ids = list(hinges.keys())
+        object_ids.extend(list(lights.keys()))
+        object_ids = list(sorted(set(object_ids)))
+        for object_id in object_ids:
+            o = CompositeObjectDynamic(object_id=object_id,
+                                       hinges={hinge.sub_object_id: hinge for hinge in hinges[object_id]} if object_id in hinges else {},
+                                       lights={light.sub_object_id: light for light in lights[object_id]} if object_id in lights else {})
+            dynamic[o.object_id] = o
+        open_hinges = [hinge_id for object_id in dynamic for hinge_id in dynamic[object_id].hinges
+                       if dynamic[object_id].hinges[hinge_id].angle >= 30]
+    return num_frames / (time() - t0)
+
+
+def columnar(resp: List[bytes], num_frames: int) -> float:
+    """
+    :param resp: The response from the build.
+    :param num_frames: The number of frames.
+
+    :return: Frames per second.
+    """
+
+    m = CompositeObjectManager()
+    # Initialize the add-on.
+    m.on_send(resp=resp)
+    t0 = time()
+    for i in range(num_frames):
+        m.on_send(resp=resp)
+        open_hinges = m.get_open(open_at=30)
+    return num_frames / (time() - t0)
+
+
+if __name__ == "__main__":
+    print("| Objects | Hinges | v1.10.0 (FPS) | FPS |\n| --- | --- | --- | --- |")
+    for o, h in [(10, 4), (100, 4), (500, 4)]:
+        r = [get_dynamic_composite_objects(num_objects=o, num_hinges=h), (0).to_bytes(4, byteorder="big")]
+        print(f"| {o} | {o * h} | {round(per_object(resp=r, num_frames=500))} | {round(columnar(resp=r, num_frames=500))} |")
@@ -0,0 +1,62 @@
+import sys
+from json import loads, dumps
+from subprocess import check_output
+from argparse import ArgumentParser
+
+
+"""
+Benchmark how long it takes to `import tdw.controller` in a new process.
+This doesn't require a build.
+
+The benchmark fails (exits with a non-zero code) if the median import time exceeds the budget, or if any slow modules are imported.
+"""
+
+# Modules that shouldn't be imported by `import tdw.controller` because they're slow to import and usually aren't needed.
+SLOW_MODULES = ["requests", "pkg_resources", "tdw.release.build", "tdw.release.pypi",
+                "tdw.physics_audio.object_audio_static", "tdw.physics_audio.default_physics_index"]
+# This is run in each new process.
+SCRIPT = """import sys
+import json
+from time import perf_counter
+t0 = perf_counter()
+import tdw.controller
+t1 = perf_counter()
+print(json.dumps({"time": t1 - t0, "modules": [m for m in json.loads(sys.argv[1]) if m in sys.modules]}))"""
+
+
+def import_time(num_trials: int) -> dict:
+    """
+    :param num_trials: The number of new processes.
+
+    :return: A dictionary: The median import time in milliseconds and a list of slow modules that were imported.
+    """
+
+    times = list()
+    modules = set()
+    # Import the controller once before timing anything so that the .pyc files are written.
+    check_output([sys.executable, "-c", "import tdw.controller"])
+    for i in range(num_trials):
+        result = loads(check_output([sys.executable, "-c", SCRIPT, dumps(SLOW_MODULES)]).decode("utf-8").strip())
+        times.append(result["time"] * 1000)
+        modules.update(result["modules"])
+    times.sort()
+    return {"time": times[len(times) // 2],
+            "modules": sorted(modules)}
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--trials", type=int, default=10, help="The number of new processes.")
+    parser.add_argument("--budget", type=float, default=200, help="The maximum median import time in milliseconds.")
+    args = parser.parse_args()
+    r = import_time(num_trials=args.trials)
+    print(f"import tdw.controller: {round(r['time'])} ms (budget: {round(args.budget)} ms)")
+    failed = False
+    if r["time"] > args.budget:
+        print("The import time exceeds the budget.")
+        failed = True
+    if len(r["modules"]) > 0:
+        print(f"These slow modules were imported: {', '.join(r['modules'])}")
+        failed = True
+    if failed:
+        exit(1)
@@ -0,0 +1,127 @@
+from time import time
+from struct import pack, unpack
+from typing import List
+import numpy as np
+from tdw.flatbuffers import Builder
+from tdw.FBOutput import ObiParticles as ObiP, ObiSolverData as ObiS, ObiActorData as ObiA
+from tdw.output_data import ObiParticles
+from tdw.add_ons.obi import Obi
+
+
+"""
+Benchmark the speed of parsing `ObiParticles` output data.
+This doesn't require a build. The output data is synthetic: several fluid emitters share one solver.
+"""
+
+
+def vector(builder: Builder, values: np.array, int32: bool) -> int:
+    """
+    :param builder: The FlatBuffers builder.
+    :param values: The values of the vector.
+    :param int32: If True, the values are int32. If False, the values are float32.
+
+    :return: The offset of the vector.
+    """
+
+    builder.StartVector(4, len(values), 4)
+    for v in reversed(values.tolist()):
+        if int32:
+            builder.PrependInt32(v)
+        else:
+            builder.PrependFloat32(v)
+    return builder.EndVector(len(values))
+
+
+def get_obi_particles(num_actors: int, num_particles: int) -> bytes:
+    """
+    :param num_actors: The number of actors (fluid emitters) in the solver.
+    :param num_particles: The number of active particles per actor. Each actor has 25% more inactive particles.
+
+    :return: Synthetic `ObiParticles` output data.
+    """
+
+    rng = np.random.RandomState(0)
+    capacity = num_particles + num_particles // 4
+    solver_indices = rng.permutation(num_actors * capacity).astype(np.int32)
+    builder = Builder(0)
+    positions = vector(builder, rng.uniform(-1, 1, size=num_actors * capacity * 4).astype(np.float32), int32=False)
+    velocities = vector(builder, rng.uniform(-1, 1, size=num_actors * capacity * 4).astype(np.float32), int32=False)
+    ObiS.ObiSolverDataStart(builder)
+    ObiS.ObiSolverDataAddId(builder, 0)
+    ObiS.ObiSolverDataAddPositions(builder, positions)
+    ObiS.ObiSolverDataAddVelocities(builder, velocities)
+    solver = ObiS.ObiSolverDataEnd(builder)
+    actors: List[int] = list()
+    for i in range(num_actors):
+        indices = vector(builder, solver_indices[i * capacity: (i + 1) * capacity], int32=True)
+        ObiA.ObiActorDataStart(builder)
+        ObiA.ObiActorDataAddId(builder, i)
+        ObiA.ObiActorDataAddSolverId(builder, 0)
+        ObiA.ObiActorDataAddCount(builder, num_particles)
+        ObiA.ObiActorDataAddSolverIndices(builder, indices)
+        actors.append(ObiA.ObiActorDataEnd(builder))
+    ObiP.ObiParticlesStartSolversVector(builder, 1)
+    builder.PrependUOffsetTRelative(solver)
+    solvers = builder.EndVector(1)
+    ObiP.ObiParticlesStartActorsVector(builder, num_actors)
+    for actor in reversed(actors):
+        builder.PrependUOffsetTRelative(actor)
+    actors_vector = builder.EndVector(num_actors)
+    ObiP.ObiParticlesStart(builder)
+    ObiP.ObiParticlesAddSolvers(builder, solvers)
+    ObiP.ObiParticlesAddActors(builder, actors_vector)
+    builder.Finish(ObiP.ObiParticlesEnd(builder))
+    b = bytes(builder.Output())
+    # Insert the output data ID after the root offset.
+    return pack("<I", unpack("<I", b[:4])[0] + 4) + b"obip" + b[4:]
+
+
+def per_actor(resp: List[bytes], num_frames: int) -> float:
+    """
+    Parse the particle data the way that the `Obi` add-on did in TDW v1.10.0: per actor, copy the solver's particle data and then delete the 4th column.
+
+    :param resp: The response from the build.
+    :param num_frames: The number of frames.
+
+    :return: Particles per second.
+    """
+
+    num_particles = 0
+    t0 = time()
+    for i in range(num_frames):
+        obi_particles = ObiParticles(resp[0])
+        for j in range(obi_particles.get_num_objects()):
+            solver_indices = obi_particles.get_solver_indices(j)[:obi_particles.get_count(j)]
+            solver_id = obi_particles.get_solver_id(j)
+            positions = np.delete(np.take(obi_particles.get_positions(solver_id).reshape(-1, 4),
+                                          solver_indices, axis=0).reshape(-1, 4), 3, 1)
+            velocities = np.delete(np.take(obi_particles.get_velocities(solver_id).reshape(-1, 4),
+                                           solver_indices, axis=0).reshape(-1, 4), 3, 1)
+            num_particles += len(positions)
+    return num_particles / (time() - t0)
+
+
+def obi(resp: List[bytes], num_frames: int) -> float:
+    """
+    :param resp: The response from the build.
+    :param num_frames: The number of frames.
+
+    :return: Particles per second.
+    """
+
+    o = Obi()
+    # Initialize the add-on.
+    o.on_send(resp=resp)
+    num_particles = 0
+    t0 = time()
+    for i in range(num_frames):
+        o.on_send(resp=resp)
+        num_particles += sum([len(actor.positions) for actor in o.actors.values()])
+    return num_particles / (time() - t0)
+
+
+if __name__ == "__main__":
+    print("| Actors | Particles per actor | v1.10.0 (particles per second) | Particles per second |\n| --- | --- | --- | --- |")
+    for a, p in [(1, 10000), (8, 2000), (32, 500)]:
+        r = [get_obi_particles(num_actors=a, num_particles=p), (0).to_bytes(4, byteorder="big")]
+        print(f"| {a} | {p} | {round(per_actor(resp=r, num_frames=500))} | {round(obi(resp=r, num_frames=500))} |")
@@ -0,0 +1,65 @@
+from time import time
+import json
+import numpy as np
+from tdw.controller import Controller
+from tdw.librarian import ModelLibrarian
+from tdw.physics_audio.object_audio_static import DEFAULT_OBJECT_AUDIO_STATIC_DATA
+
+
+"""
+Benchmark the speed of generating and serializing commands to add many objects.
+This doesn't require a build.
+"""
+
+if __name__ == "__main__":
+    num_objects = 5000
+    num_trials = 5
+    rng = np.random.RandomState(0)
+    # Get models that have default physics values.
+    model_names = [r.name for r in ModelLibrarian("models_core.json").records if
+                   not r.do_not_use and r.name in DEFAULT_OBJECT_AUDIO_STATIC_DATA]
+    model_names = [model_names[i] for i in rng.randint(0, len(model_names), num_objects)]
+    object_ids = list(range(num_objects))
+    positions = rng.uniform(-5, 5, size=(num_objects, 3))
+    rotations = rng.uniform(0, 360, size=(num_objects, 3))
+    position_dicts = [{"x": p[0], "y": p[1], "z": p[2]} for p in positions.tolist()]
+    rotation_dicts = [{"x": r[0], "y": r[1], "z": r[2]} for r in rotations.tolist()]
+    # Load the library before timing anything.
+    Controller.get_add_object(model_names[0], object_id=0)
+
+    output = "| Function | Commands (seconds) | Commands + JSON (seconds) |\n| --- | --- | --- |\n"
+    for name, get_commands in zip(["`get_add_object()`",
+                                   "`get_add_objects()`",
+                                   "`get_add_physics_object()`",
+                                   "`get_add_physics_objects()`"],
+                                  [lambda: [Controller.get_add_object(model_name=model_names[i],
+                                                                      object_id=object_ids[i],
+                                                                      position=position_dicts[i],
+                                                                      rotation=rotation_dicts[i])
+                                            for i in range(num_objects)],
+                                   lambda: Controller.get_add_objects(model_names=model_names,
+                                                                      object_ids=object_ids,
+                                                                      positions=positions,
+                                                                      rotations=rotations),
+                                   lambda: [c for i in range(num_objects) for c in
+                                            Controller.get_add_physics_object(model_name=model_names[i],
+                                                                              object_id=object_ids[i],
+                                                                              position=position_dicts[i],
+                                                                              rotation=rotation_dicts[i])],
+                                   lambda: Controller.get_add_physics_objects(model_names=model_names,
+                                                                              object_ids=object_ids,
+                                                                              positions=positions,
+                                                                              rotations=rotations)]):
+        t_commands = 0
+        t_total = 0
+        for i in range(num_trials):
+            t0 = time()
+            commands = get_commands()
+            t1 = time()
+            json.dumps(commands).encode("utf-8")
+            t2 = time()
+            t_commands += t1 - t0
+            t_total += t2 - t0
+        output += f"| {name} | {round(t_commands / num_trials, 4)} | {round(t_total / num_trials, 4)} |\n"
+    print(f"{num_objects} objects:\n")
+    print(output)
@@ -0,0 +1,74 @@
+from time import time
+from multiprocessing import Process
+import zmq
+from tdw.controller import Controller
+
+
+"""
+Benchmark the speed of TCP and IPC transport between the controller and a peer on the same machine.
+This doesn't require a build. A stand-in peer process responds to each message with synthetic output data that is the same size as an `Images` output data object.
+"""
+
+
+def peer(endpoint: str, size: int) -> None:
+    """
+    A stand-in for the build.
+
+    :param endpoint: The socket endpoint.
+    :param size: The size of the synthetic output data in bytes.
+    """
+
+    context = zmq.Context()
+    # noinspection PyUnresolvedReferences
+    socket = context.socket(zmq.REQ)
+    socket.connect(endpoint)
+    # The first message. This is always sent by the build.
+    socket.send(b"0")
+    # The output data ID is at bytes 4-8.
+    images = b"\x00\x00\x00\x00imag" + bytes(size - 8)
+    frame = 0
+    while True:
+        commands = socket.recv_multipart()
+        socket.send_multipart([images, frame.to_bytes(4, byteorder="big")])
+        frame += 1
+        if b'"terminate"' in commands[0]:
+            break
+    socket.close()
+    context.term()
+
+
+def transport(ipc: bool, port: int, size: int, num_frames: int) -> float:
+    """
+    :param ipc: If True, the peer connects via IPC. If False, the peer connects via TCP.
+    :param port: The socket port.
+    :param size: The size of the synthetic output data in bytes.
+    :param num_frames: The number of frames.
+
+    :return: Frames per second.
+    """
+
+    endpoint = Controller.get_ipc_endpoint(port=port) if ipc else f"tcp://localhost:{port}"
+    p = Process(target=peer, args=(endpoint, size))
+    p.start()
+    c = Controller(port=port, check_version=False, launch_build=False, ipc=ipc)
+    t0 = time()
+    for i in range(num_frames):
+        c.communicate([])
+    fps = num_frames / (time() - t0)
+    c.communicate({"$type": "terminate"})
+    c.socket.close()
+    p.join()
+    return fps
+
+
+if __name__ == "__main__":
+    print("| Output data size | TCP (FPS) | IPC (FPS) |\n| --- | --- | --- |")
+    port = 1071
+    for width in [256, 512, 1024]:
+        # An RGB image.
+        size = width * width * 3
+        fps = list()
+        for ipc in [False, True]:
+            fps.append(transport(ipc=ipc, port=port, size=size, num_frames=500))
+            port += 1
+        print(f"| {width}x{width} RGB ({round(size / 1000)} KB) | {round(fps[0])} | {round(fps[1])} |")
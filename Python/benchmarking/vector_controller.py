@@ -0,0 +1,115 @@
+from time import time, sleep
+from multiprocessing import Process
+from typing import List
+import zmq
+from tdw.controller import Controller
+from tdw.vector_controller import VectorController
+
+
+"""
+Benchmark the speed of stepping many builds with a `VectorController` compared to calling `communicate()` per controller.
+This doesn't require a build. Each stand-in peer process waits for a fixed amount of time per frame, as if it were simulating the frame, and then responds with synthetic output data.
+"""
+
+
+def peer(port: int, step_time: float) -> None:
+    """
+    A stand-in for the build.
+
+    :param port: The socket port.
+    :param step_time: The time in seconds that the peer waits per frame.
+    """
+
+    context = zmq.Context()
+    # noinspection PyUnresolvedReferences
+    socket = context.socket(zmq.REQ)
+    socket.connect(f"tcp://localhost:{port}")
+    # The first message. This is always sent by the build.
+    socket.send(b"0")
+    # The output data ID is at bytes 4-8. The port is included so that the controller can verify the response.
+    data = b"\x00\x00\x00\x00test" + port.to_bytes(4, byteorder="big")
+    frame = 0
+    while True:
+        commands = socket.recv_multipart()
+        sleep(step_time)
+        socket.send_multipart([data, frame.to_bytes(4, byteorder="big")])
+        frame += 1
+        if b'"terminate"' in commands[0]:
+            break
+    socket.close()
+    context.term()
+
+
+def start_peers(ports: List[int], step_time: float) -> List[Process]:
+    """
+    :param ports: The socket ports.
+    :param step_time: The time in seconds that each peer waits per frame.
+
+    :return: The peer processes.
+    """
+
+    processes = [Process(target=peer, args=(port, step_time)) for port in ports]
+    for p in processes:
+        p.start()
+    return processes
+
+
+def sequential(ports: List[int], step_time: float, num_frames: int) -> float:
+    """
+    :param ports: The socket ports.
+    :param step_time: The time in seconds that each peer waits per frame.
+    :param num_frames: The number of frames.
+
+    :return: Frames per second. Each frame is a step of every build.
+    """
+
+    processes = start_peers(ports=ports, step_time=step_time)
+    controllers = [Controller(port=port, check_version=False, launch_build=False) for port in ports]
+    t0 = time()
+    for i in range(num_frames):
+        for c in controllers:
+            c.communicate([])
+    fps = num_frames / (time() - t0)
+    for c in controllers:
+        c.communicate({"$type": "terminate"})
+        c.socket.close()
+    for p in processes:
+        p.join()
+    return fps
+
+
+def vectorized(ports: List[int], step_time: float, num_frames: int) -> float:
+    """
+    :param ports: The socket ports.
+    :param step_time: The time in seconds that each peer waits per frame.
+    :param num_frames: The number of frames.
+
+    :return: Frames per second. Each frame is a step of every build.
+    """
+
+    processes = start_peers(ports=ports, step_time=step_time)
+    c = VectorController(ports=ports, check_version=False, launch_build=False)
+    t0 = time()
+    for i in range(num_frames):
+        resp = c.communicate([[] for _ in range(len(ports))])
+        # Verify that each response is from the correct peer.
+        for port, r in zip(ports, resp):
+            assert int.from_bytes(r[0][8:12], byteorder="big") == port
+    fps = num_frames / (time() - t0)
+    c.communicate([{"$type": "terminate"} for _ in range(len(ports))])
+    c.close()
+    for p in processes:
+        p.join()
+    return fps
+
+
+if __name__ == "__main__":
+    print("| Builds | Step time (ms) | Sequential (FPS) | VectorController (FPS) |\n| --- | --- | --- | --- |")
+    port = 1071
+    for num_builds in [2, 4, 8]:
+        for step in [0.005, 0.02]:
+            fps = list()
+            for f in [sequential, vectorized]:
+                fps.append(f(ports=list(range(port, port + num_builds)), step_time=step, num_frames=100))
+                port += num_builds
+            print(f"| {num_builds} | {round(step * 1000)} | {round(fps[0])} | {round(fps[1])} |")
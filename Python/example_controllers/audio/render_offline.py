@@ -0,0 +1,38 @@
+from tdw.controller import Controller
+from tdw.tdw_utils import TDWUtils
+from tdw.add_ons.py_impact_recorder import PyImpactRecorder
+from tdw.physics_audio.py_impact_renderer import PyImpactRenderer
+from tdw.physics_audio.audio_material import AudioMaterial
+from tdw.backend.paths import EXAMPLE_CONTROLLER_OUTPUT_PATH
+
+"""
+Record a physics simulation once and then render its PyImpact audio offline with different floor materials.
+"""
+
+if __name__ == "__main__":
+    output_directory = EXAMPLE_CONTROLLER_OUTPUT_PATH.joinpath("render_offline")
+    print(f"Audio will be saved to: {output_directory}")
+    recording = output_directory.joinpath("recording.gz")
+    # Record the physics simulation.
+    c = Controller()
+    recorder = PyImpactRecorder()
+    c.add_ons.append(recorder)
+    commands = [TDWUtils.create_empty_room(12, 12)]
+    commands.extend(c.get_add_physics_object(model_name="vase_02",
+                                             object_id=0,
+                                             position={"x": 0, "y": 3, "z": 0}))
+    commands.extend(c.get_add_physics_object(model_name="rh10",
+                                             object_id=1,
+                                             position={"x": 0.5, "y": 2, "z": 0.2}))
+    c.communicate(commands)
+    recorder.start(path=recording)
+    for i in range(300):
+        c.communicate([])
+    recorder.stop()
+    c.communicate({"$type": "terminate"})
+    # Render the audio with different floor materials. This doesn't require a build.
+    floors = [AudioMaterial.wood_medium, AudioMaterial.stone, AudioMaterial.metal, AudioMaterial.glass]
+    renderer = PyImpactRenderer()
+    renderer.render(recordings=[recording for _ in floors],
+                    output_paths=[output_directory.joinpath(f"{floor.name}.wav") for floor in floors],
+                    parameters=[{"floor": floor} for floor in floors])
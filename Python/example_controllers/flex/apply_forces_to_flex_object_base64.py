@@ -1,3 +1,4 @@
+import numpy as np
 from tdw.controller import Controller
 from tdw.tdw_utils import TDWUtils
 from tdw.add_ons.third_person_camera import ThirdPersonCamera
@@ -35,7 +36,7 @@ resp = c.communicate([TDWUtils.create_empty_room(12, 12),
                       {"$type": "send_flex_particles",
                        "frequency": "once"}])
 # The forces and IDs, arranged as: [f0_x, f0_y, f0_z, id0, f1_x, f1_y, f1_z, id1 ... ]
-particle_forces_and_ids = []
+forces_and_ids = b""
 for i in range(len(resp) - 1):
     r_id = OutputData.get_data_type_id(resp[i])
     if r_id == "flex":
@@ -44,17 +45,12 @@ for i in range(len(resp) - 1):
         for j in range(flex_particles.get_num_objects()):
             if flex_particles.get_id(j) == cube_id:
                 particles = flex_particles.get_particles(j)
-                # Iterate through the particles. The ID is the index.
-                for particle_id in range(len(particles)):
-                    # Get the y value of the particle.
-                    if particles[particle_id][1] > 0.75:
-                        # Apply a force to this particle.
-                        particle_forces_and_ids.extend([10, 0, 0, particle_id])
-# Encode the force.
-force_string = TDWUtils.get_base64_flex_particle_forces(forces=particle_forces_and_ids)
+                # Apply a force to each particle with a y value greater than 0.75. The ID is the index.
+                forces_and_ids = TDWUtils.get_flex_particle_forces(forces=np.array([10, 0, 0]),
+                                                                   mask=particles[:, 1] > 0.75)
 # Apply the force.
 c.communicate({"$type": "apply_forces_to_flex_object_base64",
-               "forces_and_ids_base64": force_string,
+               "forces_and_ids_base64": forces_and_ids,
                "id": cube_id})
 for i in range(200):
     c.communicate([])
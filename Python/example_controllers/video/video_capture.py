@@ -0,0 +1,30 @@
+from tdw.controller import Controller
+from tdw.tdw_utils import TDWUtils
+from tdw.add_ons.third_person_camera import ThirdPersonCamera
+from tdw.add_ons.video_capture import VideoCapture
+from tdw.backend.paths import EXAMPLE_CONTROLLER_OUTPUT_PATH
+
+"""
+Encode images to a video with ffmpeg while the simulation is running.
+"""
+
+c = Controller()
+camera = ThirdPersonCamera(position={"x": 2, "y": 1.6, "z": -1},
+                           look_at={"x": 0, "y": 0, "z": 0},
+                           avatar_id="a")
+c.add_ons.append(camera)
+path = EXAMPLE_CONTROLLER_OUTPUT_PATH.joinpath("video_capture")
+video = VideoCapture(path=path, avatar_ids=["a"], framerate=60)
+c.add_ons.append(video)
+print(f"The video will be saved to: {video.get_video_path(avatar_id='a').resolve()}")
+c.communicate([TDWUtils.create_empty_room(12, 12),
+               {"$type": "set_target_framerate",
+                "framerate": 60},
+               c.get_add_object(model_name="iron_box",
+                                position={"x": 1, "y": 3, "z": -0.5},
+                                object_id=c.get_unique_id())])
+for i in range(100):
+    c.communicate([])
+# Finish the video.
+video.stop()
+c.communicate({"$type": "terminate"})
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from base64 import b64encode
 from typing import List, Union, Dict
 from pathlib import Path
 import wave
@@ -82,7 +81,7 @@ class AudioInitializerBase(AddOn, ABC):
                               "num_frames": len(wav),
                               "num_channels": CHANNELS,
                               "frame_rate": SAMPLE_RATE,
-                              "wav_data": str(b64encode(wav), 'ascii', 'ignore')})
+                              "wav_data": wav})
         if object_id is not None:
             self.commands.append({"$type": "parent_audio_source_to_object",
                                   "object_id": object_id,
@@ -1,4 +1,5 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import numpy as np
 from tdw.add_ons.add_on import AddOn
 from tdw.object_data.composite_object.composite_object_static import CompositeObjectStatic
 from tdw.object_data.composite_object.composite_object_dynamic import CompositeObjectDynamic
@@ -11,6 +12,8 @@ class CompositeObjectManager(AddOn):
     """
     Manager add-on for static and dynamic composite object data.
 
+    Dynamic data is stored per-frame in numpy arrays: `hinge_angles`, `light_is_on`, etc. To query many sub-objects at once, it is much faster to use these arrays or functions such as `get_open()` than to iterate through `dynamic`.
+
     Note that some useful information, such as the positions, rotations, names, of the objects, is not included here. See: [`ObjectManager`](object_manager.md).
     """
 
@@ -25,9 +28,46 @@ class CompositeObjectManager(AddOn):
         """
         self.static: Dict[int, CompositeObjectStatic] = dict()
         """:field
-        A dictionary of [`CompositeObjectDynamic`](../object_data/composite_object/composite_object_dynamic.md) data that is set per-frame. Key = The object ID.
+        The ID of the root object of each hinge, motor, and spring as a numpy array. The order of this array is the same as `hinge_ids`, `hinge_angles`, and `hinge_velocities`.
+        """
+        self.hinge_parent_ids: np.array = np.zeros(shape=0, dtype=np.int32)
+        """:field
+        The ID of each hinge, motor, and spring as a numpy array.
+        """
+        self.hinge_ids: np.array = np.zeros(shape=0, dtype=np.int32)
+        """:field
+        The angle in degrees of each hinge, motor, and spring relative to its resting position as a numpy array. This is updated per-frame.
+        """
+        self.hinge_angles: np.array = np.zeros(shape=0, dtype=np.float32)
+        """:field
+        The angular velocity in degrees per second of each hinge, motor, and spring as a numpy array. This is updated per-frame.
+        """
+        self.hinge_velocities: np.array = np.zeros(shape=0, dtype=np.float32)
+        """:field
+        The ID of the root object of each light as a numpy array. The order of this array is the same as `light_ids` and `light_is_on`.
+        """
+        self.light_parent_ids: np.array = np.zeros(shape=0, dtype=np.int32)
+        """:field
+        The ID of each light as a numpy array.
+        """
+        self.light_ids: np.array = np.zeros(shape=0, dtype=np.int32)
+        """:field
+        A boolean numpy array. If True, the corresponding light is on. This is updated per-frame.
         """
-        self.dynamic: Dict[int, CompositeObjectDynamic] = dict()
+        self.light_is_on: np.array = np.zeros(shape=0, dtype=bool)
+        # The dynamic data as objects. This is created only when `self.dynamic` is accessed.
+        self._dynamic: Dict[int, CompositeObjectDynamic] = dict()
+        # If True, `self._dynamic` is out of date.
+        self._dynamic_is_dirty: bool = False
+        # The parent IDs and sub-object IDs of the hinges and lights on the previous frame.
+        # If these don't change, the indices below don't need to be rebuilt.
+        self._hinge_layout: np.array = np.zeros(shape=(0, 2), dtype=np.int32)
+        self._light_layout: np.array = np.zeros(shape=(0, 2), dtype=np.int32)
+        # Key = Tuple: The root object ID and the sub-object ID. Value = The index in the hinge arrays.
+        self._hinge_indices: Dict[Tuple[int, int], int] = dict()
+        # Key = The root object ID. Value = The indices of its hinges or lights.
+        self._hinge_groups: Dict[int, np.array] = dict()
+        self._light_groups: Dict[int, np.array] = dict()
 
     def get_initialization_commands(self) -> List[dict]:
         return [{"$type": "send_static_composite_objects"},
@@ -35,41 +75,61 @@ class CompositeObjectManager(AddOn):
                  "frequency": "always"}]
 
     def on_send(self, resp: List[bytes]) -> None:
-        self.dynamic.clear()
+        got_dynamic = False
         for i in range(len(resp) - 1):
             r_id = OutputData.get_data_type_id(resp[i])
             # Cache static data.
             if r_id == "scom":
                 static_composite_objects = StaticCompositeObjects(resp[i])
                 for j in range(static_composite_objects.get_num()):
+                    # Static data doesn't change, so only new objects need to be added.
+                    if static_composite_objects.get_object_id(j) in self.static:
+                        continue
                     o = CompositeObjectStatic(static_composite_objects=static_composite_objects, object_index=j)
                     self.static[o.object_id] = o
             elif r_id == "dcom":
+                got_dynamic = True
                 dynamic_composite_objects = DynamicCompositeObjects(resp[i])
-                # Hinges and lights per parent object.
-                hinges: Dict[int, List[HingeDynamic]] = dict()
-                lights: Dict[int, List[LightDynamic]] = dict()
-                for j in range(dynamic_composite_objects.get_num_hinges()):
-                    object_id = dynamic_composite_objects.get_hinge_parent_id(j)
-                    if object_id not in hinges:
-                        hinges[object_id] = list()
-                    hinges[object_id].append(HingeDynamic(sub_object_id=dynamic_composite_objects.get_hinge_id(j),
-                                                          angle=dynamic_composite_objects.get_hinge_angle(j),
-                                                          velocity=dynamic_composite_objects.get_hinge_velocity(j)))
-                for j in range(dynamic_composite_objects.get_num_lights()):
-                    object_id = dynamic_composite_objects.get_light_parent_id(j)
-                    if object_id not in lights:
-                        lights[object_id] = list()
-                    lights[object_id].append(LightDynamic(sub_object_id=dynamic_composite_objects.get_light_id(j),
-                                                          is_on=dynamic_composite_objects.get_light_is_on(j)))
-                object_ids = list(hinges.keys())
-                object_ids.extend(list(lights.keys()))
-                object_ids = list(sorted(set(object_ids)))
-                for object_id in object_ids:
-                    o = CompositeObjectDynamic(object_id=object_id,
-                                               hinges={hinge.sub_object_id: hinge for hinge in hinges[object_id]} if object_id in hinges else {},
-                                               lights={light.sub_object_id: light for light in lights[object_id]} if object_id in lights else {})
-                    self.dynamic[o.object_id] = o
+                self._set_hinges(hinge_ids=dynamic_composite_objects.get_hinge_ids(),
+                                 hinges=dynamic_composite_objects.get_hinges())
+                self._set_lights(light_ids=dynamic_composite_objects.get_light_ids(),
+                                 lights=dynamic_composite_objects.get_lights())
+        # There is no dynamic data on this frame.
+        if not got_dynamic:
+            self._set_hinges(hinge_ids=np.zeros(shape=(0, 2), dtype=np.int32),
+                             hinges=np.zeros(shape=(0, 2), dtype=np.float32))
+            self._set_lights(light_ids=np.zeros(shape=(0, 2), dtype=np.int32),
+                             lights=np.zeros(shape=0, dtype=bool))
+        self._dynamic_is_dirty = True
+
+    @property
+    def dynamic(self) -> Dict[int, CompositeObjectDynamic]:
+        """
+        :return: A dictionary of [`CompositeObjectDynamic`](../object_data/composite_object/composite_object_dynamic.md) data that is set per-frame. Key = The object ID. This is created from `hinge_angles`, `light_is_on`, etc. the first time that it is accessed per frame.
+        """
+
+        if self._dynamic_is_dirty:
+            self._dynamic.clear()
+            hinge_ids = self.hinge_ids.tolist()
+            hinge_angles = self.hinge_angles.tolist()
+            hinge_velocities = self.hinge_velocities.tolist()
+            light_ids = self.light_ids.tolist()
+            light_is_on = self.light_is_on.tolist()
+            for object_id in sorted(set(self._hinge_groups.keys()) | set(self._light_groups.keys())):
+                hinges: Dict[int, HingeDynamic] = dict()
+                if object_id in self._hinge_groups:
+                    for j in self._hinge_groups[object_id].tolist():
+                        hinges[hinge_ids[j]] = HingeDynamic(sub_object_id=hinge_ids[j],
+                                                            angle=hinge_angles[j],
+                                                            velocity=hinge_velocities[j])
+                lights: Dict[int, LightDynamic] = dict()
+                if object_id in self._light_groups:
+                    for j in self._light_groups[object_id].tolist():
+                        lights[light_ids[j]] = LightDynamic(sub_object_id=light_ids[j],
+                                                            is_on=light_is_on[j])
+                self._dynamic[object_id] = CompositeObjectDynamic(object_id=object_id, hinges=hinges, lights=lights)
+            self._dynamic_is_dirty = False
+        return self._dynamic
 
     def is_open(self, object_id: int, sub_object_id: int, open_at: float = 30) -> bool:
         """
@@ -80,7 +140,45 @@ class CompositeObjectManager(AddOn):
         :return: True if the hinge, motor, or spring is open.
         """
 
-        return self.dynamic[object_id].hinges[sub_object_id].angle >= open_at
+        return bool(self.hinge_angles[self._hinge_indices[(object_id, sub_object_id)]] >= open_at)
+
+    def get_open(self, open_at: float = 30, object_id: int = None) -> np.array:
+        """
+        :param open_at: A threshold of 'openness' in degrees. If a sub-object's angle is greater than or equal to this, it is considered 'open'.
+        :param object_id: If not None, only include the hinges, motors, and springs of this root object.
+
+        :return: A numpy array of the IDs of each open hinge, motor, and spring.
+        """
+
+        if object_id is None:
+            return self.hinge_ids[self.hinge_angles >= open_at]
+        elif object_id not in self._hinge_groups:
+            return np.zeros(shape=0, dtype=np.int32)
+        indices = self._hinge_groups[object_id]
+        return self.hinge_ids[indices][self.hinge_angles[indices] >= open_at]
+
+    def get_open_objects(self, open_at: float = 30) -> np.array:
+        """
+        :param open_at: A threshold of 'openness' in degrees. If a sub-object's angle is greater than or equal to this, it is considered 'open'.
+
+        :return: A numpy array of the IDs of each root object that has at least one open hinge, motor, or spring.
+        """
+
+        return np.unique(self.hinge_parent_ids[self.hinge_angles >= open_at])
+
+    def get_lights_on(self, object_id: int = None) -> np.array:
+        """
+        :param object_id: If not None, only include the lights of this root object.
+
+        :return: A numpy array of the IDs of each light that is on.
+        """
+
+        if object_id is None:
+            return self.light_ids[self.light_is_on]
+        elif object_id not in self._light_groups:
+            return np.zeros(shape=0, dtype=np.int32)
+        indices = self._light_groups[object_id]
+        return self.light_ids[indices][self.light_is_on[indices]]
 
     def reset(self) -> None:
         """
@@ -89,4 +187,59 @@ class CompositeObjectManager(AddOn):
 
         self.initialized = False
         self.static.clear()
-        self.dynamic.clear()
+        self._set_hinges(hinge_ids=np.zeros(shape=(0, 2), dtype=np.int32),
+                         hinges=np.zeros(shape=(0, 2), dtype=np.float32))
+        self._set_lights(light_ids=np.zeros(shape=(0, 2), dtype=np.int32),
+                         lights=np.zeros(shape=0, dtype=bool))
+        self._dynamic.clear()
+        self._dynamic_is_dirty = False
+
+    def _set_hinges(self, hinge_ids: np.array, hinges: np.array) -> None:
+        """
+        Set the hinge arrays.
+
+        :param hinge_ids: The parent ID and ID of each hinge as an array of shape `(n, 2)`.
+        :param hinges: The angle and velocity of each hinge as an array of shape `(n, 2)`.
+        """
+
+        # Rebuild the indices only if hinges were added or removed.
+        if not np.array_equal(hinge_ids, self._hinge_layout):
+            self._hinge_layout = np.array(hinge_ids, dtype=np.int32)
+            self.hinge_parent_ids = self._hinge_layout[:, 0].copy()
+            self.hinge_ids = self._hinge_layout[:, 1].copy()
+            self._hinge_indices = {(object_id, sub_object_id): j for j, (object_id, sub_object_id) in
+                                   enumerate(self._hinge_layout.tolist())}
+            self._hinge_groups = CompositeObjectManager._get_groups(self.hinge_parent_ids)
+        self.hinge_angles = np.array(hinges[:, 0], dtype=np.float32)
+        self.hinge_velocities = np.array(hinges[:, 1], dtype=np.float32)
+
+    def _set_lights(self, light_ids: np.array, lights: np.array) -> None:
+        """
+        Set the light arrays.
+
+        :param light_ids: The parent ID and ID of each light as an array of shape `(n, 2)`.
+        :param lights: Whether each light is on as an array of shape `(n,)`.
+        """
+
+        # Rebuild the indices only if lights were added or removed.
+        if not np.array_equal(light_ids, self._light_layout):
+            self._light_layout = np.array(light_ids, dtype=np.int32)
+            self.light_parent_ids = self._light_layout[:, 0].copy()
+            self.light_ids = self._light_layout[:, 1].copy()
+            self._light_groups = CompositeObjectManager._get_groups(self.light_parent_ids)
+        self.light_is_on = np.array(lights, dtype=bool)
+
+    @staticmethod
+    def _get_groups(parent_ids: np.array) -> Dict[int, np.array]:
+        """
+        :param parent_ids: The root object ID of each sub-object.
+
+        :return: The indices of the sub-objects of each root object, in the same order as `parent_ids`. Key = The root object ID.
+        """
+
+        if len(parent_ids) == 0:
+            return dict()
+        # A stable sort keeps each root object's sub-objects in the order of the output data.
+        order = np.argsort(parent_ids, kind="stable")
+        object_ids, starts = np.unique(parent_ids[order], return_index=True)
+        return {object_id: indices for object_id, indices in zip(object_ids.tolist(), np.split(order, starts[1:]))}
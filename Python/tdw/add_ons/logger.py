@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import List, Union
 from json import load, dump
+from base64 import b64encode
 from tdw.output_data import OutputData, LogMessage
 from tdw.add_ons.add_on import AddOn
 
@@ -92,7 +93,7 @@ class Logger(AddOn):
         """
 
         with self._path.open("wt", encoding="utf-8") as f:
-            dump(self.playback, f)
+            dump(self.playback, f, default=Logger._get_base64)
 
     def reset(self, path: Union[str, Path]) -> None:
         """
@@ -119,3 +120,15 @@ class Logger(AddOn):
         else:
             with self._path.open("rt", encoding="utf-8") as f:
                 self.playback = load(f)
+
+    @staticmethod
+    def _get_base64(o) -> str:
+        """
+        :param o: A value in a command that can't be serialized to JSON.
+
+        :return: If `o` is `bytes` (for example, audio data), a base64 string. This is how `Controller` sends `bytes` to the build.
+        """
+
+        if isinstance(o, bytes):
+            return b64encode(o).decode("utf-8")
+        raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
@@ -0,0 +1,245 @@
+from hashlib import sha256
+from pathlib import Path
+from uuid import uuid4
+from typing import List, Dict, Tuple, Union, Optional
+import numpy as np
+from tdw.controller import Controller
+from tdw.output_data import OutputData, Meshes
+from tdw.add_ons.add_on import AddOn
+from tdw.add_ons.object_manager import ObjectManager
+from tdw.quaternion_utils import QuaternionUtils
+from tdw.backend.paths import CACHE_DIR
+
+
+class MeshCache(AddOn):
+    """
+    Cache the mesh geometry of models on disk and get the geometry of objects in the scene without requesting [`Meshes`](../../api/output_data.md#Meshes) output data.
+
+    Meshes of the same model never change, so this add-on requests `Meshes` output data only the first time that a model is added to the scene. The vertices and triangles are saved to disk, keyed by the model name and the URL of its asset bundle, and are reused in later frames, scenes, and controllers.
+
+    This add-on watches for `add_object`, `scale_object`, `scale_object_and_mass`, and `destroy_object` commands. When an object is added, `send_meshes` is added to the same frame's commands if the model's mesh isn't cached. The model must have a readable mesh (`record.flex == True`). Objects with non-readable meshes are ignored.
+
+    The build sends vertices in the object's local space. `get_mesh()` scales them by the object's scale and, if an [`ObjectManager`](object_manager.md) is set, transforms them to world space.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.tdw_utils import TDWUtils
+    from tdw.add_ons.object_manager import ObjectManager
+    from tdw.add_ons.mesh_cache import MeshCache
+
+    c = Controller()
+    object_manager = ObjectManager()
+    mesh_cache = MeshCache(object_manager=object_manager)
+    c.add_ons.extend([object_manager, mesh_cache])
+    object_id = c.get_unique_id()
+    c.communicate([TDWUtils.create_empty_room(12, 12),
+                   c.get_add_object(model_name="cube",
+                                    library="models_flex.json",
+                                    object_id=object_id)])
+    vertices, triangles = mesh_cache.get_mesh(object_id=object_id)
+    print(vertices.shape, triangles.shape)
+    c.communicate({"$type": "terminate"})
+    ```
+    """
+
+    """:class_var
+    The default directory of the cache.
+    """
+    DEFAULT_DIRECTORY: Path = CACHE_DIR.joinpath("mesh_cache")
+
+    def __init__(self, object_manager: ObjectManager = None, directory: Union[str, Path] = None):
+        """
+        :param object_manager: An [`ObjectManager`](object_manager.md). If not None, `get_mesh()` transforms the vertices to world space using `object_manager.transforms`. This `ObjectManager` must also be added to `c.add_ons`.
+        :param directory: The directory of the cache. If None, defaults to `MeshCache.DEFAULT_DIRECTORY`.
+        """
+
+        super().__init__()
+        """:field
+        The directory of the cache.
+        """
+        self.directory: Path = MeshCache.DEFAULT_DIRECTORY if directory is None else Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        """:field
+        The local, unscaled vertices and the triangles of each model that has been loaded from the cache. Key = The cache key (see `MeshCache.get_key()`). Value = Tuple: The vertices and the triangles.
+        """
+        self.meshes: Dict[str, Tuple[np.array, np.array]] = dict()
+        self._object_manager: Optional[ObjectManager] = object_manager
+        # The cache key of each object. Key = The object ID.
+        self._keys: Dict[int, str] = dict()
+        # The scale of each object. Key = The object ID.
+        self._scales: Dict[int, np.array] = dict()
+        # Objects whose meshes have been requested. Key = The object ID. Value = The cache key.
+        self._requested: Dict[int, str] = dict()
+
+    def get_initialization_commands(self) -> List[dict]:
+        return []
+
+    def before_send(self, commands: List[dict]) -> None:
+        object_ids: List[int] = list()
+        for command in commands:
+            if command["$type"] == "add_object":
+                object_id: int = command["id"]
+                key = MeshCache.get_key(model_name=command["name"], url=command["url"])
+                self._keys[object_id] = key
+                self._scales[object_id] = np.full(3, command["scale_factor"] if "scale_factor" in command else 1,
+                                                  dtype=np.float32)
+                # Request the mesh if it isn't cached.
+                if not self._has_key(key) and key not in self._requested.values() and \
+                        MeshCache._is_readable(model_name=command["name"]):
+                    object_ids.append(object_id)
+                    self._requested[object_id] = key
+            elif command["$type"] == "scale_object" or command["$type"] == "scale_object_and_mass":
+                object_id = command["id"]
+                if object_id in self._scales and "scale_factor" in command:
+                    self._scales[object_id] = self._scales[object_id] * np.array([command["scale_factor"]["x"],
+                                                                                  command["scale_factor"]["y"],
+                                                                                  command["scale_factor"]["z"]],
+                                                                                 dtype=np.float32)
+            elif command["$type"] == "destroy_object":
+                object_id = command["id"]
+                if object_id in self._keys:
+                    del self._keys[object_id]
+                    del self._scales[object_id]
+        if len(object_ids) > 0:
+            commands.append({"$type": "send_meshes",
+                             "ids": object_ids,
+                             "frequency": "once"})
+
+    def on_send(self, resp: List[bytes]) -> None:
+        if len(self._requested) == 0:
+            return
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id == "mesh":
+                meshes = Meshes(resp[i])
+                for j in range(meshes.get_num()):
+                    object_id = meshes.get_object_id(j)
+                    if object_id not in self._requested:
+                        continue
+                    key = self._requested[object_id]
+                    vertices = np.array(meshes.get_vertices(j), dtype=np.float32)
+                    triangles = np.array(meshes.get_triangles(j), dtype=np.int32)
+                    self.meshes[key] = (vertices, triangles)
+                    path = self.directory.joinpath(key + ".npz")
+                    # Another controller already cached this mesh.
+                    if path.exists():
+                        continue
+                    # Write to a temporary file first so that a partially-written file is never read.
+                    # The temporary file name is unique so that concurrent controllers don't write to the same file.
+                    temp = self.directory.joinpath(f"{key}.npz.{uuid4().hex}.tmp")
+                    try:
+                        with temp.open("wb") as f:
+                            np.savez(f, vertices=vertices, triangles=triangles)
+                        temp.replace(path)
+                    # If the file can't be written, the mesh is still cached in memory.
+                    except OSError:
+                        if temp.exists():
+                            temp.unlink()
+        self._requested.clear()
+
+    def get_mesh(self, object_id: int, position: np.array = None, rotation: np.array = None) -> Tuple[np.array, np.array]:
+        """
+        :param object_id: The object ID.
+        :param position: The position of the object. If None and there is an `ObjectManager`, this is `object_manager.transforms[object_id].position`. If None and there is no `ObjectManager`, the vertices are in the object's local space.
+        :param rotation: The rotation of the object as a quaternion. If None and there is an `ObjectManager`, this is `object_manager.transforms[object_id].rotation`.
+
+        :return: Tuple: The vertices as a numpy array of shape `(n, 3)`, scaled and transformed to world space; the triangles as a numpy array of shape `(m, 3)`. Each triangle is three indices of `vertices`.
+        """
+
+        vertices, triangles = self._get_local_mesh(object_id=object_id)
+        vertices = vertices * self._scales[object_id]
+        if self._object_manager is not None and object_id in self._object_manager.transforms:
+            if position is None:
+                position = self._object_manager.transforms[object_id].position
+            if rotation is None:
+                rotation = self._object_manager.transforms[object_id].rotation
+        if rotation is not None:
+            vertices = vertices.dot(QuaternionUtils.get_rotation_matrix(rotation).T.astype(np.float32))
+        if position is not None:
+            vertices += np.asarray(position, dtype=np.float32)
+        return vertices, triangles
+
+    def has_mesh(self, object_id: int) -> bool:
+        """
+        :param object_id: The object ID.
+
+        :return: True if the mesh of this object is cached.
+        """
+
+        return object_id in self._keys and self._has_key(self._keys[object_id])
+
+    def reset(self) -> None:
+        """
+        Reset this add-on. Call this when resetting the scene. Cached meshes aren't cleared.
+        """
+
+        self.initialized = False
+        self._keys.clear()
+        self._scales.clear()
+        self._requested.clear()
+
+    @staticmethod
+    def get_key(model_name: str, url: str) -> str:
+        """
+        :param model_name: The name of the model.
+        :param url: The URL of the model's asset bundle.
+
+        :return: The cache key of the model.
+        """
+
+        return model_name.lower() + "_" + sha256(url.encode("utf-8")).hexdigest()[:16]
+
+    def _get_local_mesh(self, object_id: int) -> Tuple[np.array, np.array]:
+        """
+        :param object_id: The object ID.
+
+        :return: Tuple: The local, unscaled vertices; the triangles.
+        """
+
+        if object_id not in self._keys:
+            # The object was added before this add-on. Try to find its model record.
+            if self._object_manager is None or object_id not in self._object_manager.objects_static:
+                raise Exception(f"Unknown object: {object_id}")
+            model_name = self._object_manager.objects_static[object_id].name
+            for library_path in Controller.MODEL_LIBRARIANS:
+                record = Controller.MODEL_LIBRARIANS[library_path].get_record(model_name)
+                if record is not None:
+                    self._keys[object_id] = MeshCache.get_key(model_name=model_name, url=record.get_url())
+                    self._scales[object_id] = np.full(3, record.scale_factor, dtype=np.float32)
+                    break
+            if object_id not in self._keys:
+                raise Exception(f"Model record not found for object {object_id}: {model_name}")
+        key = self._keys[object_id]
+        if not self._has_key(key):
+            raise Exception(f"Mesh not cached for object {object_id}. The model might not have a readable mesh.")
+        return self.meshes[key]
+
+    def _has_key(self, key: str) -> bool:
+        """
+        :param key: The cache key.
+
+        :return: True if the mesh is cached in memory or on disk. If it's on disk, it is loaded into memory.
+        """
+
+        if key in self.meshes:
+            return True
+        path = self.directory.joinpath(key + ".npz")
+        if not path.exists():
+            return False
+        with np.load(str(path.resolve())) as f:
+            self.meshes[key] = (f["vertices"], f["triangles"])
+        return True
+
+    @staticmethod
+    def _is_readable(model_name: str) -> bool:
+        """
+        :param model_name: The name of the model.
+
+        :return: True if the model has a readable mesh. `send_meshes` can't be sent for models that don't.
+        """
+
+        for library_path in Controller.MODEL_LIBRARIANS:
+            record = Controller.MODEL_LIBRARIANS[library_path].get_record(model_name)
+            if record is not None:
+                return record.flex
+        return False
@@ -1,7 +1,4 @@
-from collections import Counter
 from typing import List
-from io import BytesIO
-from PIL import Image
 from tdw.add_ons.model_verifier.model_tests.rotate_object_test import RotateObjectTest
 from tdw.output_data import Images
 
@@ -22,11 +19,8 @@ class MissingMaterials(RotateObjectTest):
         return commands
 
     def _read_images(self, images: Images) -> None:
-        image = Image.open(BytesIO(images.get_image(0)))
-        # Source: https://stackoverflow.com/a/59709420
-        colors = Counter(image.getdata())
-        unique_colors = set(colors)
-        if MissingMaterials.PINK in unique_colors:
+        image = RotateObjectTest._get_image_array(images=images)
+        if RotateObjectTest._get_num_pixels(image=image, color=MissingMaterials.PINK) > 0:
             self.reports.append("Missing materials")
             self.done = True
 
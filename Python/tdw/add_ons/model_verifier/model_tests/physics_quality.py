@@ -1,7 +1,4 @@
 from typing import List
-from io import BytesIO
-from PIL import Image
-from collections import Counter
 from tdw.add_ons.model_verifier.model_tests.rotate_object_test import RotateObjectTest
 from tdw.output_data import Images
 from tdw.librarian import ModelRecord
@@ -75,8 +72,8 @@ class PhysicsQuality(RotateObjectTest):
             return commands
 
     def _read_images(self, images: Images) -> None:
-        image = Image.open(BytesIO(images.get_image(0)))
+        image = RotateObjectTest._get_image_array(images=images)
         if self._showing_collider_hulls:
-            self._with_collider_hulls.append(Counter(image.getdata())[RotateObjectTest.PINK])
+            self._with_collider_hulls.append(RotateObjectTest._get_num_pixels(image=image, color=RotateObjectTest.PINK))
         else:
-            self._without_collider_hulls.append(Counter(image.getdata())[PhysicsQuality.MASK_RED])
+            self._without_collider_hulls.append(RotateObjectTest._get_num_pixels(image=image, color=PhysicsQuality.MASK_RED))
@@ -1,6 +1,8 @@
 from typing import List, Dict
 from abc import ABC, abstractmethod
+from io import BytesIO
 import numpy as np
+from PIL import Image
 from tdw.add_ons.model_verifier.model_tests.model_test import ModelTest
 from tdw.librarian import ModelRecord
 from tdw.tdw_utils import TDWUtils
@@ -116,6 +118,29 @@ class RotateObjectTest(ModelTest, ABC):
 
         raise Exception()
 
+    @staticmethod
+    def _get_image_array(images: Images) -> np.array:
+        """
+        :param images: The image data.
+
+        :return: The first image pass as a numpy array of RGB values. Shape: `(height, width, 3)`.
+        """
+
+        return np.asarray(Image.open(BytesIO(images.get_image(0))).convert("RGB"))
+
+    @staticmethod
+    def _get_num_pixels(image: np.array, color: tuple) -> int:
+        """
+        :param image: An image as a numpy array of RGB values. See: `_get_image_array()`.
+        :param color: The RGB color.
+
+        :return: The number of pixels in the image that are `color`.
+        """
+
+        return int(np.count_nonzero((image[:, :, 0] == color[0]) &
+                                    (image[:, :, 1] == color[1]) &
+                                    (image[:, :, 2] == color[2])))
+
     @staticmethod
     def _get_end_commands() -> List[dict]:
         """
@@ -1,4 +1,6 @@
+import json
 from enum import Enum
+from pathlib import Path
 from platform import system
 from typing import List, Union, Optional
 from tdw.controller import Controller
@@ -23,6 +25,8 @@ class _Test(Enum):
 class ModelVerifier(AddOn):
     """
     Run tests on an object model.
+
+    To test many models, call `set_batch_tests()`. The reports of each model will be written to a file as soon as that model's tests are done.
     """
 
     def __init__(self):
@@ -31,6 +35,12 @@ class ModelVerifier(AddOn):
         self._record: Optional[ModelRecord] = None
         self._current_test: Optional[ModelTest] = None
         self._object_id: int = -1
+        # The tests that will be run on each model in a batch.
+        self._batch_tests: List[_Test] = list()
+        # Records of models in a batch that haven't been tested yet.
+        self._batch_records: List[ModelRecord] = list()
+        # The path to the batch report file. If None, we're not testing a batch of models.
+        self._batch_path: Optional[Path] = None
         """:field
         A list of reports from the test.
         """
@@ -70,33 +80,59 @@ class ModelVerifier(AddOn):
 
         if self._current_test is not None:
             raise Exception(f"Cannot set new tests because we're still testing {self._record.name}")
-        self._tests = list()
         self.done = False
         self.reports.clear()
-        if model_report:
-            self._tests.append(_Test.model_report)
-        if missing_materials:
-            self._tests.append(_Test.missing_materials)
-        if physics_quality:
-            self._tests.append(_Test.physics_quality)
-        # This is the name of a model in models_core.json
-        if source is None:
-            if "models_core.json" not in Controller.MODEL_LIBRARIANS:
-                Controller.MODEL_LIBRARIANS["models_core.json"] = ModelLibrarian()
-            self._record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(name)
-        # This is the name of a record in a specified library.
-        elif isinstance(source, ModelLibrarian):
-            self._record = source.get_record(name)
-        # This is a model record.
-        elif isinstance(source, ModelRecord):
-            self._record = source
-        # This is a URL.
-        elif isinstance(source, str):
-            self._record = ModelRecord()
-            self._record.name = name
-            self._record.urls[system()] = source
+        self._batch_path = None
+        self._batch_records.clear()
+        self._batch_tests = ModelVerifier._get_tests(model_report=model_report,
+                                                     missing_materials=missing_materials,
+                                                     physics_quality=physics_quality)
+        self._start_record(record=ModelVerifier._get_record(name=name, source=source))
+
+    def set_batch_tests(self, records: List[ModelRecord], path: Union[str, Path], model_report: bool,
+                        missing_materials: bool, physics_quality: bool) -> None:
+        """
+        Start new tests for many models. Only call this if there isn't currently a test running.
+
+        The models will be tested one after another. As soon as each model's tests are done, its reports are appended to the file at `path` as a line of JSON: `{"name": name, "reports": reports}`. `self.reports` is cleared at the start of each model's tests. `self.done` will be True when every model has been tested.
+
+        :param records: The records of each model.
+        :param path: The path to the report file. If the file already exists, new reports will be appended to it.
+        :param model_report: If True, run a basic test on each model.
+        :param missing_materials: If True, test each model for any missing materials.
+        :param physics_quality: If True, test the extent to which the colliders geometry matches the rendered geometry.
+        """
+
+        if self._current_test is not None:
+            raise Exception(f"Cannot set new tests because we're still testing {self._record.name}")
+        tests = ModelVerifier._get_tests(model_report=model_report,
+                                         missing_materials=missing_materials,
+                                         physics_quality=physics_quality)
+        if len(tests) == 0:
+            raise Exception("No tests were selected.")
+        self.done = False
+        self.reports.clear()
+        self._batch_tests = tests
+        self._batch_records = records[:]
+        if isinstance(path, str):
+            self._batch_path = Path(path)
         else:
-            raise TypeError("Invalid type for source: " + source)
+            self._batch_path = path
+        if not self._batch_path.parent.exists():
+            self._batch_path.parent.mkdir(parents=True)
+        if len(self._batch_records) > 0:
+            self._start_record(record=self._batch_records.pop(0))
+
+    def _start_record(self, record: ModelRecord) -> None:
+        """
+        Start testing a model.
+
+        :param record: The model record.
+        """
+
+        self._record = record
+        self._tests = self._batch_tests[:]
+        self.reports.clear()
         self._next_test()
 
     def _next_test(self) -> None:
@@ -105,8 +141,15 @@ class ModelVerifier(AddOn):
         """
 
         if len(self._tests) == 0:
+            # Write this model's reports to the batch report file.
+            if self._batch_path is not None:
+                with self._batch_path.open("at", encoding="utf-8") as f:
+                    f.write(json.dumps({"name": self._record.name, "reports": self.reports}) + "\n")
             self._current_test = None
             self._record = None
+            # Start testing the next model in the batch.
+            if len(self._batch_records) > 0:
+                self._start_record(record=self._batch_records.pop(0))
             return
         t: _Test = self._tests.pop(0)
         if t == _Test.model_report:
@@ -129,3 +172,51 @@ class ModelVerifier(AddOn):
         if self._current_test.done:
             self.reports.extend(self._current_test.reports)
             self._next_test()
+
+    @staticmethod
+    def _get_tests(model_report: bool, missing_materials: bool, physics_quality: bool) -> List[_Test]:
+        """
+        :param model_report: If True, run a basic test on the model.
+        :param missing_materials: If True, test the model for any missing materials.
+        :param physics_quality: If True, test the extent to which the colliders geometry matches the rendered geometry.
+
+        :return: A list of tests in the order that they will be run.
+        """
+
+        tests: List[_Test] = list()
+        if model_report:
+            tests.append(_Test.model_report)
+        if missing_materials:
+            tests.append(_Test.missing_materials)
+        if physics_quality:
+            tests.append(_Test.physics_quality)
+        return tests
+
+    @staticmethod
+    def _get_record(name: str, source: Union[ModelLibrarian, ModelRecord, str] = None) -> ModelRecord:
+        """
+        :param name: The name of the model.
+        :param source: The source of the model. See `set_tests()`.
+
+        :return: The model record.
+        """
+
+        # This is the name of a model in models_core.json
+        if source is None:
+            if "models_core.json" not in Controller.MODEL_LIBRARIANS:
+                Controller.MODEL_LIBRARIANS["models_core.json"] = ModelLibrarian()
+            return Controller.MODEL_LIBRARIANS["models_core.json"].get_record(name)
+        # This is the name of a record in a specified library.
+        elif isinstance(source, ModelLibrarian):
+            return source.get_record(name)
+        # This is a model record.
+        elif isinstance(source, ModelRecord):
+            return source
+        # This is a URL.
+        elif isinstance(source, str):
+            record = ModelRecord()
+            record.name = name
+            record.urls[system()] = source
+            return record
+        else:
+            raise TypeError("Invalid type for source: " + source)
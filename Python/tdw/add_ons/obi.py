@@ -1,4 +1,5 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Tuple
+import numpy as np
 from tdw.add_ons.add_on import AddOn
 from tdw.output_data import OutputData, ObiParticles, StaticRigidbodies, StaticRobot
 from tdw.obi_data.fluids.fluid import Fluid, FLUIDS
@@ -111,16 +112,17 @@ class Obi(AddOn):
             r_id = OutputData.get_data_type_id(resp[i])
             if r_id == "obip":
                 obi_particles = ObiParticles(resp[i])
+                # Add actors.
                 for j in range(obi_particles.get_num_objects()):
                     object_id = obi_particles.get_object_id(j)
-                    # Add an actor.
                     if object_id not in self.actors:
                         self.actors[object_id] = ObiActor(object_id=object_id,
                                                           object_index=j,
                                                           solver_id=obi_particles.get_solver_id(j))
                 # Update the particles.
-                for object_id in self.actors:
-                    self.actors[object_id].on_communicate(obi_particles=obi_particles)
+                for object_id, (positions, velocities) in Obi._get_particles(obi_particles=obi_particles).items():
+                    self.actors[object_id].positions = positions
+                    self.actors[object_id].velocities = velocities
 
     def create_fluid(self, object_id: int, fluid: Union[str, Fluid, GranularFluid], shape: EmitterShape,
                      position: Dict[str, float] = None, rotation: Dict[str, float] = None, speed: float = 0,
@@ -309,6 +311,40 @@ class Obi(AddOn):
         else:
             self._vr_material = vr_material
 
+    @staticmethod
+    def _get_particles(obi_particles: ObiParticles) -> Dict[int, Tuple[np.array, np.array]]:
+        """
+        :param obi_particles: `ObiParticles` output data.
+
+        :return: The particle data of each actor. Key = The object ID. Value = Tuple: The positions and the velocities of the actor's active particles. Each is an `(n, 3)` view of an array shared by every actor in the same solver.
+        """
+
+        # The object IDs and the indices of the active particles of each actor per solver.
+        solver_actors: Dict[int, List[Tuple[int, np.array]]] = dict()
+        for j in range(obi_particles.get_num_objects()):
+            solver_id = obi_particles.get_solver_id(j)
+            if solver_id not in solver_actors:
+                solver_actors[solver_id] = list()
+            solver_actors[solver_id].append((obi_particles.get_object_id(j),
+                                             obi_particles.get_solver_indices(j)[:obi_particles.get_count(j)]))
+        particles: Dict[int, Tuple[np.array, np.array]] = dict()
+        for solver_id in solver_actors:
+            # Decode the solver's particle data once. These are (n, 4) views of the output data.
+            positions = obi_particles.get_positions(solver_id).reshape(-1, 4)
+            velocities = obi_particles.get_velocities(solver_id).reshape(-1, 4)
+            # Gather the particles of every actor in the solver at the same time.
+            # Copying whole rows is much faster than copying the first 3 columns.
+            gathered = np.concatenate([indices for object_id, indices in solver_actors[solver_id]]).astype(np.intp)
+            actor_positions = np.take(positions, gathered, axis=0)
+            actor_velocities = np.take(velocities, gathered, axis=0)
+            # Each actor's particles are an (n, 3) view of the gathered particles, without the 4th column.
+            start = 0
+            for object_id, indices in solver_actors[solver_id]:
+                end = start + len(indices)
+                particles[object_id] = (actor_positions[start: end, :3], actor_velocities[start: end, :3])
+                start = end
+        return particles
+
     @staticmethod
     def _get_cloth_commands(object_id: int, command_name: str, cloth_material: Union[str, ClothMaterial],
                             position: Dict[str, float] = None, rotation: Dict[str, float] = None,
@@ -0,0 +1,238 @@
+import json
+from pathlib import Path
+from typing import List, Dict, Union, Optional
+import numpy as np
+from tdw.output_data import OutputData, ObiParticles
+from tdw.add_ons.add_on import AddOn
+from tdw.add_ons.obi import Obi
+
+
+class ObiParticleRecorder(AddOn):
+    """
+    Record the positions and velocities of Obi particles per frame to a compressed on-disk store. Read the recording with [`ObiParticleRecording`](../obi_data/obi_particle_recording.md).
+
+    Frames are buffered in memory in chunks of `chunk_size` frames. Each chunk is written to disk as soon as it is full, so memory usage doesn't grow with the length of the recording. Each chunk stores the particles of each actor in a single column per frame range, which compresses well and can be sliced by frame and by actor without reading the whole recording.
+
+    This add-on requests `ObiParticles` output data. It can be used with or without the [`Obi`](obi.md) add-on.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.add_ons.obi import Obi
+    from tdw.add_ons.obi_particle_recorder import ObiParticleRecorder
+
+    c = Controller()
+    obi = Obi()
+    recorder = ObiParticleRecorder(encoding="float16")
+    c.add_ons.extend([obi, recorder])
+    # Your code here.
+    recorder.start(path="fluid")
+    for i in range(1000):
+        c.communicate([])
+    recorder.stop()
+    c.communicate({"$type": "terminate"})
+    ```
+
+    Encodings:
+
+    | Encoding | Description |
+    | --- | --- |
+    | `"float32"` | Lossless. |
+    | `"float16"` | Half-precision. This halves the size of the recording. Precision is about 1 mm for positions within 2 meters of the origin. |
+    | `"quantized"` | Values are rounded to multiples of `quantization` and stored as the difference from the previous frame. Usually this is the smallest encoding if `compress == True`. |
+    """
+
+    """:class_var
+    The valid encodings.
+    """
+    ENCODINGS: List[str] = ["float32", "float16", "quantized"]
+
+    def __init__(self, encoding: str = "float32", quantization: float = 0.001, compress: bool = True,
+                 chunk_size: int = 10, velocities: bool = True):
+        """
+        :param encoding: The encoding of the particle data. Options: `"float32"`, `"float16"`, `"quantized"`.
+        :param quantization: If `encoding == "quantized"`, positions are rounded to multiples of this many meters and velocities are rounded to multiples of this many meters per second.
+        :param compress: If True, compress each chunk. If False, chunks can be memory-mapped when they are read.
+        :param chunk_size: The number of frames per chunk.
+        :param velocities: If True, record particle velocities as well as positions.
+        """
+
+        super().__init__()
+        if encoding not in ObiParticleRecorder.ENCODINGS:
+            raise Exception(f"Invalid encoding: {encoding}. Options: {ObiParticleRecorder.ENCODINGS}")
+        if quantization <= 0:
+            raise Exception(f"Invalid quantization: {quantization}")
+        if chunk_size < 1:
+            raise Exception(f"Invalid chunk size: {chunk_size}")
+        """:field
+        The path to the directory of the current recording.
+        """
+        self.path: Path = Path.home()
+        """:field
+        If False, there is an ongoing recording.
+        """
+        self.done: bool = True
+        """:field
+        The number of frames in the current recording.
+        """
+        self.num_frames: int = 0
+        self._encoding: str = encoding
+        self._quantization: float = quantization
+        self._compress: bool = compress
+        self._chunk_size: int = chunk_size
+        self._velocities: bool = velocities
+        # The index of the recording. This is written to disk per chunk.
+        self._index: dict = dict()
+        # The particle data of each frame of the current chunk. Key = The object ID. Value = A list of arrays per frame.
+        self._positions: Dict[int, List[np.array]] = dict()
+        self._velocity_frames: Dict[int, List[np.array]] = dict()
+        # The number of frames in the current chunk.
+        self._num_chunk_frames: int = 0
+
+    def get_initialization_commands(self) -> List[dict]:
+        return [{"$type": "send_obi_particles",
+                 "frequency": "always"}]
+
+    def on_send(self, resp: List[bytes]) -> None:
+        if self.done:
+            return
+        particles: Dict[int, tuple] = dict()
+        for i in range(len(resp) - 1):
+            if OutputData.get_data_type_id(resp[i]) == "obip":
+                particles = Obi._get_particles(obi_particles=ObiParticles(resp[i]))
+                break
+        for object_id in particles:
+            if object_id not in self._positions:
+                # This actor didn't exist on the previous frames of this chunk.
+                # Encode the empty frames so that every frame in the column has the same dtype.
+                self._positions[object_id] = [self._encode(np.zeros(shape=(0, 3), dtype=np.float32))
+                                              for _ in range(self._num_chunk_frames)]
+                self._velocity_frames[object_id] = [self._encode(np.zeros(shape=(0, 3), dtype=np.float32))
+                                                    for _ in range(self._num_chunk_frames)]
+            positions, velocities = particles[object_id]
+            self._positions[object_id].append(self._encode(positions))
+            if self._velocities:
+                self._velocity_frames[object_id].append(self._encode(velocities))
+        # Actors that aren't in the output data have no particles on this frame.
+        for object_id in self._positions:
+            if object_id not in particles:
+                self._positions[object_id].append(self._encode(np.zeros(shape=(0, 3), dtype=np.float32)))
+                if self._velocities:
+                    self._velocity_frames[object_id].append(self._encode(np.zeros(shape=(0, 3), dtype=np.float32)))
+        self._num_chunk_frames += 1
+        self.num_frames += 1
+        if self._num_chunk_frames >= self._chunk_size:
+            self._write_chunk()
+
+    def start(self, path: Union[str, Path]) -> None:
+        """
+        Start recording.
+
+        :param path: The path to the output directory.
+        """
+
+        # Don't start a new recording if one is ongoing.
+        if not self.done:
+            return
+        self.done = False
+        if isinstance(path, str):
+            self.path = Path(path)
+        else:
+            self.path = path
+        if not self.path.exists():
+            self.path.mkdir(parents=True)
+        self.num_frames = 0
+        self._num_chunk_frames = 0
+        self._positions.clear()
+        self._velocity_frames.clear()
+        self._index = {"encoding": self._encoding,
+                       "quantization": self._quantization,
+                       "compress": self._compress,
+                       "velocities": self._velocities,
+                       "num_frames": 0,
+                       "chunks": list()}
+        self._write_index()
+
+    def stop(self) -> None:
+        """
+        Stop an ongoing recording and write the remaining frames to disk.
+        """
+
+        if self.done:
+            return
+        if self._num_chunk_frames > 0:
+            self._write_chunk()
+        self.done = True
+
+    def _encode(self, values: np.array) -> np.array:
+        """
+        :param values: Positions or velocities.
+
+        :return: The encoded values.
+        """
+
+        if self._encoding == "float16":
+            return values.astype(np.float16)
+        elif self._encoding == "quantized":
+            return np.round(values / self._quantization).astype(np.int32)
+        else:
+            return np.ascontiguousarray(values, dtype=np.float32)
+
+    def _write_chunk(self) -> None:
+        """
+        Write the buffered frames to disk.
+        """
+
+        chunk_index = len(self._index["chunks"])
+        arrays: Dict[str, np.array] = dict()
+        counts: Dict[str, List[int]] = dict()
+        for object_id in self._positions:
+            counts[str(object_id)] = [len(p) for p in self._positions[object_id]]
+            arrays[f"{object_id}_positions"] = self._get_column(self._positions[object_id])
+            if self._velocities:
+                arrays[f"{object_id}_velocities"] = self._get_column(self._velocity_frames[object_id])
+        if self._compress:
+            np.savez_compressed(str(self.path.joinpath(f"chunk_{chunk_index}.npz").resolve()), **arrays)
+        # Save each column as a separate file so that it can be memory-mapped.
+        else:
+            chunk_directory = self.path.joinpath(f"chunk_{chunk_index}")
+            if not chunk_directory.exists():
+                chunk_directory.mkdir()
+            for name in arrays:
+                np.save(str(chunk_directory.joinpath(name + ".npy").resolve()), arrays[name])
+        self._index["chunks"].append({"start": self.num_frames - self._num_chunk_frames,
+                                      "num_frames": self._num_chunk_frames,
+                                      "counts": counts})
+        self._index["num_frames"] = self.num_frames
+        self._write_index()
+        self._positions.clear()
+        self._velocity_frames.clear()
+        self._num_chunk_frames = 0
+
+    def _get_column(self, frames: List[np.array]) -> np.array:
+        """
+        :param frames: The encoded values of an actor per frame.
+
+        :return: The values of each frame in a single array. If `encoding == "quantized"`, each frame is the difference from the previous frame unless it is the first frame or the number of particles changed.
+        """
+
+        if self._encoding == "quantized":
+            deltas: List[np.array] = list()
+            previous: Optional[np.array] = None
+            for frame in frames:
+                if previous is not None and len(previous) == len(frame):
+                    deltas.append(frame - previous)
+                else:
+                    deltas.append(frame)
+                previous = frame
+            frames = deltas
+        return np.concatenate(frames)
+
+    def _write_index(self) -> None:
+        """
+        Write the index of the recording to disk.
+        """
+
+        # Write to a temporary file first so that a partially-written index is never read.
+        temp = self.path.joinpath("index.json.tmp")
+        temp.write_text(json.dumps(self._index))
+        temp.replace(self.path.joinpath("index.json"))
@@ -1,6 +1,6 @@
 from time import time
-from os import urandom
-import base64
+from os import cpu_count
+from concurrent.futures import ThreadPoolExecutor
 import math
 import json
 from pathlib import Path
@@ -24,7 +24,7 @@ from tdw.physics_audio.collision_audio_event import CollisionAudioEvent
 from tdw.physics_audio.scrape_model import ScrapeModel, DEFAULT_SCRAPE_MODELS
 from tdw.physics_audio.scrape_material import ScrapeMaterial
 from tdw.object_data.rigidbody import Rigidbody
-from tdw.audio_constants import SAMPLE_RATE, CHANNELS, SAMPLE_WIDTH
+from tdw.audio_constants import SAMPLE_RATE, CHANNELS
 from tdw.add_ons.collision_manager import CollisionManager
 from tdw.librarian import MaterialLibrarian
 
@@ -140,6 +140,18 @@ class PyImpact(CollisionManager):
     FLOOR_MASS: int = 100
     # Visual material librarian used for scrape surfaces.
     __VISUAL_MATERIAL_LIBRARIAN: MaterialLibrarian = MaterialLibrarian("materials_high.json")
+    # The number of samples in a 100ms scrape chunk.
+    _SCRAPE_CHUNK_LENGTH: int = int(SAMPLE_RATE / 10)
+    # The number of samples in a scrape ring buffer. Each scrape segment is truncated to this length (2100ms).
+    _SCRAPE_BUFFER_LENGTH: int = _SCRAPE_CHUNK_LENGTH * 21
+    # The number of modes per object.
+    _NUM_MODES: int = 10
+    # The number of pre-sampled sets of modes per material.
+    _MODE_BANK_SIZE: int = 16
+    # The default physics time step. See command `set_time_step`.
+    _DEFAULT_TIME_STEP: float = 0.01
+    # Synthesize the impact sounds of a frame in these threads. This is created the first time that any PyImpact object has multiple impacts in a frame, and is shared by all PyImpact objects.
+    _IMPACT_EXECUTOR: Optional[ThreadPoolExecutor] = None
 
     def __init__(self, initial_amp: float = 0.5, prevent_distortion: bool = True, logging: bool = False,
                  static_audio_data_overrides: Dict[int, ObjectAudioStatic] = None,
@@ -157,7 +169,7 @@ class PyImpact(CollisionManager):
         :param auto: If True, PyImpact will evaluate the simulation state per `communicate()` call and automatically generate audio.
         :param scrape: If True, initialize certain objects as scrape surfaces: Change their visual material(s) and enable them for scrape audio. See: `tdw.physics_audio.scrape_model.DEFAULT_SCRAPE_MODELS`
         :param scrape_objects: If `scrape == True` and this is not None, this dictionary can be used to manually set scrape surfaces. Key = Object ID. Value = [`ScrapeModel`](../physics_audio/scrape_model.md).
-        :param min_time_between_impact_events: The minimum time in seconds between two impact events that involve the same primary object.
+        :param min_time_between_impact_events: The minimum time in seconds between two impact events that involve the same primary object. If PyImpact is an add-on, this is simulation time (see `self.time`); otherwise, this is real time.
         """
 
         super().__init__()
@@ -211,6 +223,17 @@ class PyImpact(CollisionManager):
                 path = mat_name + "_mm"
                 data = json.loads(Path(resource_filename(__name__, f"py_impact/material_data/{path}.json")).read_text())
                 self.material_data.update({mat_name: data})
+        # The index of each material in the arrays below.
+        self._material_indices: Dict[str, int] = {mat_name: i for i, mat_name in enumerate(self.material_data)}
+        # The mean frequencies, onset powers, and decay times of the modes of each material. Shape: `(number of materials, 3, _NUM_MODES)`.
+        self._material_modes: np.array = np.array([[self.material_data[mat_name][key][:PyImpact._NUM_MODES]
+                                                    for key in ["cf", "op", "rt"]]
+                                                   for mat_name in self.material_data], dtype=np.float64)
+        # Banks of pre-sampled modes per material. Shape: `(number of materials, _MODE_BANK_SIZE, 3, _NUM_MODES)`.
+        self._mode_banks: np.array = self._sample_modes(material_indices=np.arange(len(self.material_data)),
+                                                        num_samples=PyImpact._MODE_BANK_SIZE)
+        # The index of the next unused set of modes in each material's bank.
+        self._mode_bank_indices: np.array = np.zeros(len(self.material_data), dtype=int)
         """:field
         Cached scrape surface data.
         """
@@ -246,8 +269,10 @@ class PyImpact(CollisionManager):
         # A dictionary of audio data. Key = Object ID; Value = `ObjectAudioStatic`.
         self._static_audio_data: Dict[int, ObjectAudioStatic] = dict()
 
-        # Summed scrape masters. Key = primary ID, secondary ID.
-        self._scrape_summed_masters: Dict[Tuple[int, int], AudioSegment] = dict()
+        # Scrape ring buffers of overlapping scrape segments. Key = primary ID, secondary ID.
+        self._scrape_buffers: Dict[Tuple[int, int], np.array] = dict()
+        # Ring buffers of scrapes that ended. These will be reused by new scrapes.
+        self._free_scrape_buffers: List[np.array] = list()
         # Keeping a track of previous scrape indices.
         self._scrape_previous_indices: Dict[Tuple[int, int], int] = dict()
         # Starting velocity magnitude of scraping object; use in calculating changing band-pass filter.
@@ -260,8 +285,19 @@ class PyImpact(CollisionManager):
         # Ongoing impact audio events. Key = Audio source ID. Value = Time of event.
         self._impact_events: Dict[int, float] = dict()
         self._min_time_between_impact_events: float = min_time_between_impact_events
+        """:field
+        The elapsed simulation time in seconds. This is advanced per `communicate()` call by the physics time step, including any frames skipped by `step_physics`. This is set to 0 by `reset()`.
+        """
+        self.time: float = 0
+        # The physics time step. See command `set_time_step`.
+        self._time_step: float = PyImpact._DEFAULT_TIME_STEP
+        # The simulation time that will elapse on the next `communicate()` call.
+        self._frame_duration: float = PyImpact._DEFAULT_TIME_STEP
+        # If True, PyImpact is an add-on and uses the simulation clock. This is set when the controller first calls `get_initialization_commands()` or `before_send()`.
+        self._is_add_on: bool = False
 
     def get_initialization_commands(self) -> List[dict]:
+        self._is_add_on = True
         return [{"$type": "send_bounds"},
                 {"$type": "send_rigidbodies",
                  "frequency": "always"},
@@ -277,8 +313,20 @@ class PyImpact(CollisionManager):
                 {"$type": "send_static_rigidbodies"},
                 {"$type": "send_static_oculus_touch"}]
 
+    def before_send(self, commands: List[dict]) -> None:
+        self._is_add_on = True
+        # Get the simulation time that will elapse on this frame.
+        num_frames = 1
+        for command in commands:
+            if command["$type"] == "set_time_step":
+                self._time_step = command["time_step"] if "time_step" in command else PyImpact._DEFAULT_TIME_STEP
+            elif command["$type"] == "step_physics":
+                num_frames += command["frames"]
+        self._frame_duration = self._time_step * num_frames
+
     def on_send(self, resp: List[bytes]) -> None:
         super().on_send(resp=resp)
+        self.time += self._frame_duration
         # Cache static audio info.
         if not self._cached_audio_info:
             self._cached_audio_info = True
@@ -290,12 +338,13 @@ class PyImpact(CollisionManager):
             r_id = OutputData.get_data_type_id(resp[i])
             # Mark this audio source as done.
             if r_id == "ausd":
-                audio_source_id = AudioSourceDone(resp[i]).get_id()
-                # The audio source might not be in this dictionary (for example if this was a scrape event).
-                if audio_source_id in self._impact_events:
-                    del self._impact_events[audio_source_id]
+                self.set_audio_source_done(audio_source_id=AudioSourceDone(resp[i]).get_id())
         # Get collision events.
         self._get_collision_types(resp=resp)
+        # Impact events on this frame. The modes of each event are updated in order, and then every sound is synthesized at the same time.
+        impacts: List[Tuple[int, int, Optional[int], List[np.array], float, Modes, Modes, float, float, float]] = list()
+        # Commands per collision event. Impact commands are set after the impact sounds are synthesized.
+        commands: List[Optional[dict]] = list()
         for object_id in self.collision_events:
             command = None
             # Generate an impact sound.
@@ -303,38 +352,40 @@ class PyImpact(CollisionManager):
                 # Generate an environment sound.
                 if self.collision_events[object_id].secondary_id is None:
                     audio = self._static_audio_data[object_id]
-                    command = self.get_impact_sound_command(velocity=self.collision_events[object_id].velocity,
-                                                            contact_points=self.collision_events[object_id].collision.points,
-                                                            contact_normals=self.collision_events[object_id].collision.normals,
-                                                            primary_id=object_id,
-                                                            primary_amp=audio.amp,
-                                                            primary_material=audio.material.name + "_" + str(audio.size),
-                                                            primary_mass=audio.mass,
-                                                            secondary_id=None,
-                                                            secondary_amp=PyImpact.FLOOR_AMP,
-                                                            secondary_material=self._get_floor_material_name(),
-                                                            secondary_mass=PyImpact.FLOOR_MASS,
-                                                            primary_resonance=audio.resonance,
-                                                            secondary_resonance=audio.resonance)
+                    self._add_impact(impacts=impacts,
+                                     command_index=len(commands),
+                                     velocity=self.collision_events[object_id].velocity,
+                                     contact_points=self.collision_events[object_id].collision.points,
+                                     contact_normals=self.collision_events[object_id].collision.normals,
+                                     primary_id=object_id,
+                                     primary_amp=audio.amp,
+                                     primary_material=audio.material.name + "_" + str(audio.size),
+                                     primary_mass=audio.mass,
+                                     secondary_id=None,
+                                     secondary_amp=PyImpact.FLOOR_AMP,
+                                     secondary_material=self._get_floor_material_name(),
+                                     secondary_mass=PyImpact.FLOOR_MASS,
+                                     primary_resonance=audio.resonance,
+                                     secondary_resonance=audio.resonance)
                 # Generate an object sound.
                 else:
                     target_audio = self._static_audio_data[self.collision_events[object_id].primary_id]
                     other_audio = self._static_audio_data[self.collision_events[object_id].secondary_id]
-                    command = self.get_impact_sound_command(velocity=self.collision_events[object_id].velocity,
-                                                            contact_points=self.collision_events[object_id].collision.points,
-                                                            contact_normals=self.collision_events[object_id].collision.normals,
-                                                            primary_id=target_audio.object_id,
-                                                            primary_amp=target_audio.amp,
-                                                            primary_material=target_audio.material.name + "_" + str(
-                                                                target_audio.size),
-                                                            primary_mass=target_audio.mass,
-                                                            secondary_id=other_audio.object_id,
-                                                            secondary_amp=other_audio.amp,
-                                                            secondary_material=other_audio.material.name + "_" + str(
-                                                                other_audio.size),
-                                                            secondary_mass=other_audio.mass,
-                                                            primary_resonance=target_audio.resonance,
-                                                            secondary_resonance=other_audio.resonance)
+                    self._add_impact(impacts=impacts,
+                                     command_index=len(commands),
+                                     velocity=self.collision_events[object_id].velocity,
+                                     contact_points=self.collision_events[object_id].collision.points,
+                                     contact_normals=self.collision_events[object_id].collision.normals,
+                                     primary_id=target_audio.object_id,
+                                     primary_amp=target_audio.amp,
+                                     primary_material=target_audio.material.name + "_" + str(target_audio.size),
+                                     primary_mass=target_audio.mass,
+                                     secondary_id=other_audio.object_id,
+                                     secondary_amp=other_audio.amp,
+                                     secondary_material=other_audio.material.name + "_" + str(other_audio.size),
+                                     secondary_mass=other_audio.mass,
+                                     primary_resonance=target_audio.resonance,
+                                     secondary_resonance=other_audio.resonance)
             # Generate a scrape sound.
             elif self.collision_events[object_id].collision_type == CollisionAudioType.scrape and self.collision_events[object_id].secondary_id in self._scrape_objects:
                 scrape_surface_id = self.collision_events[object_id].secondary_id
@@ -356,9 +407,12 @@ class PyImpact(CollisionManager):
                                                             primary_resonance=target_audio.resonance,
                                                             secondary_resonance=other_audio.resonance,
                                                             scrape_material=self._scrape_objects[scrape_surface_id].scrape_material)
-            # Append impact sound commands.
-            if command is not None:
-                self.commands.append(command)
+            commands.append(command)
+        # Synthesize the impact sounds.
+        for impact, command in zip(impacts, self._get_impact_sound_commands(impacts=impacts)):
+            commands[impact[0]] = command
+        # Append impact and scrape sound commands.
+        self.commands.extend([command for command in commands if command is not None])
 
     def _get_floor_material_name(self) -> str:
         """
@@ -445,28 +499,39 @@ class PyImpact(CollisionManager):
 
         :return: The audio modes.
         """
-        data = self.material_data[material] if isinstance(material, str) else self.material_data[material.name]
-        # Load the mode properties.
-        f = -1
-        p = -1
-        t = -1
-        for jm in range(0, 10):
-            jf = 0
-            while jf < 20:
-                jf = data["cf"][jm] + self.rng.normal(0, data["cf"][jm] / 10)
-            jp = data["op"][jm] + self.rng.normal(0, 10)
-            jt = 0
-            while jt < 0.001:
-                jt = data["rt"][jm] + self.rng.normal(0, data["rt"][jm] / 10)
-            if jm == 0:
-                f = jf
-                p = jp
-                t = jt * 1e3
-            else:
-                f = np.append(f, jf)
-                p = np.append(p, jp)
-                t = np.append(t, jt * 1e3)
-        return Modes(f, p, t)
+        index = self._material_indices[material if isinstance(material, str) else material.name]
+        # Refill the material's bank.
+        if self._mode_bank_indices[index] >= PyImpact._MODE_BANK_SIZE:
+            self._mode_banks[index] = self._sample_modes(material_indices=np.array([index]),
+                                                         num_samples=PyImpact._MODE_BANK_SIZE)[0]
+            self._mode_bank_indices[index] = 0
+        modes = self._mode_banks[index][self._mode_bank_indices[index]]
+        self._mode_bank_indices[index] += 1
+        return Modes(modes[0].copy(), modes[1].copy(), modes[2].copy())
+
+    def _sample_modes(self, material_indices: np.array, num_samples: int) -> np.array:
+        """
+        Randomly sample sets of modes for many materials at once.
+
+        :param material_indices: The indices of the materials in `self._material_modes`.
+        :param num_samples: The number of sets of modes per material.
+
+        :return: The sampled frequencies, onset powers, and decay times (in milliseconds). Shape: `(len(material_indices), num_samples, 3, _NUM_MODES)`.
+        """
+
+        means = np.repeat(self._material_modes[material_indices][:, np.newaxis], num_samples, axis=1)
+        modes = np.empty(shape=means.shape, dtype=np.float64)
+        # Frequencies must be at least 20 Hz and decay times must be at least 1 ms.
+        # Re-sample the values that are too low until all of them are valid.
+        for i, scale, minimum in zip([0, 2], [means[:, :, 0] / 10, means[:, :, 2] / 10], [20, 0.001]):
+            valid = np.zeros(shape=means.shape[:2] + (PyImpact._NUM_MODES, ), dtype=bool)
+            while not np.all(valid):
+                values = self.rng.normal(means[:, :, i][~valid], scale[~valid])
+                modes[:, :, i][~valid] = values
+                valid[~valid] = values >= minimum
+        modes[:, :, 1] = self.rng.normal(means[:, :, 1], 10)
+        modes[:, :, 2] *= 1e3
+        return modes
 
     def get_impact_sound(self, velocity: np.array, contact_normals: List[np.array],
                          primary_id: int, primary_material: str, primary_amp: float, primary_mass: float,
@@ -491,6 +556,61 @@ class PyImpact(CollisionManager):
         :return Sound data as a Base64Sound object.
         """
 
+        modes_1, modes_2, amp, mass = self._update_modes(velocity=velocity, contact_normals=contact_normals,
+                                                         primary_id=primary_id, primary_material=primary_material,
+                                                         primary_amp=primary_amp, primary_mass=primary_mass,
+                                                         secondary_id=secondary_id,
+                                                         secondary_material=secondary_material,
+                                                         secondary_amp=secondary_amp, secondary_mass=secondary_mass)
+        sound = PyImpact._synth_impact_modes(modes_1, modes_2, mass, primary_resonance, secondary_resonance)
+        return self._get_impact_sound(primary_id=primary_id, secondary_id=secondary_id, sound=sound, amp=amp)
+
+    def _get_impact_sound(self, primary_id: int, secondary_id: Optional[int], sound: Optional[np.array],
+                          amp: float) -> Optional[Base64Sound]:
+        """
+        :param primary_id: The object ID for the primary (target) object.
+        :param secondary_id: The object ID for the secondary (other) object.
+        :param sound: The synthesized impact sound. Can be None.
+        :param amp: The amplitude of the collision.
+
+        :return Sound data as a Base64Sound object.
+        """
+
+        # On rare occasions, it is possible for PyImpact to fail to generate a sound.
+        if sound is None:
+            return None
+
+        # Count the collisions.
+        self.object_modes[secondary_id][primary_id].count_collisions()
+
+        # Prevent distortion by clamping the amp.
+        if self.prevent_distortion and np.abs(amp) > 0.99:
+            amp = 0.99
+
+        sound = amp * sound / np.max(np.abs(sound))
+        return Base64Sound(sound)
+
+    def _update_modes(self, velocity: np.array, contact_normals: List[np.array],
+                      primary_id: int, primary_material: str, primary_amp: float, primary_mass: float,
+                      secondary_id: Optional[int], secondary_material: str, secondary_amp: float,
+                      secondary_mass: float) -> Tuple[Modes, Modes, float, float]:
+        """
+        Sample the modes of two colliding objects if this is their first collision. Otherwise, adjust the modes so that two successive collisions don't sound identical. This doesn't synthesize a sound.
+
+        :param primary_id: The object ID for the primary (target) object.
+        :param primary_material: The material label for the primary (target) object.
+        :param secondary_id: The object ID for the secondary (other) object.
+        :param secondary_material: The material label for the secondary (other) object.
+        :param primary_amp: Sound amplitude of primary (target) object.
+        :param secondary_amp: Sound amplitude of the secondary (other) object.
+        :param velocity: The velocity.
+        :param contact_normals: The collision contact normals.
+        :param primary_mass: The mass of the primary (target) object.
+        :param secondary_mass: The mass of the secondary (target) object.
+
+        :return Tuple: The modes of the primary object, the modes of the secondary object, the amplitude of the collision, the mass of the smaller object.
+        """
+
         # The sound amplitude of object 2 relative to that of object 1.
         amp2re1 = secondary_amp / primary_amp
 
@@ -520,14 +640,10 @@ class PyImpact(CollisionManager):
 
         # Re-scale the amplitude.
         if self.object_modes[secondary_id][primary_id].count == 0:
-            # Sample the modes.
-            sound, modes_1, modes_2 = self._make_impact_audio(amp2re1, mass,
-                                                              mat1=primary_material,
-                                                              mat2=secondary_material,
-                                                              id1=primary_id,
-                                                              id2=secondary_id,
-                                                              primary_resonance=primary_resonance,
-                                                              secondary_resonance=secondary_resonance)
+            modes_1 = self.object_modes[secondary_id][primary_id].obj1_modes
+            modes_2 = self.object_modes[secondary_id][primary_id].obj2_modes
+            # Scale the two sounds as specified.
+            modes_2.decay_times = modes_2.decay_times + 20 * np.log10(amp2re1)
             # Save collision info - we will need for later collisions.
             amp = self.object_modes[secondary_id][primary_id].amp
             self.object_modes[secondary_id][primary_id].init_speed = normal_speed
@@ -541,7 +657,6 @@ class PyImpact(CollisionManager):
             modes_2 = self.object_modes[secondary_id][primary_id].obj2_modes
             modes_1.powers = modes_1.powers + self.rng.normal(0, 2, len(modes_1.powers))
             modes_2.powers = modes_2.powers + self.rng.normal(0, 2, len(modes_2.powers))
-            sound = PyImpact._synth_impact_modes(modes_1, modes_2, mass, primary_resonance, secondary_resonance)
             self.object_modes[secondary_id][primary_id].obj1_modes = modes_1
             self.object_modes[secondary_id][primary_id].obj2_modes = modes_2
 
@@ -549,20 +664,7 @@ class PyImpact(CollisionManager):
             mode_props = dict()
             self._log_modes(self.object_modes[secondary_id][primary_id].count, mode_props, primary_id, secondary_id,
                             modes_1, modes_2, amp, primary_material, secondary_material)
-
-        # On rare occasions, it is possible for PyImpact to fail to generate a sound.
-        if sound is None:
-            return None
-
-        # Count the collisions.
-        self.object_modes[secondary_id][primary_id].count_collisions()
-
-        # Prevent distortion by clamping the amp.
-        if self.prevent_distortion and np.abs(amp) > 0.99:
-            amp = 0.99
-
-        sound = amp * sound / np.max(np.abs(sound))
-        return Base64Sound(sound)
+        return modes_1, modes_2, amp, mass
 
     def get_impact_sound_command(self, velocity: np.array, contact_points: List[np.array],
                                  contact_normals: List[np.array], primary_id: int,
@@ -596,12 +698,24 @@ class PyImpact(CollisionManager):
                                       primary_mass=primary_mass, secondary_id=secondary_id,
                                       secondary_material=secondary_material, secondary_amp=secondary_amp,
                                       secondary_mass=secondary_mass, primary_resonance=primary_resonance, secondary_resonance=secondary_resonance)
+        return self._get_impact_sound_command(primary_id=primary_id, contact_points=contact_points, sound=sound)
+
+    def _get_impact_sound_command(self, primary_id: int, contact_points: List[np.array],
+                                  sound: Optional[Base64Sound]) -> Optional[dict]:
+        """
+        :param primary_id: The object ID for the primary (target) object.
+        :param contact_points: The collision contact points.
+        :param sound: The impact sound. Can be None.
+
+        :return A `play_audio_data` or `play_point_source_data` command, or None if there is no sound or if there was a recent impact event.
+        """
+
         if sound is not None:
             if primary_id not in self._impact_events:
-                self._impact_events[primary_id] = time()
+                self._impact_events[primary_id] = self._get_time()
                 return self._get_audio_command(audio_source_id=primary_id, contact_points=contact_points, sound=sound)
             # Don't play too many impact events to avoid a droning effect.
-            elif time() - self._impact_events[primary_id] < self._min_time_between_impact_events:
+            elif self._get_time() - self._impact_events[primary_id] < self._min_time_between_impact_events:
                 return None
             else:
                 return self._get_audio_command(audio_source_id=primary_id, contact_points=contact_points, sound=sound)
@@ -609,38 +723,88 @@ class PyImpact(CollisionManager):
         else:
             return None
 
-    def _make_impact_audio(self, amp2re1: float, mass: float, id1: int, id2: int, primary_resonance: float,
-                           secondary_resonance: float, mat1: str = 'cardboard', mat2: str = 'cardboard') -> (np.array, Modes, Modes):
-        """
-        Generate an impact sound.
-
-        :param mat1: The material label for one of the colliding objects.
-        :param mat2: The material label for the other object.
-        :param amp2re1: The sound amplitude of object 2 relative to that of object 1.
-        :param mass: The mass of the smaller of the two colliding objects.
-        :param id1: The ID for the one of the colliding objects.
-        :param id2: The ID for the other object.
-        :param primary_resonance: The resonance of one of the colliding objects.
-        :param secondary_resonance: The resonance of the other object.
-
-        :return The sound, and the object modes.
-        """
-
-        # Unpack material names.
-        for jmat in AudioMaterial:
-            if mat1 == jmat:
-                tmp1 = jmat
-                mat1 = tmp1.name
-            if mat2 == jmat:
-                tmp2 = jmat
-                mat2 = tmp2.name
-        # Sample modes of object1.
-        modes_1 = self.object_modes[id2][id1].obj1_modes
-        modes_2 = self.object_modes[id2][id1].obj2_modes
-        # Scale the two sounds as specified.
-        modes_2.decay_times = modes_2.decay_times + 20 * np.log10(amp2re1)
-        snth = PyImpact._synth_impact_modes(modes_1, modes_2, mass, primary_resonance, secondary_resonance)
-        return snth, modes_1, modes_2
+    def set_audio_source_done(self, audio_source_id: int) -> None:
+        """
+        Mark an audio source as done playing. This is called automatically when the build sends [`AudioSourceDone`](../../api/output_data.md#AudioSourceDone) output data. The next impact event of this audio source won't be throttled by `min_time_between_impact_events`.
+
+        :param audio_source_id: The audio source ID.
+        """
+
+        # The audio source might not be in this dictionary (for example if this was a scrape event).
+        if audio_source_id in self._impact_events:
+            del self._impact_events[audio_source_id]
+
+    def _get_time(self) -> float:
+        """
+        :return: The current time in seconds. This is used to throttle impact events. If PyImpact is an add-on, this is the simulation time, so that the same simulation always generates the same impact events. Otherwise, this is the real time.
+        """
+
+        if self._is_add_on:
+            return self.time
+        else:
+            return time()
+
+    def _add_impact(self, impacts: List[Tuple[int, int, Optional[int], List[np.array], float, Modes, Modes, float, float, float]],
+                    command_index: int, velocity: np.array, contact_points: List[np.array],
+                    contact_normals: List[np.array], primary_id: int, primary_material: str, primary_amp: float,
+                    primary_mass: float, secondary_id: Optional[int], secondary_material: str, secondary_amp: float,
+                    secondary_mass: float, primary_resonance: float, secondary_resonance: float) -> None:
+        """
+        Update the modes of an impact event and add it to a list of impacts that will be synthesized later.
+
+        :param impacts: The impact events on this frame. See: `self._get_impact_sound_commands()`.
+        :param command_index: The index of the impact's command in the frame's list of commands.
+        :param velocity: The velocity.
+        :param contact_points: The collision contact points.
+        :param contact_normals: The collision contact normals.
+        :param primary_id: The object ID for the primary (target) object.
+        :param primary_material: The material label for the primary (target) object.
+        :param secondary_id: The object ID for the secondary (other) object.
+        :param secondary_material: The material label for the secondary (other) object.
+        :param primary_amp: Sound amplitude of primary (target) object.
+        :param secondary_amp: Sound amplitude of the secondary (other) object.
+        :param primary_mass: The mass of the primary (target) object.
+        :param secondary_mass: The mass of the secondary (other) object.
+        :param primary_resonance: The resonance of the primary (target) object.
+        :param secondary_resonance: The resonance of the secondary (other) object.
+        """
+
+        modes_1, modes_2, amp, mass = self._update_modes(velocity=velocity, contact_normals=contact_normals,
+                                                         primary_id=primary_id, primary_material=primary_material,
+                                                         primary_amp=primary_amp, primary_mass=primary_mass,
+                                                         secondary_id=secondary_id,
+                                                         secondary_material=secondary_material,
+                                                         secondary_amp=secondary_amp, secondary_mass=secondary_mass)
+        impacts.append((command_index, primary_id, secondary_id, contact_points, amp, modes_1, modes_2, mass,
+                        primary_resonance, secondary_resonance))
+
+    def _get_impact_sound_commands(self, impacts: List[Tuple[int, int, Optional[int], List[np.array], float, Modes, Modes, float, float, float]]) -> List[Optional[dict]]:
+        """
+        Synthesize every impact sound on this frame.
+
+        :param impacts: The impact events on this frame. Each element is a tuple: The index of the command, the primary ID, the secondary ID, the contact points, the amp, and the parameters of `PyImpact._synth_impact_modes()`.
+
+        :return: A command per impact, in the same order as `impacts`. A command can be None.
+        """
+
+        if len(impacts) == 0:
+            return []
+        # Each impact sound is independent of the others, so they can be synthesized in parallel.
+        # numpy and scipy release the GIL while summing the modes and convolving the force.
+        if len(impacts) > 1 and cpu_count() is not None and cpu_count() > 1:
+            if PyImpact._IMPACT_EXECUTOR is None:
+                PyImpact._IMPACT_EXECUTOR = ThreadPoolExecutor()
+            sounds = list(PyImpact._IMPACT_EXECUTOR.map(PyImpact._synth_impact_modes,
+                                                        *zip(*[impact[5:] for impact in impacts])))
+        else:
+            sounds = [PyImpact._synth_impact_modes(*impact[5:]) for impact in impacts]
+        # Normalize the sounds and get the commands in order because the throttling depends on previous impacts.
+        commands: List[Optional[dict]] = list()
+        for impact, sound in zip(impacts, sounds):
+            sound = self._get_impact_sound(primary_id=impact[1], secondary_id=impact[2], sound=sound, amp=impact[4])
+            commands.append(self._get_impact_sound_command(primary_id=impact[1], contact_points=impact[3],
+                                                           sound=sound))
+        return commands
 
     def _get_impulse_response(self, velocity: np.array, contact_normals: List[np.array], primary_id: int,
                               primary_material: str, primary_amp: float, primary_mass: float,
@@ -665,13 +829,15 @@ class PyImpact(CollisionManager):
         :return The impulse response and the frequency.
         """
 
-        self.get_impact_sound(velocity=velocity, contact_normals=contact_normals, primary_id=primary_id,
-                              primary_material=primary_material, primary_amp=primary_amp, primary_mass=primary_mass,
-                              secondary_id=secondary_id, secondary_material=secondary_material,
-                              secondary_amp=secondary_amp, secondary_mass=secondary_mass, primary_resonance=primary_resonance, secondary_resonance=secondary_resonance)
-
-        modes_1 = self.object_modes[secondary_id][primary_id].obj1_modes
-        modes_2 = self.object_modes[secondary_id][primary_id].obj2_modes
+        # Update the modes without synthesizing an impact sound.
+        modes_1, modes_2, amp, mass = self._update_modes(velocity=velocity, contact_normals=contact_normals,
+                                                         primary_id=primary_id, primary_material=primary_material,
+                                                         primary_amp=primary_amp, primary_mass=primary_mass,
+                                                         secondary_id=secondary_id,
+                                                         secondary_material=secondary_material,
+                                                         secondary_amp=secondary_amp, secondary_mass=secondary_mass)
+        # Count the collisions.
+        self.object_modes[secondary_id][primary_id].count_collisions()
         h1 = modes_1.sum_modes(resonance=primary_resonance)
         h2 = modes_2.sum_modes(resonance=secondary_resonance)
         h = Modes.mode_add(h1, h2)
@@ -718,11 +884,20 @@ class PyImpact(CollisionManager):
         if sound is None:
             return None
         else:
-            # Use random audio source IDs so that multiple scrape sound chunks can play at the same time.
-            return self._get_audio_command(audio_source_id=int.from_bytes(urandom(3), byteorder='big'),
+            return self._get_audio_command(audio_source_id=self._get_scrape_audio_source_id(primary_id=primary_id),
                                            contact_points=contact_points,
                                            sound=sound)
 
+    def _get_scrape_audio_source_id(self, primary_id: int) -> int:
+        """
+        :param primary_id: The object ID for the primary (target) object.
+
+        :return: The audio source ID of a scrape sound chunk.
+        """
+
+        # Use random audio source IDs so that multiple scrape sound chunks can play at the same time.
+        return int(self.rng.randint(0, 2 ** 24))
+
     def get_scrape_sound(self, velocity: np.array, contact_normals: List[np.array], primary_id: int,
                          primary_material: str, primary_amp: float, primary_mass: float,
                          secondary_id: int, secondary_material: str, secondary_amp: float, secondary_mass: float,
@@ -753,17 +928,18 @@ class PyImpact(CollisionManager):
         if scrape_key not in self._scrape_previous_indices:
             self._scrape_previous_indices[scrape_key] = 0
 
-        # Initialize scrape variables; if this is an in=process scrape, these will be replaced bu te stored values.
-        summed_master = AudioSegment.silent(duration=2000, frame_rate=SAMPLE_RATE)
-        scrape_event_count = 0
-
         # Is this a new scrape?
-        if scrape_key in self._scrape_summed_masters:
-            summed_master = self._scrape_summed_masters[scrape_key]
+        if scrape_key in self._scrape_buffers:
+            scrape_buffer = self._scrape_buffers[scrape_key]
             scrape_event_count = self._scrape_events_count[scrape_key]
         else:
-            # No -- add initialized values to dictionaries.
-            self._scrape_summed_masters[scrape_key] = summed_master
+            # Yes -- get an empty ring buffer.
+            if len(self._free_scrape_buffers) > 0:
+                scrape_buffer = self._free_scrape_buffers.pop()
+            else:
+                scrape_buffer = np.zeros(PyImpact._SCRAPE_BUFFER_LENGTH, dtype=np.float32)
+            scrape_event_count = 0
+            self._scrape_buffers[scrape_key] = scrape_buffer
             self._scrape_events_count[scrape_key] = scrape_event_count
 
         # Get magnitude of velocity of the scraping object.
@@ -849,36 +1025,24 @@ class PyImpact(CollisionManager):
         conv1 = sg.fftconvolve(scraping_ir, t_force1)
         conv2 = sg.fftconvolve(scraping_ir, t_force2)
 
-        # Again, we need this as an AudioSegment for overlaying with the previous frame's segment.
-        # Convert to 16-bit integers for Unity, normalizing to make sure to minimize loss of precision from truncating floating values.
-        normalized_noise_ints_conv1 = PyImpact._normalize_16bit_int(conv1)
-        noise_seg_conv1 = AudioSegment(normalized_noise_ints_conv1.tobytes(),
-                                       frame_rate=SAMPLE_RATE,
-                                       sample_width=SAMPLE_WIDTH,
-                                       channels=CHANNELS)
-
-        normalized_noise_ints_conv2 = PyImpact._normalize_16bit_int(conv2)
-        noise_seg_conv2 = AudioSegment(normalized_noise_ints_conv2.tobytes(),
-                                       frame_rate=SAMPLE_RATE,
-                                       sample_width=SAMPLE_WIDTH,
-                                       channels=CHANNELS)
-
-        # Gain-adjust the convolved segment using db value computed earlier.
-        noise_seg_conv1 = noise_seg_conv1.apply_gain(db1)
-        noise_seg_conv2 = noise_seg_conv2.apply_gain(db2)
-
-        noise_seg_conv = noise_seg_conv1.overlay(noise_seg_conv2)
-        # Apply roughness gain.
-        noise_seg_conv = noise_seg_conv.apply_gain(self.scrape_surface_data[scrape_material]["r_gain"])
-
-        # Pad the end of master with 100ms of silence, the start of the current segment with (n * 100ms) of silence, and overlay.
-        summed_master = summed_master + PyImpact.SILENCE_100MS
-        summed_master = summed_master.overlay(noise_seg_conv, position=100 * scrape_event_count)
-        # Extract 100ms "chunk" of sound to send over to Unity.
-        start_idx = 100 * scrape_event_count
-        unity_chunk = summed_master[start_idx:start_idx + 100]
-        # Update stored summed waveform.
-        self._scrape_summed_masters[scrape_key] = summed_master
+        # Normalize each convolved segment to the 16-bit range and gain-adjust it using the db values computed earlier.
+        # Then apply the roughness gain.
+        num_samples = min(len(conv1), PyImpact._SCRAPE_BUFFER_LENGTH)
+        gain = PyImpact._db_to_float(self.scrape_surface_data[scrape_material]["r_gain"])
+        segment = PyImpact._normalize_floats(conv1)[:num_samples] * (32767 * PyImpact._db_to_float(db1) * gain)
+        segment += PyImpact._normalize_floats(conv2)[:num_samples] * (32767 * PyImpact._db_to_float(db2) * gain)
+        np.clip(segment, -32768, 32767, out=segment)
+
+        # The ring buffer holds the next 2100ms of the scrape. The current 100ms chunk starts at the head of the buffer.
+        # Overlap-add the segment, wrapping around the end of the buffer.
+        head = (scrape_event_count % 21) * PyImpact._SCRAPE_CHUNK_LENGTH
+        num_tail_samples = min(num_samples, PyImpact._SCRAPE_BUFFER_LENGTH - head)
+        scrape_buffer[head: head + num_tail_samples] += segment[:num_tail_samples]
+        scrape_buffer[:num_samples - num_tail_samples] += segment[num_tail_samples:]
+        # Extract 100ms "chunk" of sound to send over to Unity. Clear the chunk so that it can be reused 2100ms later.
+        chunk = scrape_buffer[head: head + PyImpact._SCRAPE_CHUNK_LENGTH]
+        chunk_bytes = np.clip(chunk, -32768, 32767).astype(np.int16).tobytes()
+        chunk.fill(0)
 
         # Update scrape event count.
         scrape_event_count += 1
@@ -886,9 +1050,8 @@ class PyImpact(CollisionManager):
         # Scrape data is handled differently than impact data, so we'll create a dummy object first.
         sound = Base64Sound(np.array([0]))
         # Set the audio data.
-        sound.wav_str = base64.b64encode(unity_chunk.raw_data).decode()
-        sound.length = len(unity_chunk.raw_data)
-        sound.bytes = unity_chunk.raw_data
+        sound.length = len(chunk_bytes)
+        sound.bytes = chunk_bytes
         return sound
 
     @staticmethod
@@ -917,7 +1080,8 @@ class PyImpact(CollisionManager):
         n_pts = int(np.ceil(max_t * 44100))
         tt = np.linspace(0, np.pi, n_pts)
         frc = np.sin(tt)
-        x = sg.fftconvolve(h, frc)
+        # The force kernel is very short, so overlap-add convolution is faster than a single FFT of the whole signal.
+        x = sg.oaconvolve(h, frc)
         x = x / abs(np.max(x))
         return x
 
@@ -978,13 +1142,18 @@ class PyImpact(CollisionManager):
         # Clear collision data.
         self.collision_events.clear()
         # Clear scrape data.
-        self._scrape_summed_masters.clear()
+        for scrape_key in self._scrape_buffers:
+            self._scrape_buffers[scrape_key].fill(0)
+            self._free_scrape_buffers.append(self._scrape_buffers[scrape_key])
+        self._scrape_buffers.clear()
         self._scrape_start_velocities.clear()
         self._scrape_events_count.clear()
         self._scrape_previous_indices.clear()
         self._excluded_objects.clear()
         # Clear impact count.
         self._impact_events.clear()
+        # Reset the simulation clock.
+        self.time = 0
         # Clear ongoing commands.
         self.commands.clear()
         # Stop all ongoing audio.
@@ -1180,6 +1349,16 @@ class PyImpact(CollisionManager):
 
         return (normalized_floats * 32767).astype(np.int16)
 
+    @staticmethod
+    def _db_to_float(db: float) -> float:
+        """
+        :param db: A gain value in decibels.
+
+        :return: The gain as an amplitude ratio.
+        """
+
+        return 10 ** (db / 20)
+
     @staticmethod
     def _normalize_floats(arr: np.array) -> np.array:
         """
@@ -1204,8 +1383,11 @@ class PyImpact(CollisionManager):
 
         if scrape_key in self._scrape_events_count:
             del self._scrape_events_count[scrape_key]
-        if scrape_key in self._scrape_summed_masters:
-            del self._scrape_summed_masters[scrape_key]
+        if scrape_key in self._scrape_buffers:
+            # Clear the ring buffer and reuse it for the next scrape.
+            self._scrape_buffers[scrape_key].fill(0)
+            self._free_scrape_buffers.append(self._scrape_buffers[scrape_key])
+            del self._scrape_buffers[scrape_key]
         if scrape_key in self._scrape_start_velocities:
             del self._scrape_start_velocities[scrape_key]
         if scrape_key in self._scrape_previous_indices:
@@ -1227,4 +1409,4 @@ class PyImpact(CollisionManager):
                 "num_frames": sound.length,
                 "num_channels": CHANNELS,
                 "frame_rate": SAMPLE_RATE,
-                "wav_data": sound.wav_str}
+                "wav_data": sound.bytes}
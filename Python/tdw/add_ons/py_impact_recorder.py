@@ -0,0 +1,130 @@
+import gzip
+from struct import pack
+from pathlib import Path
+from typing import List, Dict, Union, Optional, BinaryIO
+from tdw.output_data import OutputData
+from tdw.add_ons.add_on import AddOn
+
+
+class PyImpactRecorder(AddOn):
+    """
+    Record the output data that [`PyImpact`](py_impact.md) uses to generate audio: collisions, rigidbodies, segmentation colors, etc.
+
+    The recording can be rendered to a .wav file later without a build by [`PyImpactRenderer`](../physics_audio/py_impact_renderer.md). This way, the same physics simulation can be re-synthesized many times with different PyImpact parameters.
+
+    This add-on sends the same output data commands as `PyImpact`. You don't need to add `PyImpact` to the controller to record a physics simulation.
+
+    The simulation time that elapses per frame is recorded as well, including any changes caused by `set_time_step` or `step_physics` commands.
+    """
+
+    """:class_var
+    The IDs of the output data that will be recorded.
+    """
+    OUTPUT_DATA_IDS: List[str] = ["coll", "enco", "rigi", "rojv", "boun", "segm", "srob", "srig", "soct"]
+    # Static output data. This is usually only sent on the first frame, so it's cached and written to the start of each recording.
+    _STATIC_OUTPUT_DATA_IDS: List[str] = ["boun", "segm", "srob", "srig", "soct"]
+    # The default physics time step.
+    _DEFAULT_TIME_STEP: float = 0.01
+
+    def __init__(self):
+        super().__init__()
+        """:field
+        The path to the current recording.
+        """
+        self.path: Path = Path.home()
+        """:field
+        If False, there is an ongoing recording.
+        """
+        self.done: bool = True
+        # The recording file.
+        self._file: Optional[BinaryIO] = None
+        # The number of frames in the current recording.
+        self._num_frames: int = 0
+        # The most recent static output data. Key = The output data ID. Value = The output data.
+        self._static_output_data: Dict[str, bytes] = dict()
+        # The physics time step. See command `set_time_step`.
+        self._time_step: float = PyImpactRecorder._DEFAULT_TIME_STEP
+        # The simulation time that will elapse on the next `communicate()` call.
+        self._frame_duration: float = PyImpactRecorder._DEFAULT_TIME_STEP
+
+    def get_initialization_commands(self) -> List[dict]:
+        return [{"$type": "send_bounds"},
+                {"$type": "send_rigidbodies",
+                 "frequency": "always"},
+                {"$type": "send_robot_joint_velocities",
+                 "frequency": "always"},
+                {"$type": "send_collisions",
+                 "enter": True,
+                 "exit": True,
+                 "stay": True,
+                 "collision_types": ["obj", "env"]},
+                {"$type": "send_static_robots"},
+                {"$type": "send_segmentation_colors"},
+                {"$type": "send_static_rigidbodies"},
+                {"$type": "send_static_oculus_touch"}]
+
+    def before_send(self, commands: List[dict]) -> None:
+        # Get the simulation time that will elapse on this frame.
+        num_frames = 1
+        for command in commands:
+            if command["$type"] == "set_time_step":
+                self._time_step = command["time_step"] if "time_step" in command else PyImpactRecorder._DEFAULT_TIME_STEP
+            elif command["$type"] == "step_physics":
+                num_frames += command["frames"]
+        self._frame_duration = self._time_step * num_frames
+
+    def on_send(self, resp: List[bytes]) -> None:
+        frame: List[bytes] = list()
+        static_output_data_ids: List[str] = list()
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id in PyImpactRecorder.OUTPUT_DATA_IDS:
+                frame.append(resp[i])
+                if r_id in PyImpactRecorder._STATIC_OUTPUT_DATA_IDS:
+                    self._static_output_data[r_id] = resp[i]
+                    static_output_data_ids.append(r_id)
+        if self.done:
+            return
+        # Write the cached static output data at the start of the recording.
+        if self._num_frames == 0:
+            frame = [self._static_output_data[r_id] for r_id in self._static_output_data
+                     if r_id not in static_output_data_ids] + frame
+        # Add the frame number.
+        frame.append(resp[-1])
+        # Write the number of output data objects and the duration of the frame.
+        self._file.write(pack("<If", len(frame), self._frame_duration))
+        for data in frame:
+            self._file.write(pack("<I", len(data)))
+            self._file.write(data)
+        self._num_frames += 1
+
+    def start(self, path: Union[str, Path]) -> None:
+        """
+        Start recording.
+
+        :param path: The path to the output file.
+        """
+
+        # Don't start a new recording if one is ongoing.
+        if not self.done:
+            return
+        self.done = False
+        if isinstance(path, str):
+            self.path = Path(path)
+        else:
+            self.path = path
+        if not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True)
+        self._file = gzip.open(str(self.path.resolve()), "wb")
+        self._num_frames = 0
+
+    def stop(self) -> None:
+        """
+        Stop an ongoing recording and close the file.
+        """
+
+        if self.done:
+            return
+        self._file.close()
+        self._file = None
+        self.done = True
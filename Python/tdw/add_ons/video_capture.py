@@ -0,0 +1,246 @@
+from pathlib import Path
+from shutil import which
+from queue import Queue
+from subprocess import Popen, PIPE
+from threading import Thread
+from typing import List, Dict, Union, Optional
+from tdw.add_ons.add_on import AddOn
+from tdw.output_data import OutputData, Images
+
+
+class _VideoEncoder:
+    """
+    A long-lived ffmpeg process that encodes one avatar's images to a video file.
+    Images are written to ffmpeg's stdin in a background thread.
+    """
+
+    def __init__(self, args: List[str], log_path: Path, max_queue_size: int):
+        """
+        :param args: The ffmpeg command line arguments.
+        :param log_path: The path to the ffmpeg log file.
+        :param max_queue_size: The maximum number of images waiting to be encoded.
+        """
+
+        self._log = log_path.open("wb")
+        try:
+            self._process: Popen = Popen(args, stdin=PIPE, stdout=self._log, stderr=self._log)
+        except OSError as e:
+            self._log.close()
+            raise Exception(f"Couldn't launch ffmpeg: {args[0]} ({e})")
+        # A value of None signals the thread to stop.
+        self._queue: Queue = Queue(maxsize=max_queue_size)
+        # If not None, writing to ffmpeg failed.
+        self.error: Optional[Exception] = None
+        self._thread: Thread = Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def put(self, image: bytes) -> None:
+        """
+        Add an image to the queue. If the queue is full, this blocks until there is space.
+
+        :param image: The encoded image.
+        """
+
+        self._queue.put(image)
+
+    def close(self) -> int:
+        """
+        Wait for the queued images to be encoded and finish the video.
+
+        :return: The ffmpeg exit code.
+        """
+
+        self._queue.put(None)
+        self._thread.join()
+        code = self._process.wait()
+        self._log.close()
+        return code
+
+    def _write(self) -> None:
+        """
+        Write queued images to ffmpeg until `None` is dequeued.
+        """
+
+        while True:
+            image = self._queue.get()
+            if image is None:
+                break
+            # Keep dequeuing after an error so that `put()` never blocks forever.
+            if self.error is not None:
+                continue
+            try:
+                self._process.stdin.write(image)
+            except (BrokenPipeError, OSError) as e:
+                self.error = e
+        try:
+            self._process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+
+class VideoCapture(AddOn):
+    """
+    Request image data and encode it to a video file per avatar while the simulation is running.
+
+    Each avatar's `_img` pass is piped to a long-lived [ffmpeg](https://www.ffmpeg.org/) process in a background thread. Images aren't saved to disk or decoded in Python, and each video is ready as soon as `stop()` is called.
+
+    ffmpeg must be installed and in your path environment variable.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.tdw_utils import TDWUtils
+    from tdw.add_ons.third_person_camera import ThirdPersonCamera
+    from tdw.add_ons.video_capture import VideoCapture
+
+    c = Controller()
+    camera = ThirdPersonCamera(position={"x": 2, "y": 1.6, "z": -1},
+                               look_at={"x": 0, "y": 0, "z": 0},
+                               avatar_id="a")
+    video = VideoCapture(path="D:/video_capture_test", avatar_ids=["a"], framerate=60)
+    c.add_ons.extend([camera, video])
+    c.communicate([TDWUtils.create_empty_room(12, 12),
+                   {"$type": "set_target_framerate",
+                    "framerate": 60}])
+    for i in range(100):
+        c.communicate([])
+    # Finish the video.
+    video.stop()
+    c.communicate({"$type": "terminate"})
+    ```
+
+    If ffmpeg is slower than the simulation, images are queued. If there are `max_queue_size` queued images for an avatar, `c.communicate()` waits until there is space in the queue.
+    """
+
+    def __init__(self, path: Union[str, Path], avatar_ids: List[str] = None, framerate: int = 60, png: bool = False,
+                 ffmpeg: str = "ffmpeg", output_args: List[str] = None, extension: str = "mp4",
+                 max_queue_size: int = 30):
+        """
+        :param path: The path to the output directory. Each avatar's video will be saved to `path/avatar_id.extension`.
+        :param avatar_ids: The IDs of the avatars that will capture images. If None, all avatars will capture images. Note that these avatars must already exist in the scene (if you've added the avatars via a [`ThirdPersonCamera` add-on](third_person_camera.md), you must add the `ThirdPersonCamera` first, *then* `VideoCapture`).
+        :param framerate: The framerate of the video. This should usually be the same as the target framerate of the build.
+        :param png: If True, the build will send lossless png images. If False, the build will send jpg images, which are smaller and faster to encode.
+        :param ffmpeg: The path to the ffmpeg executable. If the executable can't be found, this raises an exception.
+        :param output_args: ffmpeg output arguments. If None, defaults to `["-vcodec", "libx264", "-pix_fmt", "yuv420p"]`.
+        :param extension: The file extension of the video files.
+        :param max_queue_size: The maximum number of images per avatar that are waiting to be encoded.
+        """
+
+        super().__init__()
+        if which(ffmpeg) is None:
+            raise Exception(f"ffmpeg not found: {ffmpeg}. Install ffmpeg and add it to your path environment variable, or set the ffmpeg parameter to the path to the ffmpeg executable.")
+        if isinstance(path, str):
+            """:field
+            The path to the output directory.
+            """
+            self.path: Path = Path(path)
+        else:
+            self.path: Path = path
+        if not self.path.exists():
+            self.path.mkdir(parents=True)
+        """:field
+        The IDs of the avatars that will capture images. If empty, all avatars will capture images.
+        """
+        self.avatar_ids: List[str] = [] if avatar_ids is None else avatar_ids
+        """:field
+        The number of frames that have been sent to the encoder per avatar. Key = The avatar ID.
+        """
+        self.frames: Dict[str, int] = dict()
+        """:field
+        If True, the videos have been finished and no more images will be captured.
+        """
+        self.done: bool = False
+        self._framerate: int = framerate
+        self._png: bool = png
+        self._ffmpeg: str = ffmpeg
+        self._output_args: List[str] = ["-vcodec", "libx264", "-pix_fmt", "yuv420p"] if output_args is None else output_args
+        self._extension: str = extension
+        self._max_queue_size: int = max_queue_size
+        # The encoder of each avatar. Key = The avatar ID.
+        self._encoders: Dict[str, _VideoEncoder] = dict()
+
+    def get_initialization_commands(self) -> List[dict]:
+        commands = [{"$type": "set_img_pass_encoding",
+                     "value": self._png}]
+        commands.extend([{"$type": "set_pass_masks",
+                          "pass_masks": ["_img"],
+                          "avatar_id": avatar_id} for avatar_id in self.avatar_ids])
+        commands.append({"$type": "send_images",
+                         "frequency": "once",
+                         "ids": self.avatar_ids})
+        return commands
+
+    def on_send(self, resp: List[bytes]) -> None:
+        if self.done:
+            return
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id == "imag":
+                images = Images(resp[i])
+                avatar_id = images.get_avatar_id()
+                if len(self.avatar_ids) > 0 and avatar_id not in self.avatar_ids:
+                    continue
+                for j in range(images.get_num_passes()):
+                    if images.get_pass_mask(j) == "_img":
+                        encoder = self._get_encoder(avatar_id=avatar_id)
+                        if encoder.error is not None:
+                            raise Exception(f"Failed to encode video for avatar {avatar_id}: {encoder.error}. "
+                                            f"See the log file in: {self.path.resolve()}")
+                        encoder.put(images.get_image(j).tobytes())
+                        self.frames[avatar_id] += 1
+                        break
+        # Request images on the next frame.
+        # We can't use the "always" value because of cases like that Magnebot that will turn off image capture.
+        self.commands.append({"$type": "send_images",
+                              "frequency": "once",
+                              "ids": self.avatar_ids})
+
+    def stop(self) -> None:
+        """
+        Stop capturing images and finish each video. This waits for the queued images to be encoded.
+        """
+
+        if self.done:
+            return
+        self.done = True
+        self.commands.append({"$type": "send_images",
+                              "frequency": "never"})
+        errors: List[str] = list()
+        for avatar_id in self._encoders:
+            encoder = self._encoders[avatar_id]
+            code = encoder.close()
+            if encoder.error is not None or code != 0:
+                errors.append(avatar_id)
+        self._encoders.clear()
+        if len(errors) > 0:
+            raise Exception(f"Failed to encode video for avatars: {errors}. "
+                            f"See the log files in: {self.path.resolve()}")
+
+    def get_video_path(self, avatar_id: str) -> Path:
+        """
+        :param avatar_id: The avatar ID.
+
+        :return: The path to the avatar's video file.
+        """
+
+        return self.path.joinpath(f"{avatar_id}.{self._extension}")
+
+    def _get_encoder(self, avatar_id: str) -> _VideoEncoder:
+        """
+        :param avatar_id: The avatar ID.
+
+        :return: The avatar's encoder. If there isn't one yet, an ffmpeg process is launched.
+        """
+
+        if avatar_id not in self._encoders:
+            args = [self._ffmpeg, "-y",
+                    "-f", "image2pipe",
+                    "-framerate", str(self._framerate),
+                    "-c:v", "png" if self._png else "mjpeg",
+                    "-i", "-"]
+            args.extend(self._output_args)
+            args.append(str(self.get_video_path(avatar_id=avatar_id).resolve()))
+            self._encoders[avatar_id] = _VideoEncoder(args=args,
+                                                      log_path=self.path.joinpath(f"{avatar_id}.log"),
+                                                      max_queue_size=self._max_queue_size)
+            self.frames[avatar_id] = 0
+        return self._encoders[avatar_id]
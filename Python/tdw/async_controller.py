@@ -0,0 +1,205 @@
+from asyncio import Lock
+from inspect import isawaitable
+from threading import Thread
+from typing import List, Union, Tuple, Optional
+import zmq
+import zmq.asyncio
+from tdw.controller import Controller
+from tdw.add_ons.add_on import AddOn
+from tdw.output_data import Version
+
+
+class AsyncController(Controller):
+    """
+    A controller for [asyncio](https://docs.python.org/3/library/asyncio.html) applications. `communicate()` is a coroutine that doesn't block the event loop while it waits for the build.
+
+    This works the same way as a [`Controller`](controller.md), with the same add-on lifecycle and the same error handling, except that `communicate()` and `get_version()` must be awaited. Static functions such as `get_add_object()` are the same as in `Controller`.
+
+    The controller connects to the build the first time that `communicate()` is called.
+
+    ```python
+    import asyncio
+    from tdw.async_controller import AsyncController
+    from tdw.tdw_utils import TDWUtils
+
+
+    async def main():
+        c = AsyncController()
+        await c.communicate([TDWUtils.create_empty_room(12, 12),
+                             c.get_add_object(model_name="iron_box",
+                                              position={"x": 0, "y": 0, "z": 0},
+                                              object_id=c.get_unique_id())])
+        for i in range(100):
+            resp = await c.communicate([])
+        await c.communicate({"$type": "terminate"})
+
+    asyncio.run(main())
+    ```
+
+    ## Coroutine add-ons
+
+    Any add-on can be used with an `AsyncController`. Additionally, an add-on's `get_initialization_commands()`, `before_send()`, and `on_send()` functions can be coroutines, in which case the `AsyncController` awaits them. This is useful for add-ons that do slow work such as writing images to disk in a thread pool. Add-ons are awaited in order, one at a time, so an add-on can always use the data of add-ons that are earlier in the `add_ons` list. Coroutine add-ons can't be used with a `Controller`.
+
+    ```python
+    import asyncio
+    from typing import List
+    from tdw.add_ons.add_on import AddOn
+    from tdw.output_data import OutputData, Images
+    from tdw.tdw_utils import TDWUtils
+
+
+    class AsyncImageWriter(AddOn):
+        def __init__(self, path: str):
+            super().__init__()
+            self.path: str = path
+            self.frame: int = 0
+
+        def get_initialization_commands(self) -> List[dict]:
+            return [{"$type": "send_images",
+                     "frequency": "always"}]
+
+        async def on_send(self, resp: List[bytes]) -> None:
+            loop = asyncio.get_event_loop()
+            for i in range(len(resp) - 1):
+                if OutputData.get_data_type_id(resp[i]) == "imag":
+                    # Save the images in a thread pool.
+                    await loop.run_in_executor(None, TDWUtils.save_images, Images(resp[i]),
+                                               TDWUtils.zero_padding(self.frame, 4), self.path)
+            self.frame += 1
+    ```
+    """
+
+    def __init__(self, port: int = 1071, check_version: bool = True, launch_build: bool = True, ipc: bool = False):
+        """
+        Create the network socket and bind the socket to the port. Unlike `Controller`, this doesn't wait for the build to connect.
+
+        :param port: The port number.
+        :param check_version: If true, the controller will check the version of the build and print the result. The tdw Python module is compared to the latest version on PyPi in a background thread, so this never delays the controller.
+        :param launch_build: If True, automatically launch the build. If one doesn't exist, download and extract the correct version. Set this to False to use your own build, or (if you are a backend developer) to use Unity Editor.
+        :param ipc: If True, the socket is also bound to an inter-process communication endpoint (see `Controller.get_ipc_endpoint(port)`).
+        """
+
+        # `Controller.__init__()` isn't called because it would wait for the build.
+        # A list of modules that will add commands on `communicate()`.
+        self.add_ons: List[AddOn] = list()
+
+        # Compare the installed version of the tdw Python module to the latest on PyPi.
+        if check_version:
+            Thread(target=Controller._check_pypi_version, daemon=True).start()
+
+        # Launch the build.
+        if launch_build:
+            Controller.launch_build(port=port)
+        self.socket = Controller._bind_socket(context=zmq.asyncio.Context(), port=port, ipc=ipc)
+        self._is_standalone: bool = False
+        self._tdw_version: str = ""
+        self._unity_version: str = ""
+        self._check_version: bool = check_version and launch_build
+        # If True, the controller received the build's first message.
+        self._connected: bool = False
+        # Only one `communicate()` call can use the socket at a time.
+        # This is created in `communicate()` because in older versions of Python, a lock is bound to the event loop when it is created.
+        self._lock: Optional[Lock] = None
+
+    async def communicate(self, commands: Union[dict, List[dict]]) -> list:
+        """
+        Send commands and receive output data in response. This doesn't block the event loop.
+
+        If there are concurrent `communicate()` calls, they are sent to the build one at a time in the order that they were called.
+
+        :param commands: A list of JSON commands.
+
+        :return The output data from the build.
+        """
+
+        if self._lock is None:
+            self._lock = Lock()
+        async with self._lock:
+            if not self._connected:
+                await self._connect()
+
+            if isinstance(commands, dict):
+                commands = [commands]
+
+            # Append commands from each add-on.
+            for m in self.add_ons:
+                # Initialize an add-on.
+                if not m.initialized:
+                    commands.extend(await AsyncController._await(m.get_initialization_commands()))
+                    m.initialized = True
+                # Append the add-on's commands.
+                else:
+                    commands.extend(m.commands)
+                    m.commands.clear()
+            # Possibly do something with the commands about to be sent.
+            for m in self.add_ons:
+                await AsyncController._await(m.before_send(commands))
+
+            resp = await self._send(msg=[Controller._serialize_commands(commands)])
+
+            # Get commands per module for the next frame.
+            for m in self.add_ons:
+                await AsyncController._await(m.on_send(resp=resp))
+
+            # Return the output data from the build.
+            return resp
+
+    async def get_version(self) -> Tuple[str, str]:
+        """
+        Send a send_version command to the build.
+
+        :return The TDW version and the Unity Engine version.
+        """
+
+        resp = await self.communicate({"$type": "send_version"})
+        for r in resp[:-1]:
+            if Version.get_data_type_id(r) == "vers":
+                v = Version(r)
+                return v.get_tdw_version(), v.get_unity_version()
+        if len(resp) == 1:
+            raise Exception("Tried receiving version output data but didn't receive anything!")
+        raise Exception(f"Expected output data with ID version but got: " + Version.get_data_type_id(resp[0]))
+
+    async def _connect(self) -> None:
+        """
+        Wait for the build's first message, send the startup commands, and check the version of the build.
+        """
+
+        await self.socket.recv()
+        self._connected = True
+        resp = await self._send(msg=[Controller._serialize_commands(Controller._get_startup_commands())])
+        self._set_version(resp=resp)
+        # Compare the version of the tdw module to the build version.
+        if self._check_version:
+            self._check_build_version()
+
+    async def _send(self, msg: List[bytes]) -> List[bytes]:
+        """
+        Send a message to the build and receive a response. Re-send the message if the build failed to receive it.
+
+        :param msg: The message.
+
+        :return: The response from the build.
+        """
+
+        await self.socket.send_multipart(msg)
+        resp = await self.socket.recv_multipart()
+        num_ftre: int = 0
+        while Controller._failed_to_receive(resp=resp) and num_ftre < Controller._MAX_NUM_FTRE:
+            await self.socket.send_multipart(msg)
+            resp = await self.socket.recv_multipart()
+            num_ftre += 1
+        self._check_response(resp=resp)
+        return resp
+
+    @staticmethod
+    async def _await(value):
+        """
+        :param value: The value returned by an add-on function.
+
+        :return: The value, or the result of the value if it is awaitable.
+        """
+
+        if isawaitable(value):
+            return await value
+        return value
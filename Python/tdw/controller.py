@@ -1,18 +1,19 @@
 import zmq
 import json
 import os
+import numpy as np
+from base64 import b64encode
 from subprocess import Popen
-from typing import List, Union, Tuple, Dict
+from tempfile import gettempdir
+from pathlib import Path
+from threading import Thread
+from typing import List, Union, Tuple, Dict, Optional
 from tdw.librarian import ModelLibrarian, SceneLibrarian, MaterialLibrarian, HDRISkyboxLibrarian, \
-    HumanoidAnimationLibrarian, HumanoidLibrarian, HumanoidAnimationRecord, RobotLibrarian
+    HumanoidAnimationLibrarian, HumanoidLibrarian, HumanoidAnimationRecord, RobotLibrarian, ModelRecord
 from tdw.backend.paths import EDITOR_LOG_PATH, PLAYER_LOG_PATH
 from tdw.output_data import Version, QuitSignal
-from tdw.release.build import Build
-from tdw.release.pypi import PyPi
 from tdw.version import __version__
 from tdw.add_ons.add_on import AddOn
-from tdw.physics_audio.object_audio_static import DEFAULT_OBJECT_AUDIO_STATIC_DATA
-from tdw.physics_audio.audio_material import AudioMaterial
 from tdw.physics_audio.audio_material_constants import STATIC_FRICTION, DYNAMIC_FRICTION, DENSITIES
 
 
@@ -35,14 +36,22 @@ class Controller:
     HUMANOID_LIBRARIANS: Dict[str, HumanoidLibrarian] = dict()
     HUMANOID_ANIMATION_LIBRARIANS: Dict[str, HumanoidAnimationLibrarian] = dict()
     ROBOT_LIBRARIANS: Dict[str, RobotLibrarian] = dict()
+    DEFAULT_PHYSICS_INDEX: Optional["DefaultPhysicsIndex"] = None
+    # `bytes` values in commands are temporarily replaced by this string when the commands are serialized.
+    _BYTES_PLACEHOLDER: str = "\x00tdw_bytes\x00"
+    # `Controller._BYTES_PLACEHOLDER` as it appears in the serialized commands.
+    _BYTES_PLACEHOLDER_JSON: bytes = json.dumps(_BYTES_PLACEHOLDER).encode("utf-8")
+    # The maximum number of times that commands are re-sent if the build fails to receive them.
+    _MAX_NUM_FTRE: int = 1000
 
-    def __init__(self, port: int = 1071, check_version: bool = True, launch_build: bool = True):
+    def __init__(self, port: int = 1071, check_version: bool = True, launch_build: bool = True, ipc: bool = False):
         """
         Create the network socket and bind the socket to the port.
 
         :param port: The port number.
-        :param check_version: If true, the controller will check the version of the build and print the result.
+        :param check_version: If true, the controller will check the version of the build and print the result. The tdw Python module is compared to the latest version on PyPi in a background thread, so this never delays the controller.
         :param launch_build: If True, automatically launch the build. If one doesn't exist, download and extract the correct version. Set this to False to use your own build, or (if you are a backend developer) to use Unity Editor.
+        :param ipc: If True, the socket is also bound to an inter-process communication endpoint (see `Controller.get_ipc_endpoint(port)`). A build or other peer on the same machine that supports IPC can connect to this endpoint instead of the TCP port, which is faster for large output data such as images. The TCP port is always bound, so peers that don't support IPC can still connect.
         """
 
         # A list of modules that will add commands on `communicate()`.
@@ -50,35 +59,24 @@ class Controller:
 
         # Compare the installed version of the tdw Python module to the latest on PyPi.
         # If there is a difference, recommend an upgrade.
+        # This is done in a background thread so that the controller doesn't wait for the network.
         if check_version:
-            self._check_pypi_version()
+            Thread(target=Controller._check_pypi_version, daemon=True).start()
 
         # Launch the build.
         if launch_build:
             Controller.launch_build(port=port)
-        context = zmq.Context()
-        # noinspection PyUnresolvedReferences
-        self.socket = context.socket(zmq.REP)
-        self.socket.bind('tcp://*:' + str(port))
+        self.socket = Controller._bind_socket(context=zmq.Context(), port=port, ipc=ipc)
 
         self.socket.recv()
 
         # Set error handling to default values (the build will try to quit on errors and exceptions).
         # Request the version to log it and remember here if the Editor is being used.
-        resp = self.communicate([{"$type": "set_error_handling"},
-                                 {"$type": "send_version"},
-                                 {"$type": "load_scene",
-                                  "scene_name": "ProcGenScene"}])
+        resp = self.communicate(Controller._get_startup_commands())
         self._is_standalone: bool = False
         self._tdw_version: str = ""
         self._unity_version: str = ""
-        for r in resp[:-1]:
-            if Version.get_data_type_id(r) == "vers":
-                v = Version(r)
-                self._tdw_version = v.get_tdw_version()
-                self._unity_version = v.get_unity_version()
-                self._is_standalone = v.get_standalone()
-                break
+        self._set_version(resp=resp)
         # Compare the version of the tdw module to the build version.
         if check_version and launch_build:
             self._check_build_version()
@@ -87,6 +85,8 @@ class Controller:
         """
         Send commands and receive output data in response.
 
+        Commands can include `bytes` values, for example raw audio data in the `"wav_data"` parameter of `play_audio_data`. These values are sent to the build as base64 strings. This is much faster than encoding the data as a base64 string before adding it to a command.
+
         :param commands: A list of JSON commands.
 
         :return The output data from the build.
@@ -94,65 +94,13 @@ class Controller:
 
         if isinstance(commands, dict):
             commands = [commands]
-
-        # Append commands from each add-on.
-        for m in self.add_ons:
-            # Initialize an add-on.
-            if not m.initialized:
-                commands.extend(m.get_initialization_commands())
-                m.initialized = True
-            # Append the add-on's commands.
-            else:
-                commands.extend(m.commands)
-                m.commands.clear()
-        # Possibly do something with the commands about to be sent.
-        for m in self.add_ons:
-            m.before_send(commands)
-
-        # Serialize the message.
-        msg = [json.dumps(commands).encode('utf-8')]
+        msg = self._get_message(commands=commands)
         # Send the commands.
         self.socket.send_multipart(msg)
         # Receive output data.
         resp = self.socket.recv_multipart()
-
-        # Occasionally, the build's socket will stop receiving messages.
-        # If that happens, it will close the socket, create a new socket, and send a dummy output data object.
-        # The ID of the dummy object is "ftre" (FailedToReceive).
-        # If the controller receives the dummy object, it should re-send its commands.
-        # The dummy object is always in an array: [ftre, 0]
-        # This way, the controller can easily differentiate it from a response that just has the frame count.
-        ftre: bool = True
-        num_ftre: int = 0
-        while ftre and num_ftre < 1000:
-            ftre = False
-            for i in range(len(resp) - 1):
-                if resp[i][4:8] == b'ftre':
-                    ftre = True
-                    self.socket.send_multipart(msg)
-                    resp = self.socket.recv_multipart()
-                    num_ftre += 1
-                    break
-        # Tried too many times.
-        if ftre:
-            print("Quitting now because the controller tried too many times to resend commands to the build. "
-                  "Check the build log for more info.")
-            self._print_build_log()
-
-        # Check if we've received a quit signal. If we have, check if there was an error.
-        for i in range(len(resp) - 1):
-            if resp[i][4:8] == b'quit':
-                if not QuitSignal(resp[i]).get_ok():
-                    print("The build quit due to an error. Check the build log for more info.")
-                    self._print_build_log()
-                break
-
-        # Get commands per module for the next frame.
-        for m in self.add_ons:
-            m.on_send(resp=resp)
-
         # Return the output data from the build.
-        return resp
+        return self._on_receive(msg=msg, resp=resp)
 
     @staticmethod
     def get_add_object(model_name: str, object_id: int, position: Dict[str, float] = None, rotation: Dict[str, float] = None, library: str = "") -> dict:
@@ -244,54 +192,15 @@ class Controller:
                              "mode": "continuous_speculative"})
 
         if default_physics_values:
-            # Use default physics values.
-            if model_name in DEFAULT_OBJECT_AUDIO_STATIC_DATA:
-                mass = DEFAULT_OBJECT_AUDIO_STATIC_DATA[model_name].mass
-                bounciness = DEFAULT_OBJECT_AUDIO_STATIC_DATA[model_name].bounciness
-                material = DEFAULT_OBJECT_AUDIO_STATIC_DATA[model_name].material
-            # Fallback: Try to derive physics values from existing data.
-            else:
-                if "models_full.json" not in Controller.MODEL_LIBRARIANS:
-                    Controller.MODEL_LIBRARIANS["models_full.json"] = ModelLibrarian("models_full.json")
-                # Get all models in the same category that have default physics values.
-                records = Controller.MODEL_LIBRARIANS["models_full.json"].get_all_models_in_wnid(record.wnid)
-                records = [r for r in records if not r.do_not_use and r.name != record.name and r.name in
-                           DEFAULT_OBJECT_AUDIO_STATIC_DATA]
-                # Fallback: Find objects with similar volume.
-                if len(records) == 0:
-                    records = [r for r in Controller.MODEL_LIBRARIANS["models_full.json"].records if r.name in
-                               DEFAULT_OBJECT_AUDIO_STATIC_DATA and not r.do_not_use and r.name != record.name and
-                               0.8 <= abs(r.volume / record.volume) <= 1.2]
-                # Fallback: Select a default material and bounciness.
-                if len(records) == 0:
-                    material: AudioMaterial = AudioMaterial.plastic_hard
-                    # Select a default bounciness.
-                    bounciness: float = 0
-                # Select the most common material and bounciness.
-                else:
-                    materials: List[AudioMaterial] = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].material for r in records]
-                    material: AudioMaterial = max(set(materials), key=materials.count)
-                    bouncinesses = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].bounciness for r in records]
-                    bounciness = round(sum(bouncinesses) / len(bouncinesses), 3)
-                # Derive the mass.
-                mass = DENSITIES[material] * record.volume
-            commands.extend([{"$type": "set_mass",
-                              "mass": mass,
-                              "id": object_id},
-                             {"$type": "set_physic_material",
-                              "dynamic_friction": DYNAMIC_FRICTION[material],
-                              "static_friction": STATIC_FRICTION[material],
-                              "bounciness": bounciness,
-                              "id": object_id}])
-        else:
-            commands.extend([{"$type": "set_mass",
-                              "mass": mass,
-                              "id": object_id},
-                             {"$type": "set_physic_material",
-                              "dynamic_friction": dynamic_friction,
-                              "static_friction": static_friction,
-                              "bounciness": bounciness,
-                              "id": object_id}])
+            mass, dynamic_friction, static_friction, bounciness = Controller._get_default_physics_values(record=record)
+        commands.extend([{"$type": "set_mass",
+                          "mass": mass,
+                          "id": object_id},
+                         {"$type": "set_physic_material",
+                          "dynamic_friction": dynamic_friction,
+                          "static_friction": static_friction,
+                          "bounciness": bounciness,
+                          "id": object_id}])
         if scale_factor is not None:
             if scale_mass:
                 commands.append({"$type": "scale_object_and_mass",
@@ -303,6 +212,109 @@ class Controller:
                                  "id": object_id})
         return commands
 
+    @staticmethod
+    def get_add_objects(model_names: List[str], object_ids: List[int], positions: Union[np.array, List[Dict[str, float]]] = None, rotations: Union[np.array, List[Dict[str, float]]] = None, library: str = "") -> List[dict]:
+        """
+        Returns a list of valid add_object commands. This is equivalent to calling `get_add_object()` per object, but much faster when adding many objects: each model's record is looked up only once, and the commands for each model are generated from a shared template.
+
+        :param model_names: The name of the model of each object. This list can include the same model multiple times.
+        :param object_ids: The ID of each object.
+        :param positions: The position of each object, either as a numpy array with shape `(n, 3)` or as a list of dictionaries. If None, each position defaults to `{"x": 0, "y": 0, "z": 0}`.
+        :param rotations: The starting rotation of each object, in Euler angles, either as a numpy array with shape `(n, 3)` or as a list of dictionaries. If None, each rotation defaults to `{"x": 0, "y": 0, "z": 0}`.
+        :param library: The path to the records file. If left empty, the default library will be selected. See `ModelLibrarian.get_library_filenames()` and `ModelLibrarian.get_default_library()`.
+
+        :return A list of add_object commands that the controller can then send via [`self.communicate(commands)`](#communicate).
+        """
+
+        templates = Controller._get_add_object_templates(records=Controller._get_model_records(model_names=model_names,
+                                                                                            library=library))
+        positions = Controller._get_vectors(vectors=positions, num=len(object_ids))
+        rotations = Controller._get_vectors(vectors=rotations, num=len(object_ids))
+        return [{**templates[model_name],
+                 "position": position,
+                 "rotation": rotation,
+                 "id": object_id} for model_name, object_id, position, rotation in zip(model_names, object_ids,
+                                                                                      positions, rotations)]
+
+    @staticmethod
+    def get_add_physics_objects(model_names: List[str], object_ids: List[int], positions: Union[np.array, List[Dict[str, float]]] = None, rotations: Union[np.array, List[Dict[str, float]]] = None, library: str = "", scale_factors: Union[np.array, List[Dict[str, float]]] = None, kinematic: bool = False, gravity: bool = True, default_physics_values: bool = True, mass: float = 1, dynamic_friction: float = 0.3, static_friction: float = 0.3, bounciness: float = 0.7, scale_mass: bool = True) -> List[dict]:
+        """
+        Add many objects to the scene with physics values (mass, friction coefficients, etc.). This is equivalent to calling `get_add_physics_object()` per object, but much faster when adding many objects: each model's record and physics values are looked up only once, and the commands for each model are generated from a shared template.
+
+        :param model_names: The name of the model of each object. This list can include the same model multiple times.
+        :param object_ids: The ID of each object.
+        :param positions: The position of each object, either as a numpy array with shape `(n, 3)` or as a list of dictionaries. If None, each position defaults to `{"x": 0, "y": 0, "z": 0}`.
+        :param rotations: The starting rotation of each object, either as a numpy array with shape `(n, 3)` (Euler angles) or `(n, 4)` (quaternions), or as a list of dictionaries. If None, the objects won't be rotated.
+        :param library: The path to the records file. If left empty, the default library will be selected. See `ModelLibrarian.get_library_filenames()` and `ModelLibrarian.get_default_library()`.
+        :param scale_factors: The [scale factor](../api/command_api.md#scale_object) of each object, either as a numpy array with shape `(n, 3)` or as a list of dictionaries. If None, the objects won't be scaled.
+        :param kinematic: If True, the objects will be [kinematic](../api/command_api.md#set_kinematic_state).
+        :param gravity: If True, the objects won't respond to [gravity](../api/command_api.md#set_kinematic_state).
+        :param default_physics_values: If True, use default physics values. Not all objects have default physics values. To determine if object does: `has_default_physics_values = model_name in DEFAULT_OBJECT_AUDIO_STATIC_DATA`.
+        :param mass: The mass of each object. Ignored if `default_physics_values == True`.
+        :param dynamic_friction: The [dynamic friction](../api/command_api.md#set_physic_material) of each object. Ignored if `default_physics_values == True`.
+        :param static_friction: The [static friction](../api/command_api.md#set_physic_material) of each object. Ignored if `default_physics_values == True`.
+        :param bounciness: The [bounciness](../api/command_api.md#set_physic_material) of each object. Ignored if `default_physics_values == True`.
+        :param scale_mass: If True, the mass of each object will be scaled proportionally to the spatial scale.
+
+        :return: A **list** of commands to add the objects and apply physics values that the controller can then send via [`self.communicate(commands)`](#communicate).
+        """
+
+        num = len(object_ids)
+        records = Controller._get_model_records(model_names=model_names, library=library)
+        templates = Controller._get_add_object_templates(records=records)
+        positions = Controller._get_vectors(vectors=positions, num=num)
+        rotations = Controller._get_vectors(vectors=rotations, num=num) if rotations is not None else [None] * num
+        scale_factors = Controller._get_vectors(vectors=scale_factors, num=num) if scale_factors is not None else \
+            [None] * num
+        # Get the physics values of each model.
+        physics_values: Dict[str, Tuple[float, float, float, float]] = dict()
+        for model_name in records:
+            if default_physics_values:
+                physics_values[model_name] = Controller._get_default_physics_values(record=records[model_name])
+            else:
+                physics_values[model_name] = (mass, dynamic_friction, static_friction, bounciness)
+        scale_type = "scale_object_and_mass" if scale_mass else "scale_object"
+        commands: List[dict] = list()
+        for model_name, object_id, position, rotation, scale_factor in zip(model_names, object_ids, positions,
+                                                                            rotations, scale_factors):
+            commands.append({**templates[model_name],
+                             "position": position,
+                             "id": object_id})
+            if rotation is not None:
+                # The rotation is a quaternion.
+                if "w" in rotation:
+                    commands.append({"$type": "rotate_object_to",
+                                     "rotation": rotation,
+                                     "id": object_id})
+                # The rotation is in Euler angles.
+                else:
+                    commands.append({"$type": "rotate_object_to_euler_angles",
+                                     "euler_angles": rotation,
+                                     "id": object_id})
+            commands.append({"$type": "set_kinematic_state",
+                             "id": object_id,
+                             "is_kinematic": kinematic,
+                             "use_gravity": gravity})
+            # Kinematic objects must be continuous_speculative.
+            if kinematic:
+                commands.append({"$type": "set_object_collision_detection_mode",
+                                 "id": object_id,
+                                 "mode": "continuous_speculative"})
+            m, df, sf, b = physics_values[model_name]
+            commands.append({"$type": "set_mass",
+                             "mass": m,
+                             "id": object_id})
+            commands.append({"$type": "set_physic_material",
+                             "dynamic_friction": df,
+                             "static_friction": sf,
+                             "bounciness": b,
+                             "id": object_id})
+            if scale_factor is not None:
+                commands.append({"$type": scale_type,
+                                 "scale_factor": scale_factor,
+                                 "id": object_id})
+        return commands
+
     @staticmethod
     def get_add_material(material_name: str, library: str = "") -> dict:
         """
@@ -498,6 +510,34 @@ class Controller:
         :param port: The socket port.
         """
 
+        # Download the build if needed.
+        if Controller._download_build():
+            # This is imported here because it imports slow network modules that aren't needed until a build is launched.
+            from tdw.release.build import Build
+
+            Popen([str(Build.BUILD_PATH.resolve()), "-port "+str(port)])
+
+    @staticmethod
+    def get_ipc_endpoint(port: int = 1071) -> str:
+        """
+        :param port: The socket port.
+
+        :return: The inter-process communication endpoint that the controller binds to if `ipc=True` in the constructor, for example `ipc:///tmp/tdw_1071`.
+        """
+
+        return "ipc://" + Path(gettempdir()).joinpath(f"tdw_{port}").resolve().as_posix()
+
+    @staticmethod
+    def _download_build() -> bool:
+        """
+        If a build doesn't exist at the expected location, or if it is the wrong version, download one to that location.
+
+        :return: True if there is a build of the correct version.
+        """
+
+        # This is imported here because it imports slow network modules that aren't needed until a build is launched.
+        from tdw.release.build import Build
+
         # Download the build.
         need_to_download = False
         if not Build.BUILD_PATH.exists():
@@ -522,9 +562,145 @@ class Controller:
                 print("You need to launch your own build.")
         else:
             success = True
-        # Launch the build.
-        if success:
-            Popen([str(Build.BUILD_PATH.resolve()), "-port "+str(port)])
+        return success
+
+    def _get_message(self, commands: List[dict]) -> List[bytes]:
+        """
+        Append the add-ons' commands to a list of commands and serialize them.
+
+        :param commands: A list of JSON commands. This list is modified in-place.
+
+        :return: The message that will be sent to the build.
+        """
+
+        # Append commands from each add-on.
+        for m in self.add_ons:
+            # Initialize an add-on.
+            if not m.initialized:
+                commands.extend(m.get_initialization_commands())
+                m.initialized = True
+            # Append the add-on's commands.
+            else:
+                commands.extend(m.commands)
+                m.commands.clear()
+        # Possibly do something with the commands about to be sent.
+        for m in self.add_ons:
+            m.before_send(commands)
+
+        # Serialize the message.
+        return [Controller._serialize_commands(commands)]
+
+    def _on_receive(self, msg: List[bytes], resp: List[bytes]) -> list:
+        """
+        Handle a response from the build: re-send the message if the build failed to receive it, check for a quit signal, and send the response to each add-on.
+
+        :param msg: The message that was sent to the build.
+        :param resp: The response from the build.
+
+        :return: The output data from the build.
+        """
+
+        # Re-send the commands if the build failed to receive them.
+        num_ftre: int = 0
+        while Controller._failed_to_receive(resp=resp) and num_ftre < Controller._MAX_NUM_FTRE:
+            self.socket.send_multipart(msg)
+            resp = self.socket.recv_multipart()
+            num_ftre += 1
+        self._check_response(resp=resp)
+
+        # Get commands per module for the next frame.
+        for m in self.add_ons:
+            m.on_send(resp=resp)
+
+        return resp
+
+    def _check_response(self, resp: List[bytes]) -> None:
+        """
+        Check if the build failed to receive the commands too many times, or if the build quit due to an error. If so, print a message.
+
+        :param resp: The response from the build, after re-sending the commands if needed.
+        """
+
+        # Tried too many times.
+        if Controller._failed_to_receive(resp=resp):
+            print("Quitting now because the controller tried too many times to resend commands to the build. "
+                  "Check the build log for more info.")
+            self._print_build_log()
+
+        # Check if we've received a quit signal. If we have, check if there was an error.
+        for i in range(len(resp) - 1):
+            if resp[i][4:8] == b'quit':
+                if not QuitSignal(resp[i]).get_ok():
+                    print("The build quit due to an error. Check the build log for more info.")
+                    self._print_build_log()
+                break
+
+    def _set_version(self, resp: List[bytes]) -> None:
+        """
+        Set the build version from the response to `Controller._get_startup_commands()`.
+
+        :param resp: The response from the build.
+        """
+
+        for r in resp[:-1]:
+            if Version.get_data_type_id(r) == "vers":
+                v = Version(r)
+                self._tdw_version = v.get_tdw_version()
+                self._unity_version = v.get_unity_version()
+                self._is_standalone = v.get_standalone()
+                break
+
+    @staticmethod
+    def _bind_socket(context: zmq.Context, port: int, ipc: bool) -> zmq.Socket:
+        """
+        :param context: The ZeroMQ context.
+        :param port: The port number.
+        :param ipc: If True, the socket is also bound to an inter-process communication endpoint.
+
+        :return: A new socket, bound to the port.
+        """
+
+        # noinspection PyUnresolvedReferences
+        socket = context.socket(zmq.REP)
+        socket.bind('tcp://*:' + str(port))
+        # The peer can connect to either endpoint.
+        if ipc:
+            # noinspection PyUnresolvedReferences
+            if not zmq.has("ipc"):
+                raise Exception("IPC isn't supported on this platform.")
+            socket.bind(Controller.get_ipc_endpoint(port=port))
+        return socket
+
+    @staticmethod
+    def _get_startup_commands() -> List[dict]:
+        """
+        :return: The commands that are sent when the controller connects to the build.
+        """
+
+        return [{"$type": "set_error_handling"},
+                {"$type": "send_version"},
+                {"$type": "load_scene",
+                 "scene_name": "ProcGenScene"}]
+
+    @staticmethod
+    def _failed_to_receive(resp: List[bytes]) -> bool:
+        """
+        Occasionally, the build's socket will stop receiving messages.
+        If that happens, it will close the socket, create a new socket, and send a dummy output data object.
+        The ID of the dummy object is "ftre" (FailedToReceive).
+        If the controller receives the dummy object, it should re-send its commands.
+        The dummy object is always in an array: [ftre, 0]
+        This way, the controller can easily differentiate it from a response that just has the frame count.
+
+        :param resp: The response from the build.
+
+        :return: True if the response is the dummy "ftre" object.
+        """
+
+        for i in range(len(resp) - 1):
+            if resp[i][4:8] == b'ftre':
+                return True
+        return False
 
     def _check_build_version(self, version: str = __version__, build_version: str = None) -> None:
         """
@@ -555,6 +731,116 @@ class Controller:
         print(f"If the build is on a remote Linux server, the log path is probably"
               f" ~/.config/unity3d/MIT/TDW/Player.log (where ~ is your home directory)")
 
+    @staticmethod
+    def _serialize_commands(commands: List[dict]) -> bytes:
+        """
+        Serialize commands as a JSON message.
+
+        Commands can include `bytes` values, for example audio data. `bytes` values are sent to the build as base64 strings. They are encoded and inserted directly into the message rather than being serialized as strings by `json`, which is much faster for large audio clips.
+
+        :param commands: A list of JSON commands.
+
+        :return: The serialized commands.
+        """
+
+        data: List[bytes] = list()
+
+        def get_placeholder(o):
+            if isinstance(o, bytes):
+                data.append(o)
+                return Controller._BYTES_PLACEHOLDER
+            raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+        msg = json.dumps(commands, default=get_placeholder).encode("utf-8")
+        if len(data) == 0:
+            return msg
+        # Replace each placeholder with base64 data.
+        parts = msg.split(Controller._BYTES_PLACEHOLDER_JSON)
+        if len(parts) != len(data) + 1:
+            raise Exception(f"Failed to serialize {len(data)} bytes values in commands.")
+        chunks: List[bytes] = [parts[0]]
+        for i in range(len(data)):
+            chunks.extend([b'"', b64encode(data[i]), b'"', parts[i + 1]])
+        return b"".join(chunks)
+
+    @staticmethod
+    def _get_default_physics_values(record: ModelRecord) -> Tuple[float, float, float, float]:
+        """
+        :param record: The model record.
+
+        :return: Tuple: The default mass, dynamic friction, static friction, and bounciness of the model.
+        """
+
+        # The default physics values are loaded the first time that they are needed.
+        from tdw.physics_audio.object_audio_static import DEFAULT_OBJECT_AUDIO_STATIC_DATA
+        from tdw.physics_audio.default_physics_index import DefaultPhysicsIndex
+
+        # Use default physics values.
+        if record.name in DEFAULT_OBJECT_AUDIO_STATIC_DATA:
+            mass = DEFAULT_OBJECT_AUDIO_STATIC_DATA[record.name].mass
+            bounciness = DEFAULT_OBJECT_AUDIO_STATIC_DATA[record.name].bounciness
+            material = DEFAULT_OBJECT_AUDIO_STATIC_DATA[record.name].material
+        # Fallback: Try to derive physics values from existing data. See: `DefaultPhysicsIndex`.
+        else:
+            if Controller.DEFAULT_PHYSICS_INDEX is None:
+                Controller.DEFAULT_PHYSICS_INDEX = DefaultPhysicsIndex()
+            material, bounciness = Controller.DEFAULT_PHYSICS_INDEX.get(record)
+            # Derive the mass.
+            mass = DENSITIES[material] * record.volume
+        return mass, DYNAMIC_FRICTION[material], STATIC_FRICTION[material], bounciness
+
+    @staticmethod
+    def _get_model_records(model_names: List[str], library: str) -> Dict[str, ModelRecord]:
+        """
+        :param model_names: A list of model names. This list can include the same model multiple times.
+        :param library: The path to the records file. If left empty, the default library will be selected.
+
+        :return: The record of each unique model. Key = The model name.
+        """
+
+        if library == "":
+            library = "models_core.json"
+        if library not in Controller.MODEL_LIBRARIANS:
+            Controller.MODEL_LIBRARIANS[library] = ModelLibrarian(library)
+        records: Dict[str, ModelRecord] = dict()
+        for model_name in model_names:
+            if model_name not in records:
+                records[model_name] = Controller.MODEL_LIBRARIANS[library].get_record(model_name)
+        return records
+
+    @staticmethod
+    def _get_add_object_templates(records: Dict[str, ModelRecord]) -> Dict[str, dict]:
+        """
+        :param records: The record of each unique model. Key = The model name.
+
+        :return: A partial add_object command per unique model. Key = The model name.
+        """
+
+        return {model_name: {"$type": "add_object",
+                             "name": records[model_name].name,
+                             "url": records[model_name].get_url(),
+                             "scale_factor": records[model_name].scale_factor,
+                             "category": records[model_name].wcategory} for model_name in records}
+
+    @staticmethod
+    def _get_vectors(vectors: Union[np.array, List[Dict[str, float]], None], num: int) -> List[Dict[str, float]]:
+        """
+        :param vectors: Either a numpy array with shape `(num, 3)` or `(num, 4)`, or a list of dictionaries. If None, the vectors are all `{"x": 0, "y": 0, "z": 0}`.
+        :param num: The number of vectors.
+
+        :return: A list of vectors as dictionaries.
+        """
+
+        if vectors is None:
+            return [{"x": 0, "y": 0, "z": 0} for _ in range(num)]
+        elif isinstance(vectors, np.ndarray):
+            if vectors.shape[1] == 4:
+                return [{"x": v[0], "y": v[1], "z": v[2], "w": v[3]} for v in vectors.tolist()]
+            else:
+                return [{"x": v[0], "y": v[1], "z": v[2]} for v in vectors.tolist()]
+        else:
+            return vectors
+
     @staticmethod
     def _check_pypi_version(v_installed_override: str = None, v_pypi_override: str = None) -> None:
         """
@@ -565,10 +851,18 @@ class Controller:
         :param v_pypi_override: Override for the PyPi version. Change this to debug.
         """
 
-        # Get the version of the installed tdw module.
-        installed_tdw_version = PyPi.get_installed_tdw_version()
-        # Get the latest version of the tdw module on PyPi.
-        pypi_version = PyPi.get_pypi_version()
+        # This is imported here because it imports slow network and packaging modules.
+        from tdw.release.pypi import PyPi
+
+        try:
+            # Get the version of the installed tdw module.
+            installed_tdw_version = PyPi.get_installed_tdw_version()
+            # Get the latest version of the tdw module on PyPi.
+            pypi_version = PyPi.get_pypi_version()
+        # There might not be a network connection, or the tdw module might not be installed.
+        except Exception as e:
+            print(f"Couldn't compare the installed tdw Python module to the latest version on PyPi: {e}")
+            return
 
         # Apply overrides
         if v_installed_override is not None:
@@ -0,0 +1,108 @@
+from typing import List, Union
+import numpy as np
+from tdw.output_data import OutputData, Images
+
+
+class DepthDecoder:
+    """
+    Decode the depth passes of many `Images` output data objects (for example, every avatar in a frame, or a stack of frames) into a single array of depth values.
+
+    This is equivalent to calling `TDWUtils.get_depth_values()` per image, but the image dimensions are read from the `Images` output data, the passes are decoded in a single vectorized operation, and the output array is reused between calls.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.depth_decoder import DepthDecoder
+
+    c = Controller()
+    decoder = DepthDecoder()
+    # Your code here.
+    resp = c.communicate([])
+    depth = decoder.decode(DepthDecoder.get_images(resp))
+    print(depth.shape)  # (num_images, height, width)
+    print(decoder.avatar_ids)  # The avatar ID of each image in `depth`.
+    ```
+    """
+
+    def __init__(self, depth_pass: str = "_depth", near_plane: float = 0.1, far_plane: float = 100):
+        """
+        :param depth_pass: The type of depth pass. This determines how the values are decoded. Options: `"_depth"`, `"_depth_simple"`.
+        :param near_plane: The near clipping plane. See command `set_camera_clipping_planes`. The default value in this function is the default value of the near clipping plane.
+        :param far_plane: The far clipping plane. See command `set_camera_clipping_planes`. The default value in this function is the default value of the far clipping plane.
+        """
+
+        # Per-channel weights that convert an RGB-encoded depth value to an un-normalized depth value.
+        scale = (far_plane - near_plane) / 256.0
+        if depth_pass == "_depth":
+            self._weights: np.array = np.array([scale, scale / 256.0, scale / (256.0 ** 2)], dtype=np.float32)
+        elif depth_pass == "_depth_simple":
+            self._weights: np.array = np.array([scale / 256.0, 0, 0], dtype=np.float32)
+        else:
+            raise Exception(f"Invalid depth pass: {depth_pass}")
+        """:field
+        The type of depth pass.
+        """
+        self.depth_pass: str = depth_pass
+        """:field
+        The avatar ID of each image in the array returned by the most recent call to `decode()`, in the same order.
+        """
+        self.avatar_ids: List[str] = list()
+        # The RGB values of each depth pass as floats. Shape: `(n, height, width, 3)`.
+        self._rgb: np.array = np.zeros(shape=(0, 0, 0, 3), dtype=np.float32)
+        # The decoded depth values. Shape: `(n, height, width)`.
+        self._depth: np.array = np.zeros(shape=(0, 0, 0), dtype=np.float32)
+
+    def decode(self, images: Union[Images, List[Images]]) -> np.array:
+        """
+        Decode the depth passes of each `Images` output data object.
+
+        All of the images must have the same width and height. `Images` that don't have a depth pass of type `self.depth_pass` are ignored.
+
+        The returned array is a view of a buffer that is reused by the next call to `decode()`. If you need to keep the depth values, make a copy.
+
+        :param images: Either a single `Images` output data object or a list of `Images` output data objects, e.g. all of the `Images` in one or more frames.
+
+        :return: The depth values as a float32 numpy array. Shape: `(n, height, width)` where `n` is the number of depth passes.
+        """
+
+        if isinstance(images, Images):
+            images = [images]
+        # Get the index of the depth pass in each `Images`.
+        passes = list()
+        width = -1
+        height = -1
+        for image in images:
+            for i in range(image.get_num_passes()):
+                if image.get_pass_mask(i) == self.depth_pass:
+                    if width < 0:
+                        width = image.get_width()
+                        height = image.get_height()
+                    elif image.get_width() != width or image.get_height() != height:
+                        raise Exception(f"Expected images of size {width}x{height} but avatar {image.get_avatar_id()} "
+                                        f"has images of size {image.get_width()}x{image.get_height()}")
+                    passes.append((image, i))
+                    break
+        self.avatar_ids.clear()
+        if len(passes) == 0:
+            return self._depth[:0]
+        # Resize the buffers only if the images are larger than the buffers.
+        n = len(passes)
+        if self._rgb.shape[0] < n or self._rgb.shape[1] != height or self._rgb.shape[2] != width:
+            self._rgb = np.zeros(shape=(max(n, self._rgb.shape[0]), height, width, 3), dtype=np.float32)
+            self._depth = np.zeros(shape=self._rgb.shape[:3], dtype=np.float32)
+        # Copy each pass into the buffer. The rows are flipped because the depth pass is stored bottom-to-top.
+        for i, (image, index) in enumerate(passes):
+            self._rgb[i] = np.reshape(image.get_image(index), (height, width, 3))[::-1]
+            self.avatar_ids.append(image.get_avatar_id())
+        # Convert every pass to depth values at the same time.
+        np.matmul(self._rgb[:n], self._weights, out=self._depth[:n])
+        return self._depth[:n]
+
+    @staticmethod
+    def get_images(resp: List[bytes]) -> List[Images]:
+        """
+        :param resp: The response from the build.
+
+        :return: A list of all of the `Images` output data in the response.
+        """
+
+        return [Images(resp[i]) for i in range(len(resp) - 1) if OutputData.get_data_type_id(resp[i]) == "imag"]
@@ -1,6 +1,5 @@
 import json
 from typing import List, Dict, TypeVar, Union, Generic, Optional, Tuple
-import pkg_resources
 from pathlib import Path
 import platform
 from secrets import token_hex
@@ -273,9 +272,9 @@ class _Librarian(Generic[T]):
         """
 
         if library == "":
-            self.library = pkg_resources.resource_filename(__name__, "metadata_libraries/" + self.get_default_library())
+            self.library = str(Path(__file__).parent.joinpath("metadata_libraries", self.get_default_library()))
         else:
-            module_path = pkg_resources.resource_filename(__name__, "metadata_libraries/" + library)
+            module_path = str(Path(__file__).parent.joinpath("metadata_libraries", library))
             if Path(module_path).exists():
                 self.library = module_path
             else:
@@ -38,10 +38,10 @@ class ObiActor:
 
         # Get the indices of the active particles.
         solver_indices = obi_particles.get_solver_indices(self._object_index)[:obi_particles.get_count(self._object_index)]
-        # Get the particle data at the solver index positions.
         # Reshape the array to (n, 4).
-        # Delete the 4th column.
-        self.positions = np.delete(np.take(obi_particles.get_positions(self._solver_id).reshape(-1, 4),
-                                           solver_indices, axis=0).reshape(-1, 4), 3, 1)
-        self.velocities = np.delete(np.take(obi_particles.get_velocities(self._solver_id).reshape(-1, 4),
-                                            solver_indices, axis=0).reshape(-1, 4), 3, 1)
+        # Get the particle data at the solver index positions.
+        # Get an (n, 3) view of the particle data, without the 4th column.
+        self.positions = np.take(obi_particles.get_positions(self._solver_id).reshape(-1, 4),
+                                 solver_indices, axis=0)[:, :3]
+        self.velocities = np.take(obi_particles.get_velocities(self._solver_id).reshape(-1, 4),
+                                  solver_indices, axis=0)[:, :3]
@@ -0,0 +1,149 @@
+import json
+from pathlib import Path
+from typing import List, Dict, Union, Optional
+import numpy as np
+
+
+class ObiParticleRecording:
+    """
+    Read a recording of Obi particles made by [`ObiParticleRecorder`](../add_ons/obi_particle_recorder.md).
+
+    Chunks are read only when they are needed. If the recording isn't compressed, chunks are memory-mapped.
+
+    ```python
+    from tdw.obi_data.obi_particle_recording import ObiParticleRecording
+
+    recording = ObiParticleRecording(path="fluid")
+    for object_id in recording.object_ids:
+        print(object_id, recording.get_positions(frame=100, object_id=object_id).shape)
+    ```
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        :param path: The path to the recording directory.
+        """
+
+        if isinstance(path, str):
+            path = Path(path)
+        """:field
+        The path to the recording directory.
+        """
+        self.path: Path = path
+        index_path = self.path.joinpath("index.json")
+        if not index_path.exists():
+            raise Exception(f"Recording not found: {self.path}")
+        self._index: dict = json.loads(index_path.read_text())
+        """:field
+        The number of frames in the recording.
+        """
+        self.num_frames: int = self._index["num_frames"]
+        """:field
+        The encoding of the particle data: `"float32"`, `"float16"`, or `"quantized"`.
+        """
+        self.encoding: str = self._index["encoding"]
+        """:field
+        If True, the recording includes particle velocities.
+        """
+        self.velocities: bool = self._index["velocities"]
+        """:field
+        The IDs of every actor in the recording.
+        """
+        self.object_ids: List[int] = sorted({int(object_id) for chunk in self._index["chunks"]
+                                             for object_id in chunk["counts"]})
+        # The most recently loaded chunk.
+        self._chunk_index: int = -1
+        self._chunk: Optional[Dict[str, np.array]] = None
+
+    def get_positions(self, frame: int, object_id: int) -> np.array:
+        """
+        :param frame: The frame.
+        :param object_id: The ID of the actor.
+
+        :return: The positions of the actor's particles on this frame as a numpy array with shape `(n, 3)`. If the recording isn't compressed and the encoding is `"float32"`, this is a read-only view of a memory-mapped file.
+        """
+
+        return self._get(frame=frame, object_id=object_id, name="positions")
+
+    def get_velocities(self, frame: int, object_id: int) -> np.array:
+        """
+        :param frame: The frame.
+        :param object_id: The ID of the actor.
+
+        :return: The velocities of the actor's particles on this frame as a numpy array with shape `(n, 3)`. If the recording isn't compressed and the encoding is `"float32"`, this is a read-only view of a memory-mapped file.
+        """
+
+        if not self.velocities:
+            raise Exception("This recording doesn't include velocities.")
+        return self._get(frame=frame, object_id=object_id, name="velocities")
+
+    def get_trajectory(self, object_id: int, start: int = 0, end: int = None) -> List[np.array]:
+        """
+        :param object_id: The ID of the actor.
+        :param start: The first frame.
+        :param end: The last frame (exclusive). If None, this is the end of the recording.
+
+        :return: The positions of the actor's particles per frame. The number of particles can change between frames.
+        """
+
+        if end is None:
+            end = self.num_frames
+        return [self.get_positions(frame=frame, object_id=object_id) for frame in range(start, end)]
+
+    def _get(self, frame: int, object_id: int, name: str) -> np.array:
+        """
+        :param frame: The frame.
+        :param object_id: The ID of the actor.
+        :param name: `"positions"` or `"velocities"`.
+
+        :return: The decoded values.
+        """
+
+        if frame < 0 or frame >= self.num_frames:
+            raise Exception(f"Invalid frame: {frame}. There are {self.num_frames} frames.")
+        # Find the chunk.
+        chunk_index = 0
+        for i, chunk in enumerate(self._index["chunks"]):
+            if chunk["start"] <= frame < chunk["start"] + chunk["num_frames"]:
+                chunk_index = i
+                break
+        chunk = self._index["chunks"][chunk_index]
+        key = str(object_id)
+        # The actor doesn't have any particles in this chunk.
+        if key not in chunk["counts"]:
+            return np.zeros(shape=(0, 3), dtype=np.float32)
+        counts = np.array(chunk["counts"][key], dtype=np.intp)
+        offsets = np.cumsum(counts) - counts
+        local_frame = frame - chunk["start"]
+        column = self._get_chunk(chunk_index)[f"{object_id}_{name}"]
+        if self.encoding == "quantized":
+            # Find the most recent frame that isn't stored as a difference from the previous frame.
+            first = local_frame
+            while first > 0 and counts[first - 1] == counts[local_frame]:
+                first -= 1
+            count = counts[local_frame]
+            # Add the differences.
+            values = column[offsets[first]: offsets[local_frame] + count].reshape(-1, count, 3) \
+                if count > 0 else np.zeros(shape=(0, count, 3), dtype=np.int32)
+            return (values.sum(axis=0, dtype=np.int64) * self._index["quantization"]).astype(np.float32)
+        values = column[offsets[local_frame]: offsets[local_frame] + counts[local_frame]]
+        if self.encoding == "float16":
+            return values.astype(np.float32)
+        return values
+
+    def _get_chunk(self, chunk_index: int) -> Dict[str, np.array]:
+        """
+        :param chunk_index: The index of the chunk.
+
+        :return: The columns of the chunk.
+        """
+
+        if chunk_index != self._chunk_index:
+            if self._index["compress"]:
+                with np.load(str(self.path.joinpath(f"chunk_{chunk_index}.npz").resolve())) as f:
+                    self._chunk = {name: f[name] for name in f.files}
+            else:
+                self._chunk = {p.stem: np.load(str(p.resolve()), mmap_mode="r")
+                               for p in self.path.joinpath(f"chunk_{chunk_index}").iterdir() if p.suffix == ".npy"}
+            self._chunk_index = chunk_index
+        return self._chunk
@@ -1,62 +1,85 @@
+from importlib import import_module
 from tdw.FBOutput import Vector3, Quaternion, PassMask, Color, MessageType, SimpleTransform, PathState
-from tdw.FBOutput import SceneRegions as SceRegs
-from tdw.FBOutput import Transforms as Trans
-from tdw.FBOutput import Rigidbodies as Rigis
-from tdw.FBOutput import Bounds as Bouns
-from tdw.FBOutput import Images as Imags
-from tdw.FBOutput import AvatarKinematic as AvKi
-from tdw.FBOutput import AvatarNonKinematic as AvNoKi
-from tdw.FBOutput import AvatarSimpleBody as AvSi
-from tdw.FBOutput import SegmentationColors as Segs
-from tdw.FBOutput import AvatarSegmentationColor as AvSC
-from tdw.FBOutput import IsOnNavMesh as IsNM
-from tdw.FBOutput import IdPassGrayscale as IdGS
-from tdw.FBOutput import Collision as Col
-from tdw.FBOutput import ImageSensors as ImSe
-from tdw.FBOutput import CameraMatrices as CaMa
-from tdw.FBOutput import IdPassSegmentationColors as IdSC
-from tdw.FBOutput import FlexParticles as Flex
-from tdw.FBOutput import VRRig as VR
-from tdw.FBOutput import LogMessage as Log
-from tdw.FBOutput import Meshes as Me
-from tdw.FBOutput import Substructure as Sub
-from tdw.FBOutput import Version as Ver
-from tdw.FBOutput import EnvironmentCollision as EnvCol
-from tdw.FBOutput import Volumes as Vol
-from tdw.FBOutput import AudioSources as Audi
-from tdw.FBOutput import Raycast as Ray
-from tdw.FBOutput import Overlap as Over
-from tdw.FBOutput import NavMeshPath as Path
-from tdw.FBOutput import StaticRobot as StRobo
-from tdw.FBOutput import Robot as Robo
-from tdw.FBOutput import Keyboard as Key
-from tdw.FBOutput import Magnebot as Mag
-from tdw.FBOutput import ScreenPosition as Screen
-from tdw.FBOutput import TriggerCollision as Trigger
-from tdw.FBOutput import LocalTransforms as LocalTran
 from tdw.FBOutput import DriveAxis, JointType
-from tdw.FBOutput import QuitSignal as QuitSig
-from tdw.FBOutput import MagnebotWheels as MWheels
-from tdw.FBOutput import Occlusion as Occl
-from tdw.FBOutput import Lights as Lites
-from tdw.FBOutput import Categories as Cats
-from tdw.FBOutput import StaticRigidbodies as StatRig
-from tdw.FBOutput import RobotJointVelocities as RoJoVe
-from tdw.FBOutput import EmptyObjects as Empty
-from tdw.FBOutput import OculusTouchButtons as OculusTouch
-from tdw.FBOutput import StaticOculusTouch as StatOc
-from tdw.FBOutput import StaticCompositeObjects as StatComp
-from tdw.FBOutput import DynamicCompositeObjects as DynComp
-from tdw.FBOutput import AudioSourceDone as AudDone
-from tdw.FBOutput import ObiParticles as ObiP
 from tdw.vr_data.oculus_touch_button import OculusTouchButton
-from tdw.FBOutput import ObjectColliderIntersection as ObjColInt
-from tdw.FBOutput import EnvironmentColliderIntersection as EnvColInt
-from tdw.FBOutput import Mouse as Mous
 import numpy as np
 from typing import Tuple, Optional, List
 
 
+class _FBOutputModule:
+    """
+    A FlatBuffers output data module that is imported the first time that it is used.
+    Most controllers only receive a few types of output data, so this makes `import tdw.output_data` much faster.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: The name of the module in `tdw.FBOutput`.
+        """
+
+        self._name: str = name
+
+    def __getattr__(self, item: str):
+        value = getattr(import_module("tdw.FBOutput." + self._name), item)
+        # Cache the attribute so that `__getattr__` isn't called again.
+        setattr(self, item, value)
+        return value
+
+
+SceRegs = _FBOutputModule("SceneRegions")
+Trans = _FBOutputModule("Transforms")
+Rigis = _FBOutputModule("Rigidbodies")
+Bouns = _FBOutputModule("Bounds")
+Imags = _FBOutputModule("Images")
+AvKi = _FBOutputModule("AvatarKinematic")
+AvNoKi = _FBOutputModule("AvatarNonKinematic")
+AvSi = _FBOutputModule("AvatarSimpleBody")
+Segs = _FBOutputModule("SegmentationColors")
+AvSC = _FBOutputModule("AvatarSegmentationColor")
+IsNM = _FBOutputModule("IsOnNavMesh")
+IdGS = _FBOutputModule("IdPassGrayscale")
+Col = _FBOutputModule("Collision")
+ImSe = _FBOutputModule("ImageSensors")
+CaMa = _FBOutputModule("CameraMatrices")
+IdSC = _FBOutputModule("IdPassSegmentationColors")
+Flex = _FBOutputModule("FlexParticles")
+VR = _FBOutputModule("VRRig")
+Log = _FBOutputModule("LogMessage")
+Me = _FBOutputModule("Meshes")
+Sub = _FBOutputModule("Substructure")
+Ver = _FBOutputModule("Version")
+EnvCol = _FBOutputModule("EnvironmentCollision")
+Vol = _FBOutputModule("Volumes")
+Audi = _FBOutputModule("AudioSources")
+Ray = _FBOutputModule("Raycast")
+Over = _FBOutputModule("Overlap")
+Path = _FBOutputModule("NavMeshPath")
+StRobo = _FBOutputModule("StaticRobot")
+Robo = _FBOutputModule("Robot")
+Key = _FBOutputModule("Keyboard")
+Mag = _FBOutputModule("Magnebot")
+Screen = _FBOutputModule("ScreenPosition")
+Trigger = _FBOutputModule("TriggerCollision")
+LocalTran = _FBOutputModule("LocalTransforms")
+QuitSig = _FBOutputModule("QuitSignal")
+MWheels = _FBOutputModule("MagnebotWheels")
+Occl = _FBOutputModule("Occlusion")
+Lites = _FBOutputModule("Lights")
+Cats = _FBOutputModule("Categories")
+StatRig = _FBOutputModule("StaticRigidbodies")
+RoJoVe = _FBOutputModule("RobotJointVelocities")
+Empty = _FBOutputModule("EmptyObjects")
+OculusTouch = _FBOutputModule("OculusTouchButtons")
+StatOc = _FBOutputModule("StaticOculusTouch")
+StatComp = _FBOutputModule("StaticCompositeObjects")
+DynComp = _FBOutputModule("DynamicCompositeObjects")
+AudDone = _FBOutputModule("AudioSourceDone")
+ObiP = _FBOutputModule("ObiParticles")
+ObjColInt = _FBOutputModule("ObjectColliderIntersection")
+EnvColInt = _FBOutputModule("EnvironmentColliderIntersection")
+Mous = _FBOutputModule("Mouse")
+
+
 class OutputDataUndefinedError(Exception):
     pass
 
@@ -139,7 +162,7 @@ class OutputData(object):
 
 
 class SceneRegions(OutputData):
-    def get_data(self) -> SceRegs.SceneRegions:
+    def get_data(self) -> "SceRegs.SceneRegions":
         return SceRegs.SceneRegions.GetRootAsSceneRegions(self.bytes, 0)
 
     def get_center(self, index: int) -> Tuple[float, float, float]:
@@ -163,7 +186,7 @@ class Transforms(OutputData):
         self._rotations = self.data.RotationsAsNumpy().reshape(-1, 4)
         self._forwards = self.data.ForwardsAsNumpy().reshape(-1, 3)
 
-    def get_data(self) -> Trans.Transforms:
+    def get_data(self) -> "Trans.Transforms":
         return Trans.Transforms.GetRootAsTransforms(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -190,7 +213,7 @@ class Rigidbodies(OutputData):
         self._angular_velocities = self.data.AngularVelocitiesAsNumpy().reshape(-1, 3)
         self._sleeping = self.data.SleepingsAsNumpy()
 
-    def get_data(self) -> Rigis.Rigidbodies:
+    def get_data(self) -> "Rigis.Rigidbodies":
         return Rigis.Rigidbodies.GetRootAsRigidbodies(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -216,7 +239,7 @@ class StaticRigidbodies(OutputData):
         self._physics_values = self.data.PhysicsValuesAsNumpy().reshape(-1, 4)
         self._kinematic = self.data.KinematicAsNumpy()
 
-    def get_data(self) -> StatRig.StaticRigidbodies:
+    def get_data(self) -> "StatRig.StaticRigidbodies":
         return StatRig.StaticRigidbodies.GetRootAsStaticRigidbodies(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -247,7 +270,7 @@ class Bounds(OutputData):
         self._ids = self.data.IdsAsNumpy()
         self._bounds_positions = self.data.BoundPositionsAsNumpy().reshape(len(self._ids), 7, 3)
 
-    def get_data(self) -> Bouns.Bounds:
+    def get_data(self) -> "Bouns.Bounds":
         return Bouns.Bounds.GetRootAsBounds(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -290,7 +313,7 @@ class Images(OutputData):
                   PassMask.PassMask._albedo: "_albedo"
                   }
 
-    def get_data(self) -> Imags.Images:
+    def get_data(self) -> "Imags.Images":
         return Imags.Images.GetRootAsImages(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -319,7 +342,7 @@ class Images(OutputData):
 
 
 class AvatarKinematic(OutputData):
-    def get_data(self) -> AvKi.AvatarKinematic:
+    def get_data(self) -> "AvKi.AvatarKinematic":
         return AvKi.AvatarKinematic.GetRootAsAvatarKinematic(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -336,7 +359,7 @@ class AvatarKinematic(OutputData):
 
 
 class AvatarNonKinematic(AvatarKinematic):
-    def get_data(self) -> AvNoKi.AvatarNonKinematic:
+    def get_data(self) -> "AvNoKi.AvatarNonKinematic":
         return AvNoKi.AvatarNonKinematic.GetRootAsAvatarNonKinematic(self.bytes, 0)
 
     def get_velocity(self) -> Tuple[float, float, float]:
@@ -353,7 +376,7 @@ class AvatarNonKinematic(AvatarKinematic):
 
 
 class AvatarSimpleBody(AvatarNonKinematic):
-    def get_data(self) -> AvSi.AvatarSimpleBody:
+    def get_data(self) -> "AvSi.AvatarSimpleBody":
         return AvSi.AvatarSimpleBody.GetRootAsAvatarSimpleBody(self.bytes, 0)
 
     def get_visible_body(self) -> str:
@@ -366,7 +389,7 @@ class SegmentationColors(OutputData):
         self._ids = self.data.IdsAsNumpy()
         self._colors = self.data.ColorsAsNumpy().reshape(-1, 3)
 
-    def get_data(self) -> Segs.SegmentationColors:
+    def get_data(self) -> "Segs.SegmentationColors":
         return Segs.SegmentationColors.GetRootAsSegmentationColors(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -386,7 +409,7 @@ class SegmentationColors(OutputData):
 
 
 class AvatarSegmentationColor(OutputData):
-    def get_data(self) -> AvSC.AvatarSegmentationColor:
+    def get_data(self) -> "AvSC.AvatarSegmentationColor":
         return AvSC.AvatarSegmentationColor.GetRootAsAvatarSegmentationColor(self.bytes, 0)
 
     def get_id(self) -> str:
@@ -397,7 +420,7 @@ class AvatarSegmentationColor(OutputData):
 
 
 class IsOnNavMesh(OutputData):
-    def get_data(self) -> IsNM.IsOnNavMesh:
+    def get_data(self) -> "IsNM.IsOnNavMesh":
         return IsNM.IsOnNavMesh.GetRootAsIsOnNavMesh(self.bytes, 0)
 
     def get_position(self) -> Tuple[float, float, float]:
@@ -408,7 +431,7 @@ class IsOnNavMesh(OutputData):
 
 
 class IdPassGrayscale(OutputData):
-    def get_data(self) -> IdGS.IdPassGrayscale:
+    def get_data(self) -> "IdGS.IdPassGrayscale":
         return IdGS.IdPassGrayscale.GetRootAsIdPassGrayscale(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -422,7 +445,7 @@ class IdPassGrayscale(OutputData):
 
 
 class Collision(OutputData):
-    def get_data(self) -> Col.Collision:
+    def get_data(self) -> "Col.Collision":
         return Col.Collision.GetRootAsCollision(self.bytes, 0)
 
     def get_collider_id(self) -> int:
@@ -457,7 +480,7 @@ class Collision(OutputData):
 
 
 class ImageSensors(OutputData):
-    def get_data(self) -> ImSe.ImageSensors:
+    def get_data(self) -> "ImSe.ImageSensors":
         return ImSe.ImageSensors.GetRootAsImageSensors(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -483,7 +506,7 @@ class ImageSensors(OutputData):
 
 
 class CameraMatrices(OutputData):
-    def get_data(self) -> CaMa.CameraMatrices:
+    def get_data(self) -> "CaMa.CameraMatrices":
         return CaMa.CameraMatrices.GetRootAsCameraMatrices(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -504,7 +527,7 @@ class IdPassSegmentationColors(OutputData):
         super().__init__(b)
         self._colors: np.array = self.data.SegmentationColorsAsNumpy().reshape(-1, 3)
 
-    def get_data(self) -> IdSC.IdPassSegmentationColors:
+    def get_data(self) -> "IdSC.IdPassSegmentationColors":
         return IdSC.IdPassSegmentationColors.GetRootAsIdPassSegmentationColors(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -518,7 +541,7 @@ class IdPassSegmentationColors(OutputData):
 
 
 class FlexParticles(OutputData):
-    def get_data(self) -> Flex.FlexParticles:
+    def get_data(self) -> "Flex.FlexParticles":
         return Flex.FlexParticles.GetRootAsFlexParticles(self.bytes, 0)
 
     def get_num_objects(self) -> int:
@@ -535,7 +558,7 @@ class FlexParticles(OutputData):
 
 
 class VRRig(OutputData):
-    def get_data(self) -> VR.VRRig:
+    def get_data(self) -> "VR.VRRig":
         return VR.VRRig.GetRootAsVRRig(self.bytes, 0)
 
     def get_position(self) -> Tuple[float, float, float]:
@@ -603,7 +626,7 @@ class VRRig(OutputData):
 class OculusTouchButtons(OutputData):
     BUTTONS = [b for b in OculusTouchButton]
 
-    def get_data(self) -> OculusTouch.OculusTouchButtons:
+    def get_data(self) -> "OculusTouch.OculusTouchButtons":
         return OculusTouch.OculusTouchButtons.GetRootAsOculusTouchButtons(self.bytes, 0)
 
     def get_left(self) -> List[OculusTouchButton]:
@@ -624,7 +647,7 @@ class OculusTouchButtons(OutputData):
 
 
 class StaticOculusTouch(OutputData):
-    def get_data(self) -> StatOc.StaticOculusTouch:
+    def get_data(self) -> "StatOc.StaticOculusTouch":
         return StatOc.StaticOculusTouch.GetRootAsStaticOculusTouch(self.bytes, 0)
 
     def get_body_id(self) -> int:
@@ -646,7 +669,7 @@ class LogMessage(OutputData):
                  MessageType.MessageType.message: "message",
                  }
 
-    def get_data(self) -> Log.LogMessage:
+    def get_data(self) -> "Log.LogMessage":
         return Log.LogMessage.GetRootAsLogMessage(self.bytes, 0)
 
     def get_message(self) -> str:
@@ -660,7 +683,7 @@ class LogMessage(OutputData):
 
 
 class Meshes(OutputData):
-    def get_data(self) -> Me.Meshes:
+    def get_data(self) -> "Me.Meshes":
         return Me.Meshes.GetRootAsMeshes(self.bytes, 0)
 
     def get_object_id(self, index: int) -> int:
@@ -677,7 +700,7 @@ class Meshes(OutputData):
 
 
 class Substructure(OutputData):
-    def get_data(self) -> Sub.Substructure:
+    def get_data(self) -> "Sub.Substructure":
         return Sub.Substructure.GetRootAsSubstructure(self.bytes, 0)
 
     def get_num_sub_objects(self) -> int:
@@ -694,7 +717,7 @@ class Substructure(OutputData):
 
 
 class Version(OutputData):
-    def get_data(self) -> Ver.Version:
+    def get_data(self) -> "Ver.Version":
         return Ver.Version.GetRootAsVersion(self.bytes, 0)
 
     def get_unity_version(self) -> str:
@@ -708,7 +731,7 @@ class Version(OutputData):
 
 
 class EnvironmentCollision(OutputData):
-    def get_data(self) -> EnvCol.EnvironmentCollision:
+    def get_data(self) -> "EnvCol.EnvironmentCollision":
         return EnvCol.EnvironmentCollision.GetRootAsEnvironmentCollision(self.bytes, 0)
 
     def get_object_id(self) -> int:
@@ -742,7 +765,7 @@ class Volumes(OutputData):
         self._ids = self.data.IdsAsNumpy()
         self._volumes = self.data.VolumesAsNumpy()
 
-    def get_data(self) -> Vol.Volumes:
+    def get_data(self) -> "Vol.Volumes":
         return Vol.Volumes.GetRootAsVolumes(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -756,7 +779,7 @@ class Volumes(OutputData):
 
 
 class AudioSources(OutputData):
-    def get_data(self) -> Audi.AudioSources:
+    def get_data(self) -> "Audi.AudioSources":
         return Audi.AudioSources.GetRootAsAudioSources(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -773,7 +796,7 @@ class AudioSources(OutputData):
 
 
 class AudioSourceDone(OutputData):
-    def get_data(self) -> AudDone.AudioSourceDone:
+    def get_data(self) -> "AudDone.AudioSourceDone":
         return AudDone.AudioSourceDone.GetRootAsAudioSourceDone(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -781,7 +804,7 @@ class AudioSourceDone(OutputData):
 
 
 class Raycast(OutputData):
-    def get_data(self) -> Ray.Raycast:
+    def get_data(self) -> "Ray.Raycast":
         return Ray.Raycast.GetRootAsRaycast(self.bytes, 0)
 
     def get_raycast_id(self) -> int:
@@ -804,7 +827,7 @@ class Raycast(OutputData):
 
 
 class Overlap(OutputData):
-    def get_data(self) -> Over.Overlap:
+    def get_data(self) -> "Over.Overlap":
         return Over.Overlap.GetRootAsOverlap(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -825,7 +848,7 @@ class NavMeshPath(OutputData):
                PathState.PathState.invalid: "invalid",
                PathState.PathState.partial: "partial"}
 
-    def get_data(self) -> Path.NavMeshPath:
+    def get_data(self) -> "Path.NavMeshPath":
         return Path.NavMeshPath.GetRootAsNavMeshPath(self.bytes, 0)
 
     def get_state(self) -> str:
@@ -847,7 +870,7 @@ class StaticRobot(OutputData):
                     JointType.JointType.prismatic: "prismatic",
                     JointType.JointType.fixed_joint: "fixed_joint"}
 
-    def get_data(self) -> StRobo.StaticRobot:
+    def get_data(self) -> "StRobo.StaticRobot":
         return StRobo.StaticRobot.GetRootAsStaticRobot(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -918,7 +941,7 @@ class StaticRobot(OutputData):
 
 
 class Robot(OutputData):
-    def get_data(self) -> Robo.Robot:
+    def get_data(self) -> "Robo.Robot":
         return Robo.Robot.GetRootAsRobot(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -950,7 +973,7 @@ class Robot(OutputData):
 
 
 class RobotJointVelocities(OutputData):
-    def get_data(self) -> RoJoVe.RobotJointVelocities:
+    def get_data(self) -> "RoJoVe.RobotJointVelocities":
         return RoJoVe.RobotJointVelocities.GetRootAsRobotJointVelocities(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -973,7 +996,7 @@ class RobotJointVelocities(OutputData):
 
 
 class Keyboard(OutputData):
-    def get_data(self) -> Key.Keyboard:
+    def get_data(self) -> "Key.Keyboard":
         return Key.Keyboard.GetRootAsKeyboard(self.bytes, 0)
 
     def get_num_pressed(self) -> int:
@@ -996,7 +1019,7 @@ class Keyboard(OutputData):
 
 
 class ScreenPosition(OutputData):
-    def get_data(self) -> Screen.ScreenPosition:
+    def get_data(self) -> "Screen.ScreenPosition":
         return Screen.ScreenPosition.GetRootAsScreenPosition(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -1016,7 +1039,7 @@ class ScreenPosition(OutputData):
 
 
 class Magnebot(OutputData):
-    def get_data(self) -> Mag.Magnebot:
+    def get_data(self) -> "Mag.Magnebot":
         return Mag.Magnebot.GetRootAsMagnebot(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -1033,7 +1056,7 @@ class Magnebot(OutputData):
 
 
 class TriggerCollision(OutputData):
-    def get_data(self) -> Trigger.TriggerCollision:
+    def get_data(self) -> "Trigger.TriggerCollision":
         return Trigger.TriggerCollision.GetRootAsTriggerCollision(self.bytes, 0)
 
     def get_collidee_id(self) -> int:
@@ -1064,7 +1087,7 @@ class LocalTransforms(OutputData):
         self._forwards = self.data.ForwardsAsNumpy().reshape(-1, 3)
         self._euler_angles = self.data.EulerAnglesAsNumpy().reshape(-1, 3)
 
-    def get_data(self) -> LocalTran.LocalTransforms:
+    def get_data(self) -> "LocalTran.LocalTransforms":
         return LocalTran.LocalTransforms.GetRootAsLocalTransforms(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -1087,7 +1110,7 @@ class LocalTransforms(OutputData):
 
 
 class QuitSignal(OutputData):
-    def get_data(self) -> QuitSig.QuitSignal:
+    def get_data(self) -> "QuitSig.QuitSignal":
         return QuitSig.QuitSignal.GetRootAsQuitSignal(self.bytes, 0)
 
     def get_ok(self) -> bool:
@@ -1095,7 +1118,7 @@ class QuitSignal(OutputData):
 
 
 class MagnebotWheels(OutputData):
-    def get_data(self) -> MWheels.MagnebotWheels:
+    def get_data(self) -> "MWheels.MagnebotWheels":
         return MWheels.MagnebotWheels.GetRootAsMagnebotWheels(self.bytes, 0)
 
     def get_id(self) -> int:
@@ -1106,7 +1129,7 @@ class MagnebotWheels(OutputData):
 
 
 class Occlusion(OutputData):
-    def get_data(self) -> Occl.Occlusion:
+    def get_data(self) -> "Occl.Occlusion":
         return Occl.Occlusion.GetRootAsOcclusion(self.bytes, 0)
 
     def get_avatar_id(self) -> str:
@@ -1120,7 +1143,7 @@ class Occlusion(OutputData):
 
 
 class Lights(OutputData):
-    def get_data(self) -> Lites.Lights:
+    def get_data(self) -> "Lites.Lights":
         return Lites.Lights.GetRootAsLights(self.bytes, 0)
 
     def get_num_directional_lights(self) -> int:
@@ -1152,7 +1175,7 @@ class Lights(OutputData):
 
 
 class Categories(OutputData):
-    def get_data(self) -> Cats.Categories:
+    def get_data(self) -> "Cats.Categories":
         return Cats.Categories.GetRootAsCategories(self.bytes, 0)
 
     def get_num_categories(self) -> int:
@@ -1171,7 +1194,7 @@ class EmptyObjects(OutputData):
         self._ids = self.data.IdsAsNumpy().view(dtype=int)
         self._positions = self.data.PositionsAsNumpy().view(dtype=np.float32).reshape(-1, 3)
 
-    def get_data(self) -> Empty.EmptyObjects:
+    def get_data(self) -> "Empty.EmptyObjects":
         return Empty.EmptyObjects.GetRootAsEmptyObjects(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -1185,7 +1208,7 @@ class EmptyObjects(OutputData):
 
 
 class ObjectColliderIntersection(OutputData):
-    def get_data(self) -> ObjColInt.ObjectColliderIntersection:
+    def get_data(self) -> "ObjColInt.ObjectColliderIntersection":
         return ObjColInt.ObjectColliderIntersection.GetRootAsObjectColliderIntersection(self.bytes, 0)
 
     def get_object_id_a(self) -> int:
@@ -1202,7 +1225,7 @@ class ObjectColliderIntersection(OutputData):
 
 
 class EnvironmentColliderIntersection(OutputData):
-    def get_data(self) -> EnvColInt.EnvironmentColliderIntersection:
+    def get_data(self) -> "EnvColInt.EnvironmentColliderIntersection":
         return EnvColInt.EnvironmentColliderIntersection.GetRootAsEnvironmentColliderIntersection(self.bytes, 0)
 
     def get_object_id(self) -> int:
@@ -1216,7 +1239,7 @@ class EnvironmentColliderIntersection(OutputData):
 
 
 class StaticCompositeObjects(OutputData):
-    def get_data(self) -> StatComp.StaticCompositeObjects:
+    def get_data(self) -> "StatComp.StaticCompositeObjects":
         return StatComp.StaticCompositeObjects.GetRootAsStaticCompositeObjects(self.bytes, 0)
 
     def get_num(self) -> int:
@@ -1321,7 +1344,7 @@ class DynamicCompositeObjects(OutputData):
         self._light_ids = self.data.LightIdsAsNumpy().reshape(-1, 2)
         self._lights = self.data.LightsAsNumpy()
 
-    def get_data(self) -> DynComp.DynamicCompositeObjects:
+    def get_data(self) -> "DynComp.DynamicCompositeObjects":
         return DynComp.DynamicCompositeObjects.GetRootAsDynamicCompositeObjects(self.bytes, 0)
 
     def get_num_hinges(self) -> int:
@@ -1339,6 +1362,12 @@ class DynamicCompositeObjects(OutputData):
     def get_hinge_velocity(self, index: int) -> float:
         return float(self._hinges[index][1])
 
+    def get_hinge_ids(self) -> np.array:
+        return self._hinge_ids
+
+    def get_hinges(self) -> np.array:
+        return self._hinges
+
     def get_num_lights(self) -> int:
         return self._light_ids.shape[0]
 
@@ -1351,9 +1380,15 @@ class DynamicCompositeObjects(OutputData):
     def get_light_is_on(self, index: int) -> bool:
         return bool(self._lights[index])
 
+    def get_light_ids(self) -> np.array:
+        return self._light_ids
+
+    def get_lights(self) -> np.array:
+        return self._lights
+
 
 class ObiParticles(OutputData):
-    def get_data(self) -> ObiP.ObiParticles:
+    def get_data(self) -> "ObiP.ObiParticles":
         return ObiP.ObiParticles.GetRootAsObiParticles(self.bytes, 0)
 
     def get_num_solvers(self) -> int:
@@ -1386,7 +1421,7 @@ class Mouse(OutputData):
         super().__init__(b)
         self._buttons: np.array = self.data.ButtonsAsNumpy().reshape(3, 3)
 
-    def get_data(self) -> Mous.Mouse:
+    def get_data(self) -> "Mous.Mouse":
         return Mous.Mouse.GetRootAsMouse(self.bytes, 0)
 
     def get_position(self) -> np.array:
@@ -0,0 +1,292 @@
+from typing import Dict, Optional
+import numpy as np
+from tdw.quaternion_utils import QuaternionUtils
+from tdw.container_data.container_shape import ContainerShape
+from tdw.container_data.box_container import BoxContainer
+from tdw.container_data.cylinder_container import CylinderContainer
+from tdw.container_data.sphere_container import SphereContainer
+
+
+class ParticleIndex:
+    """
+    A uniform-grid spatial hash of Obi or Flex particles. Use it to quickly find particles in a box, sphere, or cylinder, or in a [`ContainerManager`](add_ons/container_manager.md) container shape.
+
+    Call `update()` once per frame. The grid is rebuilt incrementally: particles usually stay in the same cell or move to a nearby cell between frames, so the previous frame's ordering is reused.
+
+    ```python
+    import numpy as np
+    from tdw.controller import Controller
+    from tdw.add_ons.obi import Obi
+    from tdw.particle_index import ParticleIndex
+
+    c = Controller()
+    obi = Obi()
+    c.add_ons.append(obi)
+    # Your code here.
+    particle_index = ParticleIndex(cell_size=0.05)
+    c.communicate([])
+    particle_index.update(particles={object_id: actor.positions for object_id, actor in obi.actors.items()})
+    # Find every particle within 5 cm of a point.
+    indices = particle_index.get_in_sphere(center=np.array([0, 0.5, 0]), radius=0.05)
+    # The number of particles of each actor within 5 cm of the point.
+    print(particle_index.get_counts(indices))
+    ```
+
+    Flex particles can be added like this: `particle_index.update(particles={flex.get_id(i): flex.get_particles(i) for i in range(flex.get_num_objects())})` where `flex` is `FlexParticles` output data.
+
+    All queries return the indices of particles in `particle_index.positions`, which is all of the particles of every actor in a single array.
+    """
+
+    def __init__(self, cell_size: float = 0.05):
+        """
+        :param cell_size: The size of each cell of the grid in meters. This should be roughly the size of the regions that will be queried.
+        """
+
+        if cell_size <= 0:
+            raise Exception(f"Invalid cell size: {cell_size}")
+        """:field
+        The size of each cell of the grid in meters.
+        """
+        self.cell_size: float = cell_size
+        """:field
+        The position of every particle of every actor. Shape: `(n, 3)`.
+        """
+        self.positions: np.array = np.zeros(shape=(0, 3), dtype=np.float32)
+        """:field
+        The ID of each actor in the same order as the particles in `self.positions`.
+        """
+        self.actor_ids: np.array = np.zeros(shape=0, dtype=int)
+        """:field
+        The index of each particle's actor in `self.actor_ids`. Shape: `(n,)`.
+        """
+        self.particle_actors: np.array = np.zeros(shape=0, dtype=np.intp)
+        # The index of the first particle of each actor in `self.positions`.
+        self._actor_starts: np.array = np.zeros(shape=0, dtype=np.intp)
+        # The number of particles of each actor.
+        self._actor_counts: np.array = np.zeros(shape=0, dtype=np.intp)
+        # The smallest cell coordinates.
+        self._cell_min: np.array = np.zeros(shape=3, dtype=np.int64)
+        # The number of cells along each axis.
+        self._cell_dimensions: np.array = np.ones(shape=3, dtype=np.int64)
+        # The particle indices sorted by cell key.
+        self._order: Optional[np.array] = None
+        # The sorted cell keys.
+        self._keys: np.array = np.zeros(shape=0, dtype=np.int64)
+
+    def update(self, particles: Dict[int, np.array]) -> None:
+        """
+        Rebuild the grid. Call this once per frame.
+
+        :param particles: The particle positions of each actor. Key = The actor ID. Value = A numpy array of particle positions with shape `(n, 3)` or `(n, 4)` (the 4th column is ignored).
+        """
+
+        actor_ids = list(particles.keys())
+        arrays = [np.asarray(particles[actor_id])[:, :3] for actor_id in actor_ids]
+        counts = np.array([len(a) for a in arrays], dtype=np.intp)
+        # Reuse the previous frame's ordering if the actors haven't changed.
+        incremental = self._order is not None and np.array_equal(self.actor_ids, actor_ids) and \
+            np.array_equal(self._actor_counts, counts)
+        self.actor_ids = np.array(actor_ids, dtype=int)
+        self._actor_counts = counts
+        self._actor_starts = np.cumsum(counts) - counts
+        self.particle_actors = np.repeat(np.arange(len(actor_ids), dtype=np.intp), counts)
+        if len(arrays) == 0:
+            self.positions = np.zeros(shape=(0, 3), dtype=np.float32)
+        else:
+            self.positions = np.concatenate(arrays)
+        if len(self.positions) == 0:
+            self._order = np.zeros(shape=0, dtype=np.intp)
+            self._keys = np.zeros(shape=0, dtype=np.int64)
+            return
+        # Get the cell of each particle.
+        cells = np.floor(self.positions / self.cell_size).astype(np.int64)
+        self._cell_min = cells.min(axis=0)
+        self._cell_dimensions = cells.max(axis=0) - self._cell_min + 1
+        keys = self._get_keys(cells - self._cell_min)
+        # Most particles are in the same order as they were on the previous frame, so this sort is very fast.
+        if incremental:
+            self._order = self._order[np.argsort(keys[self._order], kind="stable")]
+        else:
+            self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def get_in_sphere(self, center: np.array, radius: float) -> np.array:
+        """
+        :param center: The center of the sphere.
+        :param radius: The radius of the sphere.
+
+        :return: The indices of the particles in the sphere.
+        """
+
+        center = np.asarray(center, dtype=float)
+        candidates = self._get_candidates(center - radius, center + radius)
+        d = self.positions[candidates] - center
+        return candidates[np.einsum("ij,ij->i", d, d) <= radius * radius]
+
+    def get_in_box(self, center: np.array, half_extents: np.array, rotation: np.array = None) -> np.array:
+        """
+        :param center: The center of the box.
+        :param half_extents: The half extents of the box.
+        :param rotation: The rotation of the box as a quaternion. If None, the box is axis-aligned.
+
+        :return: The indices of the particles in the box.
+        """
+
+        center = np.asarray(center, dtype=float)
+        half_extents = np.asarray(half_extents, dtype=float)
+        if rotation is None:
+            candidates = self._get_candidates(center - half_extents, center + half_extents)
+            local = self.positions[candidates] - center
+        else:
+            matrix = QuaternionUtils.get_rotation_matrix(rotation)
+            aabb = np.abs(matrix).dot(half_extents)
+            candidates = self._get_candidates(center - aabb, center + aabb)
+            local = (self.positions[candidates] - center).dot(matrix)
+        return candidates[np.all(np.abs(local) <= half_extents, axis=1)]
+
+    def get_in_cylinder(self, center: np.array, radius: float, height: float, rotation: np.array = None) -> np.array:
+        """
+        :param center: The center of the cylinder.
+        :param radius: The radius of the cylinder.
+        :param height: The height of the cylinder. The cylinder's axis is its local up direction.
+        :param rotation: The rotation of the cylinder as a quaternion. If None, the cylinder is upright.
+
+        :return: The indices of the particles in the cylinder.
+        """
+
+        center = np.asarray(center, dtype=float)
+        if rotation is None:
+            axis = np.array([0, 1.0, 0])
+        else:
+            axis = QuaternionUtils.get_rotation_matrix(rotation)[:, 1]
+        half_height = height / 2
+        aabb = np.abs(axis) * half_height + radius * np.sqrt(np.maximum(1 - axis * axis, 0))
+        candidates = self._get_candidates(center - aabb, center + aabb)
+        d = self.positions[candidates] - center
+        # The distance along the axis.
+        h = d.dot(axis)
+        # The squared distance from the axis.
+        r = np.einsum("ij,ij->i", d, d) - h * h
+        return candidates[(np.abs(h) <= half_height) & (r <= radius * radius)]
+
+    def get_in_container(self, container_shape: ContainerShape, object_position: np.array,
+                         object_rotation: np.array) -> np.array:
+        """
+        :param container_shape: The [`ContainerShape`](container_data/container_shape.md), for example a shape in `record.container_shapes` where `record` is a `ModelRecord`.
+        :param object_position: The world position of the container shape's parent object, for example from `Transforms` output data.
+        :param object_rotation: The world rotation of the container shape's parent object as a quaternion, for example from `Transforms` output data.
+
+        :return: The indices of the particles in the container shape. The object's scale is ignored.
+        """
+
+        center = np.asarray(object_position, dtype=float) + \
+            QuaternionUtils.multiply_by_vector(q=np.asarray(object_rotation, dtype=float),
+                                               v=np.array([container_shape.position["x"],
+                                                           container_shape.position["y"],
+                                                           container_shape.position["z"]]))
+        if isinstance(container_shape, SphereContainer):
+            return self.get_in_sphere(center=center, radius=container_shape.radius)
+        # Combine the object's rotation with the shape's local rotation.
+        rotation = QuaternionUtils.multiply(np.asarray(object_rotation, dtype=float),
+                                            ParticleIndex._get_euler_quaternion(container_shape.rotation))
+        if isinstance(container_shape, BoxContainer):
+            return self.get_in_box(center=center,
+                                   half_extents=np.array([container_shape.half_extents["x"],
+                                                          container_shape.half_extents["y"],
+                                                          container_shape.half_extents["z"]]),
+                                   rotation=rotation)
+        elif isinstance(container_shape, CylinderContainer):
+            return self.get_in_cylinder(center=center, radius=container_shape.radius,
+                                        height=container_shape.height, rotation=rotation)
+        else:
+            raise Exception(f"Unsupported container shape: {container_shape}")
+
+    def get_counts(self, indices: np.array) -> Dict[int, int]:
+        """
+        :param indices: The indices of particles returned by a query.
+
+        :return: The number of particles of each actor in `indices`. Key = The actor ID. Value = The number of particles.
+        """
+
+        counts = np.bincount(self.particle_actors[indices], minlength=len(self.actor_ids))
+        return {int(actor_id): int(count) for actor_id, count in zip(self.actor_ids, counts)}
+
+    def get_occupancy(self, indices: np.array) -> Dict[int, float]:
+        """
+        :param indices: The indices of particles returned by a query.
+
+        :return: The fraction of each actor's particles in `indices`. Key = The actor ID. Value = The fraction of the actor's particles, between 0 and 1.
+        """
+
+        counts = np.bincount(self.particle_actors[indices], minlength=len(self.actor_ids))
+        fractions = counts / np.maximum(self._actor_counts, 1)
+        return {int(actor_id): float(fraction) for actor_id, fraction in zip(self.actor_ids, fractions)}
+
+    def get_actor_indices(self, indices: np.array) -> Dict[int, np.array]:
+        """
+        :param indices: The indices of particles returned by a query.
+
+        :return: The indices of the particles in `indices` per actor. Key = The actor ID. Value = The indices of the actor's particles, for example the indices of particles in `obi.actors[actor_id].positions`.
+        """
+
+        indices = np.sort(indices)
+        actors = self.particle_actors[indices]
+        local = indices - self._actor_starts[actors]
+        # The particles are sorted by actor.
+        splits = np.searchsorted(actors, np.arange(1, len(self.actor_ids)))
+        return {int(actor_id): actor_indices for actor_id, actor_indices in zip(self.actor_ids, np.split(local, splits))}
+
+    def _get_keys(self, cells: np.array) -> np.array:
+        """
+        :param cells: The cell coordinates relative to `self._cell_min`. Shape: `(n, 3)`.
+
+        :return: The key of each cell.
+        """
+
+        return (cells[:, 0] * self._cell_dimensions[1] + cells[:, 1]) * self._cell_dimensions[2] + cells[:, 2]
+
+    def _get_candidates(self, lower: np.array, upper: np.array) -> np.array:
+        """
+        :param lower: The lower corner of an axis-aligned bounding box.
+        :param upper: The upper corner of an axis-aligned bounding box.
+
+        :return: The indices of the particles in the cells that overlap with the bounding box.
+        """
+
+        # Get the range of cells.
+        cell_lower = np.maximum(np.floor(lower / self.cell_size).astype(np.int64) - self._cell_min, 0)
+        cell_upper = np.minimum(np.floor(upper / self.cell_size).astype(np.int64) - self._cell_min,
+                                self._cell_dimensions - 1)
+        if len(self._keys) == 0 or np.any(cell_upper < cell_lower):
+            return np.zeros(shape=0, dtype=np.intp)
+        num_cells = cell_upper - cell_lower + 1
+        # If the bounding box is very large, it's faster to test every particle.
+        if num_cells[0] * num_cells[1] >= len(self._keys):
+            return np.arange(len(self._keys), dtype=np.intp)
+        # The cells along the z axis of each row of cells are a contiguous range of keys.
+        xs, ys = np.meshgrid(np.arange(cell_lower[0], cell_upper[0] + 1),
+                             np.arange(cell_lower[1], cell_upper[1] + 1), indexing="ij")
+        rows = (xs.ravel() * self._cell_dimensions[1] + ys.ravel()) * self._cell_dimensions[2]
+        starts = np.searchsorted(self._keys, rows + cell_lower[2], side="left")
+        ends = np.searchsorted(self._keys, rows + cell_upper[2], side="right")
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(shape=0, dtype=np.intp)
+        # Concatenate the ranges.
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self._order[offsets + np.arange(total)]
+
+    @staticmethod
+    def _get_euler_quaternion(euler: Dict[str, float]) -> np.array:
+        """
+        :param euler: Euler angles in degrees.
+
+        :return: A quaternion. Like in Unity, the rotation around the z axis is applied first, then the x axis, then the y axis.
+        """
+
+        x, y, z = np.deg2rad([euler["x"], euler["y"], euler["z"]]) / 2
+        qx = np.array([np.sin(x), 0, 0, np.cos(x)])
+        qy = np.array([0, np.sin(y), 0, np.cos(y)])
+        qz = np.array([0, 0, np.sin(z), np.cos(z)])
+        return QuaternionUtils.multiply(QuaternionUtils.multiply(qy, qx), qz)
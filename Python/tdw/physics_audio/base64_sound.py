@@ -21,14 +21,27 @@ class Base64Sound:
         """
         self.bytes: bytes = bytes(np.array(snd * 32767, dtype='int16'))
         """:field
-        A base64 string of the sound. Send this to the build.
-        """
-        self.wav_str = base64.b64encode(self.bytes).decode('utf-8')
-        """:field
         The length of the byte array.
         """
         self.length: int = len(self.bytes)
 
+    @property
+    def wav_str(self) -> str:
+        """
+        :return: A base64 string of the sound. This is encoded from `self.bytes` every time it is accessed. To send audio to the build, it is faster to send `self.bytes`; see `Controller.communicate()`. Setting this decodes the string and sets `self.bytes` and `self.length`.
+        """
+
+        return base64.b64encode(self.bytes).decode('utf-8')
+
+    @wav_str.setter
+    def wav_str(self, value: str) -> None:
+        """
+        :param value: A base64 string of the sound. This is decoded and sets `self.bytes` and `self.length`.
+        """
+
+        self.bytes = base64.b64decode(value)
+        self.length = len(self.bytes)
+
     def write(self, path: Union[str, Path]) -> None:
         """
         Write audio to disk.
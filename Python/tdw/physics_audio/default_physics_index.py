@@ -0,0 +1,158 @@
+import json
+from pathlib import Path
+from uuid import uuid4
+from typing import Dict, List, Tuple
+import numpy as np
+from tdw.librarian import ModelLibrarian, ModelRecord
+from tdw.physics_audio.audio_material import AudioMaterial
+from tdw.physics_audio.object_audio_static import DEFAULT_OBJECT_AUDIO_STATIC_DATA
+from tdw.backend.paths import CACHE_DIR
+from tdw.version import __version__
+
+
+class DefaultPhysicsIndex:
+    """
+    A precomputed index of derived physics values for models that aren't in `DEFAULT_OBJECT_AUDIO_STATIC_DATA`.
+
+    For such a model, the audio material is the most common material of models in the same wnid that have default physics values, and the bounciness is their average bounciness. If there are no such models, the values are derived from models with a similar volume (within 20%). If there are no such models either, the material is `plastic_hard` and the bounciness is 0.
+
+    The index is built once per model library and saved to disk. After that, each lookup is a dictionary lookup or a binary search.
+
+    ```python
+    from tdw.librarian import ModelLibrarian
+    from tdw.physics_audio.default_physics_index import DefaultPhysicsIndex
+
+    index = DefaultPhysicsIndex()
+    record = ModelLibrarian("models_full.json").get_record("b03_696615_object001")
+    material, bounciness = index.get(record)
+    ```
+    """
+
+    """:class_var
+    The index files are saved in this directory.
+    """
+    CACHE_DIRECTORY: Path = CACHE_DIR.joinpath("default_physics_index")
+    # The audio materials in the order that they're counted.
+    _MATERIALS: List[AudioMaterial] = [m for m in AudioMaterial]
+
+    def __init__(self, library: str = "models_full.json", cache: bool = True):
+        """
+        :param library: The model library used to derive physics values. See: `ModelLibrarian.get_library_filenames()`.
+        :param cache: If True, read the index from disk if it exists and write it to disk if it doesn't. If False, always build the index from the model library.
+        """
+
+        """:field
+        The model library used to derive physics values.
+        """
+        self.library: str = library
+        data = None
+        library_path = DefaultPhysicsIndex._get_library_path(library=library)
+        # A string that changes whenever the library file changes.
+        stat = library_path.stat()
+        fingerprint = f"{__version__};{library_path.resolve()};{stat.st_size};{stat.st_mtime_ns};" \
+                      f"{len(DEFAULT_OBJECT_AUDIO_STATIC_DATA)}"
+        path = DefaultPhysicsIndex.CACHE_DIRECTORY.joinpath(library_path.stem + ".json")
+        if cache and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data["fingerprint"] != fingerprint:
+                    data = None
+            except (ValueError, KeyError):
+                data = None
+        if data is None:
+            data = DefaultPhysicsIndex._build(librarian=ModelLibrarian(library=library))
+            data["fingerprint"] = fingerprint
+            if cache:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first so that a partially-written file is never read.
+                # The temporary file name is unique so that concurrent controllers don't write to the same file.
+                temp = path.parent.joinpath(f"{path.name}.{uuid4().hex}.tmp")
+                temp.write_text(json.dumps(data), encoding="utf-8")
+                temp.replace(path)
+        # Key = wnid. Value = The derived material and bounciness.
+        self._wnids: Dict[str, Tuple[AudioMaterial, float]] = {wnid: (AudioMaterial[data["wnids"][wnid][0]],
+                                                                      data["wnids"][wnid][1])
+                                                               for wnid in data["wnids"]}
+        # The absolute volumes of models with default physics values, sorted in ascending order.
+        self._volumes: np.array = np.array(data["volumes"], dtype=np.float64)
+        # The index of the audio material of each model in `self._volumes`.
+        self._materials: np.array = np.array(data["materials"], dtype=int)
+        # The bounciness of each model in `self._volumes`.
+        self._bounciness: np.array = np.array(data["bounciness"], dtype=np.float64)
+        # The index of each model in `self._volumes` in the model library.
+        self._order: np.array = np.array(data["order"], dtype=int)
+        # Cached values per model. Key = The model name. Value = The derived material and bounciness.
+        self._values: Dict[str, Tuple[AudioMaterial, float]] = dict()
+
+    def get(self, record: ModelRecord) -> Tuple[AudioMaterial, float]:
+        """
+        :param record: The model record. This should be a model that isn't in `DEFAULT_OBJECT_AUDIO_STATIC_DATA`.
+
+        :return: Tuple: The derived audio material, the derived bounciness.
+        """
+
+        if record.name in self._values:
+            return self._values[record.name]
+        # Use models in the same wnid.
+        if record.wnid in self._wnids:
+            value = self._wnids[record.wnid]
+        else:
+            value = (AudioMaterial.plastic_hard, 0)
+            # Use models with a similar volume.
+            volume = abs(record.volume)
+            if volume > 0:
+                start = np.searchsorted(self._volumes, volume * 0.8, side="left")
+                end = np.searchsorted(self._volumes, volume * 1.2, side="right")
+                if end > start:
+                    counts = np.bincount(self._materials[start: end], minlength=len(DefaultPhysicsIndex._MATERIALS))
+                    # Sum the bounciness values in library order so that the result is always the same.
+                    bouncinesses = self._bounciness[start: end][np.argsort(self._order[start: end])].tolist()
+                    value = (DefaultPhysicsIndex._MATERIALS[int(np.argmax(counts))],
+                             round(sum(bouncinesses) / len(bouncinesses), 3))
+        self._values[record.name] = value
+        return value
+
+    @staticmethod
+    def _build(librarian: ModelLibrarian) -> dict:
+        """
+        :param librarian: The model librarian.
+
+        :return: Serializable index data.
+        """
+
+        records = [r for r in librarian.records if r.name in DEFAULT_OBJECT_AUDIO_STATIC_DATA and not r.do_not_use]
+        order = {r.name: i for i, r in enumerate(records)}
+        # Derive a material and bounciness per wnid.
+        wnid_records: Dict[str, List[ModelRecord]] = dict()
+        for record in records:
+            if record.wnid not in wnid_records:
+                wnid_records[record.wnid] = list()
+            wnid_records[record.wnid].append(record)
+        wnids: Dict[str, list] = dict()
+        for wnid in wnid_records:
+            materials = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].material for r in wnid_records[wnid]]
+            material: AudioMaterial = max(DefaultPhysicsIndex._MATERIALS, key=materials.count)
+            bouncinesses = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].bounciness for r in wnid_records[wnid]]
+            wnids[wnid] = [material.name, round(sum(bouncinesses) / len(bouncinesses), 3)]
+        # Sort the records by volume.
+        records.sort(key=lambda r: abs(r.volume))
+        return {"wnids": wnids,
+                "volumes": [abs(r.volume) for r in records],
+                "materials": [DefaultPhysicsIndex._MATERIALS.index(DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].material)
+                              for r in records],
+                "bounciness": [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].bounciness for r in records],
+                "order": [order[r.name] for r in records]}
+
+    @staticmethod
+    def _get_library_path(library: str) -> Path:
+        """
+        :param library: The name of a library in the tdw module or the path to a library file.
+
+        :return: The path to the library file.
+        """
+
+        module_path = Path(__file__).parent.parent.joinpath("metadata_libraries", library)
+        if module_path.exists():
+            return module_path
+        else:
+            return Path(library)
@@ -1,4 +1,6 @@
 import math
+from collections import OrderedDict
+from typing import Dict, Tuple
 import numpy as np
 
 
@@ -7,6 +9,9 @@ class Modes:
     Resonant mode properties: Frequencies, powers, and times.
     """
 
+    # The maximum number of cached decaying sinusoids per mode. A mode is usually always summed with the same framerate and resonance, so this leaves room for one other framerate or resonance.
+    _MAX_NUM_SINUSOIDS_PER_MODE: int = 2
+
     def __init__(self, frequencies: np.array, powers: np.array, decay_times: np.array):
         """
         :param frequencies: A numpy array of mode frequencies in Hz.
@@ -26,6 +31,9 @@ class Modes:
         A numpy array of mode decay times i.e. the time in ms it takes for each mode to decay 60dB from its onset power.
         """
         self.decay_times: np.array = decay_times
+        # Cached decaying sinusoids with an onset power of 0 dB, in least-recently-used order. Key = (framerate, resonance, frequency, decay time).
+        # The maximum size of the cache is `Modes._MAX_NUM_SINUSOIDS_PER_MODE * len(self.frequencies)`.
+        self._sinusoids: Dict[Tuple[int, float, float, float], np.array] = OrderedDict()
 
     def sum_modes(self, fs: int = 44100, resonance: float = 1.0) -> np.array:
         """
@@ -38,6 +46,7 @@ class Modes:
         """
 
         synth_sound: np.array = np.empty
+        max_num_sinusoids = Modes._MAX_NUM_SINUSOIDS_PER_MODE * len(self.frequencies)
         # Scroll through modes.
         for i in range(len(self.frequencies)):
             H_dB = 80 + self.powers[i]
@@ -47,13 +56,21 @@ class Modes:
             max_len = mLen
             if mLen > max_len:
                 max_len = mLen
-            tt = np.arange(0, max_len) / fs
-            # synthesize a sinusoid
-            mode = np.cos(2 * math.pi * self.frequencies[i] * tt)
-            mode = mode * (10 ** (self.powers[i] / 20))
-            dcy = tt * (60 / (self.decay_times[i] * resonance / 1e3))
-            env = 10 ** (-dcy / 20)
-            mode = mode * env
+            # The onset power only scales the mode, so the decaying sinusoid can be reused if the power changes.
+            key = (fs, resonance, float(self.frequencies[i]), float(self.decay_times[i]))
+            if key not in self._sinusoids or len(self._sinusoids[key]) < max_len:
+                # Leave some extra room in case the power increases.
+                tt = np.arange(0, math.ceil(max(max_len, 0) * 1.25)) / fs
+                # synthesize a sinusoid
+                sinusoid = np.cos(2 * math.pi * self.frequencies[i] * tt)
+                dcy = tt * (60 / (self.decay_times[i] * resonance / 1e3))
+                env = 10 ** (-dcy / 20)
+                self._sinusoids[key] = sinusoid * env
+            self._sinusoids.move_to_end(key)
+            # Remove the least-recently-used sinusoids.
+            while len(self._sinusoids) > max_num_sinusoids:
+                self._sinusoids.popitem(last=False)
+            mode = self._sinusoids[key][:max(max_len, 0)] * (10 ** (self.powers[i] / 20))
             if i == 0:
                 synth_sound = mode
             else:
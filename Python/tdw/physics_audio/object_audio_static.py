@@ -1,7 +1,6 @@
 import io
 from csv import DictReader
 from pathlib import Path
-from pkg_resources import resource_filename
 from typing import Union, Dict
 from tdw.physics_audio.audio_material import AudioMaterial
 
@@ -73,7 +72,7 @@ def get_static_audio_data(csv_file: Union[str, Path] = "") -> Dict[str, ObjectAu
     if isinstance(csv_file, str):
         # Load the default file.
         if csv_file == "":
-            csv_file = str(Path(resource_filename(__name__, f"objects.csv")).resolve())
+            csv_file = str(Path(__file__).parent.joinpath("objects.csv").resolve())
         else:
             csv_file = str(Path(csv_file).resolve())
     else:
@@ -0,0 +1,213 @@
+import gzip
+import wave
+from struct import unpack
+from pathlib import Path
+from multiprocessing import Pool
+from typing import List, Dict, Union, Tuple, Iterator, Optional
+import numpy as np
+from tdw.add_ons.py_impact import PyImpact
+from tdw.audio_constants import SAMPLE_RATE, SAMPLE_WIDTH
+
+
+class PyImpactRenderer:
+    """
+    Render [`PyImpact`](../add_ons/py_impact.md) audio offline (without a build) from physics simulations that were recorded by [`PyImpactRecorder`](../add_ons/py_impact_recorder.md).
+
+    The collision events are classified exactly as they are by `PyImpact` in a live simulation, and the audio values of each object are derived from the recorded segmentation colors and static rigidbody data.
+
+    Each impact sound is placed on a timeline at the time of the frame in which it occurred, using the per-frame time step that was recorded by `PyImpactRecorder`. Scrape sound chunks of the same object are placed one after another, the same way that the build queues them on the same audio source. The rendered .wav file has one channel per audio source (i.e. per object that made an impact or scrape sound) or, if `mix == True`, a single channel. Audio isn't spatialized because there is no build.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.tdw_utils import TDWUtils
+    from tdw.add_ons.py_impact_recorder import PyImpactRecorder
+    from tdw.physics_audio.py_impact_renderer import PyImpactRenderer
+    from tdw.physics_audio.audio_material import AudioMaterial
+
+    c = Controller()
+    recorder = PyImpactRecorder()
+    c.add_ons.append(recorder)
+    commands = [TDWUtils.create_empty_room(12, 12)]
+    commands.extend(c.get_add_physics_object(model_name="vase_02",
+                                             object_id=0,
+                                             position={"x": 0, "y": 3, "z": 0}))
+    c.communicate(commands)
+    recorder.start(path="vase.gz")
+    for i in range(300):
+        c.communicate([])
+    recorder.stop()
+    c.communicate({"$type": "terminate"})
+
+    # Render the same recording with different floor materials. This doesn't require a build.
+    renderer = PyImpactRenderer()
+    floors = [AudioMaterial.wood_medium, AudioMaterial.stone, AudioMaterial.metal]
+    renderer.render(recordings=["vase.gz" for _ in floors],
+                    output_paths=[f"vase_{floor.name}.wav" for floor in floors],
+                    parameters=[{"floor": floor} for floor in floors])
+    ```
+    """
+
+    def __init__(self, mix: bool = False):
+        """
+        :param mix: If True, mix all of the audio sources into a single channel. If False, each audio source is a separate channel.
+        """
+
+        """:field
+        If True, mix all of the audio sources into a single channel. If False, each audio source is a separate channel.
+        """
+        self.mix: bool = mix
+
+    def render(self, recordings: List[Union[str, Path]], output_paths: List[Union[str, Path]],
+               parameters: List[dict] = None, processes: int = None) -> List[List[int]]:
+        """
+        Render recordings to .wav files in parallel.
+
+        :param recordings: The paths to recordings made by `PyImpactRecorder`. The same recording can be listed more than once.
+        :param output_paths: The path to the output .wav file per recording.
+        :param parameters: If not None, the `PyImpact` constructor parameters per recording, for example: `{"floor": AudioMaterial.stone, "rng": np.random.RandomState(0)}`.
+        :param processes: The number of worker processes. If None, this is the number of CPUs. If 1, the recordings are rendered in this process.
+
+        :return: The audio source ID of each channel per .wav file. If `mix == True`, these are the IDs of each audio source in the mix.
+        """
+
+        if len(recordings) != len(output_paths):
+            raise Exception(f"There are {len(recordings)} recordings but {len(output_paths)} output paths.")
+        if parameters is None:
+            parameters = [dict() for _ in recordings]
+        elif len(parameters) != len(recordings):
+            raise Exception(f"There are {len(recordings)} recordings but {len(parameters)} sets of parameters.")
+        tasks: List[Tuple[str, str, dict, bool]] = list()
+        for recording, output_path, p in zip(recordings, output_paths, parameters):
+            recording = Path(recording) if isinstance(recording, str) else recording
+            output_path = Path(output_path) if isinstance(output_path, str) else output_path
+            if not output_path.parent.exists():
+                output_path.parent.mkdir(parents=True)
+            tasks.append((str(recording.resolve()), str(output_path.resolve()), p, self.mix))
+        if processes == 1 or len(tasks) == 1:
+            return [PyImpactRenderer._render(task) for task in tasks]
+        else:
+            with Pool(processes=processes) as pool:
+                return pool.map(PyImpactRenderer._render, tasks)
+
+    @staticmethod
+    def get_frames(recording: Union[str, Path]) -> Iterator[List[bytes]]:
+        """
+        :param recording: The path to a recording made by `PyImpactRecorder`.
+
+        :return: An iterator of the recorded frames. Each frame is a list of output data, like the response from the build.
+        """
+
+        for duration, frame in PyImpactRenderer._get_frames(recording=recording):
+            yield frame
+
+    @staticmethod
+    def _get_frames(recording: Union[str, Path]) -> Iterator[Tuple[float, List[bytes]]]:
+        """
+        :param recording: The path to a recording made by `PyImpactRecorder`.
+
+        :return: An iterator of the recorded frames. Each element is a tuple: The simulation time in seconds that elapsed on the frame, and a list of output data.
+        """
+
+        if isinstance(recording, Path):
+            recording = str(recording.resolve())
+        with gzip.open(recording, "rb") as f:
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return
+                num_output_data, duration = unpack("<If", header)
+                frame: List[bytes] = list()
+                for i in range(num_output_data):
+                    length = unpack("<I", f.read(4))[0]
+                    frame.append(f.read(length))
+                yield duration, frame
+
+    @staticmethod
+    def _render(task: Tuple[str, str, dict, bool]) -> List[int]:
+        """
+        Render a recording to a .wav file.
+
+        :param task: Tuple: The path to the recording, the path to the .wav file, the `PyImpact` constructor parameters, whether to mix the audio.
+
+        :return: The audio source ID of each channel.
+        """
+
+        recording, output_path, parameters, mix = task
+        py_impact = _OfflinePyImpact(**parameters)
+        # The start sample and audio data of each sound. Key = Audio source ID.
+        sounds: Dict[int, List[Tuple[int, np.array]]] = dict()
+        # The sample at which the most recent impact sound of each audio source will stop playing.
+        impact_ends: Dict[int, int] = dict()
+        # The sample at which the most recent scrape sound chunk of each audio source will stop playing.
+        scrape_ends: Dict[int, int] = dict()
+        num_samples = 0
+        # The elapsed simulation time at the start of the frame.
+        elapsed = 0
+        for duration, resp in PyImpactRenderer._get_frames(recording):
+            frame_start = int(elapsed * SAMPLE_RATE)
+            elapsed += duration
+            # Set the duration of this frame. This also makes PyImpact use the simulation clock, as if it were an add-on.
+            py_impact.before_send(commands=[{"$type": "set_time_step", "time_step": duration}])
+            # This is equivalent to `AudioSourceDone` output data.
+            for audio_source_id in impact_ends:
+                if impact_ends[audio_source_id] <= frame_start:
+                    py_impact.set_audio_source_done(audio_source_id=audio_source_id)
+            py_impact.scrape_commands.clear()
+            py_impact.on_send(resp=resp)
+            scrape_commands = [id(command) for command in py_impact.scrape_commands]
+            for command in py_impact.commands:
+                if command["$type"] != "play_audio_data" and command["$type"] != "play_point_source_data":
+                    continue
+                audio_source_id = command["id"]
+                audio = np.frombuffer(command["wav_data"], dtype=np.int16)
+                if audio_source_id not in sounds:
+                    sounds[audio_source_id] = list()
+                # The build queues scrape sound chunks, so each chunk starts after the previous chunk ends.
+                if id(command) in scrape_commands:
+                    start = max(frame_start, scrape_ends[audio_source_id]) if audio_source_id in scrape_ends else frame_start
+                    end = start + len(audio)
+                    scrape_ends[audio_source_id] = end
+                # Impact sounds start at the time of the frame.
+                else:
+                    start = frame_start
+                    end = start + len(audio)
+                    impact_ends[audio_source_id] = end
+                sounds[audio_source_id].append((start, audio))
+                num_samples = max(num_samples, end)
+            py_impact.commands.clear()
+        # Add each sound to the timeline.
+        audio_source_ids = sorted(sounds.keys())
+        timeline = np.zeros(shape=(num_samples, 1 if mix else len(audio_source_ids)), dtype=np.int32)
+        for channel, audio_source_id in enumerate(audio_source_ids):
+            if mix:
+                channel = 0
+            for start, audio in sounds[audio_source_id]:
+                timeline[start: start + len(audio), channel] += audio
+        w = wave.Wave_write(f=output_path)
+        w.setnchannels(timeline.shape[1])
+        w.setframerate(SAMPLE_RATE)
+        w.setsampwidth(SAMPLE_WIDTH)
+        w.writeframes(np.clip(timeline, -32768, 32767).astype(np.int16).tobytes())
+        w.close()
+        return audio_source_ids
+
+
+class _OfflinePyImpact(PyImpact):
+    """
+    PyImpact with a scrape audio source per object.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The scrape sound commands of this frame.
+        self.scrape_commands: List[dict] = list()
+
+    def get_scrape_sound_command(self, **kwargs) -> Optional[dict]:
+        command = super().get_scrape_sound_command(**kwargs)
+        if command is not None:
+            self.scrape_commands.append(command)
+        return command
+
+    def _get_scrape_audio_source_id(self, primary_id: int) -> int:
+        # Use the object ID so that each scrape sound chunk is added to the object's channel.
+        return primary_id
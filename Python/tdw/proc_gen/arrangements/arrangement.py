@@ -23,6 +23,10 @@ class Arrangement(ABC):
     The default span used for arranging objects next to each other.
     """
     DEFAULT_CELL_SIZE: float = 0.6096
+    # Cached model names and semi-major axes per category. Key = The category.
+    _MODEL_FOOTPRINTS: Dict[str, List[Tuple[str, float]]] = dict()
+    # Cached circular masks. Key = The radius in cells.
+    _CIRCLE_KERNELS: Dict[int, np.array] = dict()
 
     def __init__(self, position: Dict[str, float], rng: Union[int, np.random.RandomState] = None):
         """
@@ -124,10 +128,7 @@ class Arrangement(ABC):
         models_and_categories: Dict[str, str] = dict()
         for category in categories:
             # Get objects small enough to fit within the rectangle.
-            for model_name in Arrangement.MODEL_CATEGORIES[category]:
-                record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
-                model_size = TDWUtils.get_bounds_extents(bounds=record.bounds)
-                model_semi_major_axis = model_size[0] if model_size[0] > model_size[2] else model_size[2]
+            for model_name, model_semi_major_axis in Arrangement._get_model_footprints(category=category):
                 if model_semi_major_axis < semi_minor_axis:
                     model_sizes[model_name] = model_semi_major_axis
                     model_cell_sizes.append(int(model_semi_major_axis / cell_size) + 1)
@@ -136,6 +137,8 @@ class Arrangement(ABC):
         # Get all sizes in occupancy map space.
         model_cell_sizes = list(set(model_cell_sizes))
         model_cell_sizes.reverse()
+        # Cached lists of models that fit within a given semi-major axis. Key = The semi-major axis in cells.
+        models_per_sma: Dict[int, List[str]] = dict()
         for ix, iz in np.ndindex(occupancy_map.shape[0], occupancy_map.shape[1]):
             # Exclude edges.
             if ix == 0 or ix == occupancy_map.shape[0] - 1 or iz == 0 or iz == occupancy_map.shape[1] - 1:
@@ -149,17 +152,17 @@ class Arrangement(ABC):
                 # Stop if the semi-major axis doesn't fit (it would fall off the edge).
                 if ix - mcs < 0 or ix + mcs >= occupancy_map.shape[0] or iz - mcs < 0 or iz + mcs >= occupancy_map.shape[1]:
                     break
+                # There is overlap. Stop here.
+                # The circle is entirely within the occupancy map, so only the window around it needs to be tested.
+                elif np.any(occupancy_map[ix - mcs: ix + mcs + 1, iz - mcs: iz + mcs + 1] &
+                            Arrangement._get_circle_kernel(radius=mcs)):
+                    break
                 else:
-                    # Define the circle.
-                    circle_mask = TDWUtils.get_circle_mask(shape=(occupancy_map.shape[0], occupancy_map.shape[1]),
-                                                           row=ix, column=iz, radius=mcs)
-                    # There is overlap. Stop here.
-                    if np.count_nonzero((circle_mask == True) & (occupancy_map == True)) > 0:
-                        break
-                    else:
-                        sma = mcs
+                    sma = mcs
             # Get all objects that fit.
-            model_names = [m for m in model_sizes if int(model_sizes[m] / cell_size) <= sma]
+            if sma not in models_per_sma:
+                models_per_sma[sma] = [m for m in model_sizes if int(model_sizes[m] / cell_size) <= sma]
+            model_names = models_per_sma[sma]
             if len(model_names) == 0:
                 continue
             # Choose a random model.
@@ -183,7 +186,41 @@ class Arrangement(ABC):
                                                               rotation={"x": 0, "y": self._rng.uniform(0, 360), "z": 0},
                                                               object_id=object_id,
                                                               library="models_core.json"))
-            # Record the position on the occupancy map.
-            occupancy_map[TDWUtils.get_circle_mask(shape=(occupancy_map.shape[0], occupancy_map.shape[1]),
-                                                   row=ix, column=iz, radius=sma) == True] = True
+            # Record the position on the occupancy map. The circle might extend past the edges of the map.
+            x0 = max(ix - sma, 0)
+            x1 = min(ix + sma + 1, occupancy_map.shape[0])
+            z0 = max(iz - sma, 0)
+            z1 = min(iz + sma + 1, occupancy_map.shape[1])
+            occupancy_map[x0: x1, z0: z1] |= Arrangement._get_circle_kernel(radius=sma)[x0 - ix + sma: x1 - ix + sma,
+                                                                                        z0 - iz + sma: z1 - iz + sma]
         return commands, object_ids
+
+    @staticmethod
+    def _get_model_footprints(category: str) -> List[Tuple[str, float]]:
+        """
+        :param category: The model category.
+
+        :return: A list of tuples for each model in the category: The model name, the model's semi-major axis. This is cached.
+        """
+
+        if category not in Arrangement._MODEL_FOOTPRINTS:
+            footprints: List[Tuple[str, float]] = list()
+            for model_name in Arrangement.MODEL_CATEGORIES[category]:
+                record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
+                model_size = TDWUtils.get_bounds_extents(bounds=record.bounds)
+                footprints.append((model_name, model_size[0] if model_size[0] > model_size[2] else model_size[2]))
+            Arrangement._MODEL_FOOTPRINTS[category] = footprints
+        return Arrangement._MODEL_FOOTPRINTS[category]
+
+    @staticmethod
+    def _get_circle_kernel(radius: int) -> np.array:
+        """
+        :param radius: The radius of the circle in cells.
+
+        :return: A square boolean array with side length `radius * 2 + 1`. Elements that are True are within the circle. This is equivalent to `TDWUtils.get_circle_mask()` centered on the array. This is cached.
+        """
+
+        if radius not in Arrangement._CIRCLE_KERNELS:
+            Arrangement._CIRCLE_KERNELS[radius] = TDWUtils.get_circle_mask(shape=(radius * 2 + 1, radius * 2 + 1),
+                                                                           row=radius, column=radius, radius=radius)
+        return Arrangement._CIRCLE_KERNELS[radius]
@@ -0,0 +1,175 @@
+import json
+import gzip
+from hashlib import sha256
+from pathlib import Path
+from multiprocessing import Pool
+from typing import List, Union, Optional, Tuple, Set
+from uuid import uuid4
+from tdw.controller import Controller
+from tdw.librarian import ModelLibrarian, SceneLibrarian
+from tdw.add_ons.proc_gen_kitchen import ProcGenKitchen
+from tdw.proc_gen.arrangements.cabinetry.cabinetry_type import CabinetryType
+from tdw.backend.paths import CACHE_DIR
+from tdw.version import __version__
+
+
+class ProcGenKitchenCache:
+    """
+    Generate [`ProcGenKitchen`](../add_ons/proc_gen_kitchen.md) scenes offline (without a build) for many random seeds in parallel, save them to disk, and load them later.
+
+    Each kitchen is saved as a compressed bundle of commands. The filename of the bundle is a hash of the parameters used to generate it (the random seed, the scene, the room index, the cabinetry type, and the version of TDW), so loading a kitchen is just reading a small file.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.proc_gen.proc_gen_kitchen_cache import ProcGenKitchenCache
+
+    cache = ProcGenKitchenCache()
+    # Generate 1000 kitchens. This doesn't require a build.
+    cache.generate(seeds=list(range(1000)))
+    c = Controller()
+    for seed in range(1000):
+        c.communicate(cache.load(seed=seed))
+        # Your code here.
+    c.communicate({"$type": "terminate"})
+    ```
+
+    The object IDs in a bundle are generated when the bundle is generated. Unlike calling `ProcGenKitchen.create()` with the same seed, loading a bundle always returns the same object IDs.
+    """
+
+    """:class_var
+    The default directory of the command bundles.
+    """
+    DEFAULT_DIRECTORY: Path = CACHE_DIR.joinpath("proc_gen_kitchen")
+
+    def __init__(self, directory: Union[str, Path] = None):
+        """
+        :param directory: The directory of the command bundles. If None, defaults to `ProcGenKitchenCache.DEFAULT_DIRECTORY`.
+        """
+
+        if directory is None:
+            directory = ProcGenKitchenCache.DEFAULT_DIRECTORY
+        elif isinstance(directory, str):
+            directory = Path(directory)
+        """:field
+        The directory of the command bundles.
+        """
+        self.directory: Path = directory
+
+    def generate(self, seeds: List[int], scene: Union[str, List[str]] = None, room_index: int = 0,
+                 cabinetry_type: CabinetryType = None, processes: int = None, overwrite: bool = False) -> List[Path]:
+        """
+        Generate a kitchen per random seed and save each kitchen's commands to disk. This doesn't require a build.
+
+        :param seeds: A list of random seeds. One kitchen will be generated per seed.
+        :param scene: The name of the scene, a list of scene names (one will be chosen randomly per seed), or None (a random scene from `ProcGenKitchen.SCENE_NAMES` will be chosen per seed).
+        :param room_index: The index of the room in the scene's `SceneRecord.rooms`.
+        :param cabinetry_type: A [`CabinetryType`](arrangements/cabinetry/cabinetry_type.md) value. If None, a `CabinetryType` is chosen randomly per seed.
+        :param processes: The number of worker processes. If None, this is the number of CPUs. If 1, the kitchens are generated in this process.
+        :param overwrite: If True, regenerate kitchens that have already been saved to disk.
+
+        :return: The path to the command bundle of each seed, in the same order as `seeds`.
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        paths = [self.get_path(seed=seed, scene=scene, room_index=room_index, cabinetry_type=cabinetry_type)
+                 for seed in seeds]
+        # Only generate the kitchens that haven't been saved yet.
+        # Each kitchen is generated once, even if its seed is listed more than once.
+        tasks: List[Tuple[int, Union[str, List[str], None], int, Optional[str], str]] = list()
+        task_paths: Set[Path] = set()
+        for seed, path in zip(seeds, paths):
+            if path not in task_paths and (overwrite or not path.exists()):
+                task_paths.add(path)
+                tasks.append((seed, scene, room_index, None if cabinetry_type is None else cabinetry_type.name,
+                              str(path.resolve())))
+        if len(tasks) == 0:
+            return paths
+        if processes == 1:
+            ProcGenKitchenCache._initialize_worker()
+            for task in tasks:
+                ProcGenKitchenCache._generate(task)
+        else:
+            with Pool(processes=processes, initializer=ProcGenKitchenCache._initialize_worker) as pool:
+                # Generate several kitchens per task to reduce inter-process overhead.
+                for _ in pool.imap_unordered(ProcGenKitchenCache._generate, tasks, chunksize=4):
+                    pass
+        return paths
+
+    def load(self, seed: int, scene: Union[str, List[str]] = None, room_index: int = 0,
+             cabinetry_type: CabinetryType = None) -> List[dict]:
+        """
+        Load the commands of a kitchen that was generated by `self.generate()`. The parameters must be the same as the parameters used in `self.generate()`.
+
+        :param seed: The random seed.
+        :param scene: The name of the scene, a list of scene names, or None.
+        :param room_index: The index of the room in the scene's `SceneRecord.rooms`.
+        :param cabinetry_type: A [`CabinetryType`](arrangements/cabinetry/cabinetry_type.md) value or None.
+
+        :return: A list of commands that will create the kitchen.
+        """
+
+        path = self.get_path(seed=seed, scene=scene, room_index=room_index, cabinetry_type=cabinetry_type)
+        if not path.exists():
+            raise Exception(f"Kitchen not found for seed {seed}: {path}")
+        return json.loads(gzip.decompress(path.read_bytes()).decode("utf-8"))
+
+    def contains(self, seed: int, scene: Union[str, List[str]] = None, room_index: int = 0,
+                 cabinetry_type: CabinetryType = None) -> bool:
+        """
+        :param seed: The random seed.
+        :param scene: The name of the scene, a list of scene names, or None.
+        :param room_index: The index of the room in the scene's `SceneRecord.rooms`.
+        :param cabinetry_type: A [`CabinetryType`](arrangements/cabinetry/cabinetry_type.md) value or None.
+
+        :return: True if a kitchen with these parameters has been saved to disk.
+        """
+
+        return self.get_path(seed=seed, scene=scene, room_index=room_index, cabinetry_type=cabinetry_type).exists()
+
+    def get_path(self, seed: int, scene: Union[str, List[str]] = None, room_index: int = 0,
+                 cabinetry_type: CabinetryType = None) -> Path:
+        """
+        :param seed: The random seed.
+        :param scene: The name of the scene, a list of scene names, or None.
+        :param room_index: The index of the room in the scene's `SceneRecord.rooms`.
+        :param cabinetry_type: A [`CabinetryType`](arrangements/cabinetry/cabinetry_type.md) value or None.
+
+        :return: The path to the command bundle. This file might not exist yet.
+        """
+
+        if scene is not None and not isinstance(scene, str) and not isinstance(scene, list):
+            raise Exception(f"Invalid scene: {scene}")
+        key = json.dumps([__version__, seed, scene, room_index, None if cabinetry_type is None else cabinetry_type.name])
+        return self.directory.joinpath(sha256(key.encode("utf-8")).hexdigest() + ".json.gz")
+
+    @staticmethod
+    def _initialize_worker() -> None:
+        """
+        Load the librarians once per process so that they aren't reloaded per kitchen.
+        """
+
+        if "models_core.json" not in Controller.MODEL_LIBRARIANS:
+            Controller.MODEL_LIBRARIANS["models_core.json"] = ModelLibrarian("models_core.json")
+        if "scenes.json" not in Controller.SCENE_LIBRARIANS:
+            Controller.SCENE_LIBRARIANS["scenes.json"] = SceneLibrarian()
+
+    @staticmethod
+    def _generate(task: Tuple[int, Union[str, List[str], None], int, Optional[str], str]) -> None:
+        """
+        Generate a kitchen and save it to disk.
+
+        :param task: Tuple: The random seed, the scene, the room index, the name of the cabinetry type or None, the path to the command bundle.
+        """
+
+        seed, scene, room_index, cabinetry_type, path = task
+        proc_gen_kitchen = ProcGenKitchen()
+        proc_gen_kitchen.create(scene=scene, room_index=room_index,
+                                cabinetry_type=None if cabinetry_type is None else CabinetryType[cabinetry_type],
+                                rng=seed)
+        data = gzip.compress(json.dumps(proc_gen_kitchen.commands, separators=(",", ":")).encode("utf-8"))
+        # Write to a temporary file first so that a partially-written bundle is never loaded.
+        path = Path(path)
+        # The temporary file name is unique so that concurrent processes don't write to the same file.
+        temp = path.parent.joinpath(f"{path.name}.{uuid4().hex}.tmp")
+        temp.write_bytes(data)
+        temp.replace(path)
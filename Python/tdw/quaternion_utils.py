@@ -118,6 +118,19 @@ class QuaternionUtils:
 
         return QuaternionUtils.multiply_by_vector(q=QuaternionUtils.get_inverse(q=rotation), v=position - origin)
 
+    @staticmethod
+    def get_rotation_matrix(q: np.array) -> np.array:
+        """
+        :param q: The rotation as a quaternion.
+
+        :return: The 3x3 rotation matrix of the quaternion. To rotate many vectors at once: `vectors.dot(matrix.T)`
+        """
+
+        x, y, z, w = np.asarray(q, dtype=float) / np.linalg.norm(q)
+        return np.array([[1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                         [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                         [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)]])
+
     @staticmethod
     def get_up_direction(q: np.array) -> np.array:
         """
@@ -1,156 +1,206 @@
-from json import loads
-from requests import get
-from typing import List
-from pkg_resources import get_distribution
-from packaging import version
-from tdw.version import __version__
-from tdw.release.build import Build
-
-
-class PyPi:
-    """
-    Compare the version of the installed tdw Python module to the PyPi version.
-    """
-
-    @staticmethod
-    def strip_post_release(v: str) -> str:
-        """
-        If the version number has a post-release suffix (a fourth number), strip it.
-
-        :param v: The version number.
-
-        :return: The version, stripped of the post-release suffix.
-        """
-
-        if len(v.split(".")) > 3:
-            return '.'.join(v.split('.')[:3])
-        else:
-            return v
-
-    @staticmethod
-    def get_major_release(v: str) -> str:
-        """
-        :param v: The version number.
-
-        :return: The major release number (example: in 1.7.0, the major release is 7).
-        """
-
-        return v.split(".")[1].strip()
-
-    @staticmethod
-    def _get_pypi_releases() -> List[str]:
-        """
-        :return: A list of all available PyPi releases.
-        """
-
-        resp = get("https://pypi.org/pypi/tdw/json")
-        data = loads(resp.content)
-        versions = list(data["releases"].keys())
-        versions.sort(key=lambda s: list(map(int, s.split('.'))))
-        return versions
-
-    @staticmethod
-    def get_pypi_version(truncate: bool = False) -> str:
-        """
-        :param truncate: If true, remove the post-release number (the fourth number) if there is one.
-
-        :return: The newest available tdw release on PyPi.
-        """
-
-        # From the list of available versions, get the last one (the most recent).
-        v = PyPi._get_pypi_releases()[-1]
-
-        # Strip the post-release suffix.
-        if truncate:
-            return PyPi.strip_post_release(v)
-        else:
-            return v
-
-    @staticmethod
-    def get_installed_tdw_version(truncate: bool = False) -> str:
-        """
-        :param truncate: If true, remove the post-release number (the fourth number) if there is one.
-
-        :return: The version of the tdw Python module installed on this machine.
-        """
-
-        v = get_distribution("tdw").version
-
-        # Strip the post-release suffix.
-        if truncate:
-            return PyPi.strip_post_release(v)
-        else:
-            return v
-
-    @staticmethod
-    def get_latest_post_release(v: str) -> str:
-        """
-        :param v: A three-part version string, e.g. 1.6.1
-
-        :return: The most up-to-date version or post-release of the tdw module on PyPi with `v`, e.g. 1.6.1.10
-        """
-
-        releases = PyPi._get_pypi_releases()
-        releases = sorted([r for r in releases if r.startswith(v)],
-                          key=lambda r: bytes([int(n) for n in r.split(".")]))
-        if len(releases) == 0:
-            return ""
-        return releases[-1]
-
-    @staticmethod
-    def get_latest_minor_release(v: str) -> str:
-        """
-        :param v: The version number.
-
-        :return: The most up-to-date version in this major release. (Example: if v == 1.5.0, this returns 1.5.5)
-        """
-
-        v = PyPi.strip_post_release(v)
-        releases = PyPi._get_pypi_releases()
-        # Sort the list by the byte array representation to put double-digit version numbers in the correct order.
-        releases = sorted([r for r in releases if r.startswith("1." + PyPi.get_major_release(v))],
-                          key=lambda r: bytes([int(n) for n in r.split(".")]))
-        if len(releases) == 0:
-            return ""
-        return releases[-1]
-
-    @staticmethod
-    def required_tdw_version_is_installed(required_version: str, build_version: str, comparison: str = "==") -> bool:
-        """
-        Check whether the correct version of TDW is installed.
-        This is useful for other modules such as the Magnebot API that rely on certain versions of TDW.
-
-        :param required_version: The required version of TDW.
-        :param build_version: The version of the build.
-        :param comparison: The type of comparison. Options: "==", ">", ">=".
-
-        :return: True if the installed tdw module is the correct version.
-        """
-
-        valid_comparisons: List[str] = ["==", ">", ">="]
-        if comparison not in valid_comparisons:
-            raise Exception(f"Invalid comparison {comparison}. Options are: {valid_comparisons}")
-
-        ok: bool = True
-        required_version = PyPi.strip_post_release(required_version)
-        required_version_parsed = version.parse(required_version)
-        installed_version_parsed = version.parse(__version__)
-        if (comparison == "==" and required_version_parsed != installed_version_parsed) or \
-                (comparison == ">" and installed_version_parsed <= required_version_parsed) or \
-                (comparison == ">=" and installed_version_parsed < required_version_parsed):
-            print(f"WARNING! You have tdw {__version__} but you need tdw {required_version}. "
-                  f"To install the correct version:"
-                  f"\n\tIf you installed tdw from the GitHub repo (pip3 install -e .): "
-                  f"git checkout v{PyPi.strip_post_release(required_version)}"
-                  f"\n\tIf you installed tdw from PyPi (pip3 install tdw): "
-                  f"pip3 install tdw=={required_version}")
-            ok = False
-        build_version_parsed = version.parse(build_version)
-        if (comparison == "==" and build_version_parsed != required_version_parsed) or \
-                (comparison == ">" and build_version_parsed <= required_version_parsed) or \
-                (comparison == ">=" and build_version_parsed < required_version_parsed):
-            url, url_exists = Build.get_url(required_version, check_head=False)
-            print(f"WARNING! You are using TDW build {build_version} but you need TDW build {required_version}. "
-                  f"\n\tDownload and extract: {url}")
-            ok = False
-        return ok
+from json import loads, dumps
+from time import time
+from pathlib import Path
+from requests import get
+from requests.exceptions import RequestException
+from typing import List, Optional
+from uuid import uuid4
+from pkg_resources import get_distribution
+from packaging import version
+from tdw.version import __version__
+from tdw.release.build import Build
+from tdw.backend.paths import CACHE_DIR
+
+
+class PyPi:
+    """
+    Compare the version of the installed tdw Python module to the PyPi version.
+
+    The list of PyPi releases is cached on disk so that PyPi is usually not queried more than once a day. If PyPi can't be reached, the cached releases are used even if they are out of date.
+    """
+
+    """:class_var
+    The path to the cached list of PyPi releases.
+    """
+    CACHE_PATH: Path = CACHE_DIR.joinpath("pypi_releases.json")
+    """:class_var
+    The cached list of PyPi releases expires after this many seconds.
+    """
+    CACHE_TTL: float = 86400
+    """:class_var
+    The timeout in seconds of a request to PyPi.
+    """
+    TIMEOUT: float = 3
+
+    @staticmethod
+    def strip_post_release(v: str) -> str:
+        """
+        If the version number has a post-release suffix (a fourth number), strip it.
+
+        :param v: The version number.
+
+        :return: The version, stripped of the post-release suffix.
+        """
+
+        if len(v.split(".")) > 3:
+            return '.'.join(v.split('.')[:3])
+        else:
+            return v
+
+    @staticmethod
+    def get_major_release(v: str) -> str:
+        """
+        :param v: The version number.
+
+        :return: The major release number (example: in 1.7.0, the major release is 7).
+        """
+
+        return v.split(".")[1].strip()
+
+    @staticmethod
+    def _get_pypi_releases() -> List[str]:
+        """
+        :return: A list of all available PyPi releases.
+        """
+
+        # Try to read the cached releases.
+        cache: Optional[dict] = None
+        if PyPi.CACHE_PATH.exists():
+            try:
+                cache = loads(PyPi.CACHE_PATH.read_text())
+                # Ignore a cache file that doesn't have the expected shape.
+                if not isinstance(cache, dict) or not isinstance(cache["time"], (int, float)) or \
+                        not isinstance(cache["releases"], list) or \
+                        not all(isinstance(r, str) for r in cache["releases"]):
+                    cache = None
+            except (OSError, ValueError, KeyError, TypeError):
+                cache = None
+        if cache is not None and 0 <= time() - cache["time"] < PyPi.CACHE_TTL:
+            return cache["releases"]
+        try:
+            resp = get("https://pypi.org/pypi/tdw/json", timeout=PyPi.TIMEOUT)
+            resp.raise_for_status()
+            data = loads(resp.content)
+        except (RequestException, ValueError) as e:
+            # Fall back to the cached releases.
+            if cache is not None:
+                return cache["releases"]
+            raise Exception(f"Couldn't get the tdw releases from PyPi: {e}")
+        versions = list(data["releases"].keys())
+        versions.sort(key=lambda s: list(map(int, s.split('.'))))
+        # Write to a temporary file first so that a partially-written cache is never read.
+        try:
+            PyPi.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # The temporary file name is unique so that concurrent controllers don't write to the same file.
+            temp = PyPi.CACHE_PATH.parent.joinpath(f"{PyPi.CACHE_PATH.name}.{uuid4().hex}.tmp")
+            temp.write_text(dumps({"time": time(), "releases": versions}))
+            temp.replace(PyPi.CACHE_PATH)
+        except OSError:
+            pass
+        return versions
+
+    @staticmethod
+    def get_pypi_version(truncate: bool = False) -> str:
+        """
+        :param truncate: If true, remove the post-release number (the fourth number) if there is one.
+
+        :return: The newest available tdw release on PyPi.
+        """
+
+        # From the list of available versions, get the last one (the most recent).
+        v = PyPi._get_pypi_releases()[-1]
+
+        # Strip the post-release suffix.
+        if truncate:
+            return PyPi.strip_post_release(v)
+        else:
+            return v
+
+    @staticmethod
+    def get_installed_tdw_version(truncate: bool = False) -> str:
+        """
+        :param truncate: If true, remove the post-release number (the fourth number) if there is one.
+
+        :return: The version of the tdw Python module installed on this machine.
+        """
+
+        v = get_distribution("tdw").version
+
+        # Strip the post-release suffix.
+        if truncate:
+            return PyPi.strip_post_release(v)
+        else:
+            return v
+
+    @staticmethod
+    def get_latest_post_release(v: str) -> str:
+        """
+        :param v: A three-part version string, e.g. 1.6.1
+
+        :return: The most up-to-date version or post-release of the tdw module on PyPi with `v`, e.g. 1.6.1.10
+        """
+
+        releases = PyPi._get_pypi_releases()
+        releases = sorted([r for r in releases if r.startswith(v)],
+                          key=lambda r: bytes([int(n) for n in r.split(".")]))
+        if len(releases) == 0:
+            return ""
+        return releases[-1]
+
+    @staticmethod
+    def get_latest_minor_release(v: str) -> str:
+        """
+        :param v: The version number.
+
+        :return: The most up-to-date version in this major release. (Example: if v == 1.5.0, this returns 1.5.5)
+        """
+
+        v = PyPi.strip_post_release(v)
+        releases = PyPi._get_pypi_releases()
+        # Sort the list by the byte array representation to put double-digit version numbers in the correct order.
+        releases = sorted([r for r in releases if r.startswith("1." + PyPi.get_major_release(v))],
+                          key=lambda r: bytes([int(n) for n in r.split(".")]))
+        if len(releases) == 0:
+            return ""
+        return releases[-1]
+
+    @staticmethod
+    def required_tdw_version_is_installed(required_version: str, build_version: str, comparison: str = "==") -> bool:
+        """
+        Check whether the correct version of TDW is installed.
+        This is useful for other modules such as the Magnebot API that rely on certain versions of TDW.
+
+        :param required_version: The required version of TDW.
+        :param build_version: The version of the build.
+        :param comparison: The type of comparison. Options: "==", ">", ">=".
+
+        :return: True if the installed tdw module is the correct version.
+        """
+
+        valid_comparisons: List[str] = ["==", ">", ">="]
+        if comparison not in valid_comparisons:
+            raise Exception(f"Invalid comparison {comparison}. Options are: {valid_comparisons}")
+
+        ok: bool = True
+        required_version = PyPi.strip_post_release(required_version)
+        required_version_parsed = version.parse(required_version)
+        installed_version_parsed = version.parse(__version__)
+        if (comparison == "==" and required_version_parsed != installed_version_parsed) or \
+                (comparison == ">" and installed_version_parsed <= required_version_parsed) or \
+                (comparison == ">=" and installed_version_parsed < required_version_parsed):
+            print(f"WARNING! You have tdw {__version__} but you need tdw {required_version}. "
+                  f"To install the correct version:"
+                  f"\n\tIf you installed tdw from the GitHub repo (pip3 install -e .): "
+                  f"git checkout v{PyPi.strip_post_release(required_version)}"
+                  f"\n\tIf you installed tdw from PyPi (pip3 install tdw): "
+                  f"pip3 install tdw=={required_version}")
+            ok = False
+        build_version_parsed = version.parse(build_version)
+        if (comparison == "==" and build_version_parsed != required_version_parsed) or \
+                (comparison == ">" and build_version_parsed <= required_version_parsed) or \
+                (comparison == ">=" and build_version_parsed < required_version_parsed):
+            url, url_exists = Build.get_url(required_version, check_head=False)
+            print(f"WARNING! You are using TDW build {build_version} but you need TDW build {required_version}. "
+                  f"\n\tDownload and extract: {url}")
+            ok = False
+        return ok
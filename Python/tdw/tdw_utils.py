@@ -582,16 +582,60 @@ class TDWUtils:
             return False
 
     @staticmethod
-    def get_base64_flex_particle_forces(forces: list) -> str:
+    def get_base64_flex_particle_forces(forces: Union[list, np.array]) -> str:
         """
-        :param forces: The forces (see Flex documentation for how to arrange this array).
+        :param forces: The forces (see Flex documentation for how to arrange this array). This can be a list or a numpy array. To create this array from numpy arrays of forces and particle IDs, see `TDWUtils.get_flex_particle_forces()`.
 
         :return: An array of Flex particle forces encoded in base64.
         """
 
-        forces = np.array(forces, dtype=np.float32)
+        # If this is already a contiguous float32 numpy array, it won't be copied.
+        forces = np.ascontiguousarray(forces, dtype=np.float32)
         return base64.b64encode(forces).decode()
 
+    @staticmethod
+    def get_flex_particle_forces(forces: np.array, particle_ids: np.array = None, mask: np.array = None) -> bytes:
+        """
+        Arrange forces and Flex particle IDs for the `apply_forces_to_flex_object_base64` command: `[f0_x, f0_y, f0_z, id0, f1_x, f1_y, f1_z, id1 ... ]`
+
+        The returned value can be used as the `"forces_and_ids_base64"` parameter. `Controller.communicate()` will encode it as base64.
+
+        ```python
+        # Apply a force to every particle above y=0.75
+        particles = flex_particles.get_particles(j)
+        forces_and_ids = TDWUtils.get_flex_particle_forces(forces=np.array([10, 0, 0]), mask=particles[:, 1] > 0.75)
+        c.communicate({"$type": "apply_forces_to_flex_object_base64",
+                       "forces_and_ids_base64": forces_and_ids,
+                       "id": object_id})
+        ```
+
+        :param forces: The forces as a numpy array. Either shape `(3,)` (the same force is applied to each particle) or shape `(n, 3)` (one force per particle). If `mask` isn't None, this can also be one force per element in `mask`.
+        :param particle_ids: The particle IDs as a numpy array of shape `(n,)`. A particle ID is the index of the particle in `FlexParticles.get_particles(index)`. If None, the particle IDs are derived from `mask` or, if `mask` is also None, they are `0` through `n - 1`.
+        :param mask: A boolean numpy array of shape `(m,)`, where `m` is the number of particles in the object. If not None, forces are applied only to particles where `mask` is True. This is ignored if `particle_ids` isn't None.
+
+        :return: The forces and particle IDs as float32 bytes.
+        """
+
+        forces = np.asarray(forces, dtype=np.float32)
+        if particle_ids is None:
+            if mask is not None:
+                particle_ids = np.flatnonzero(mask)
+                # Select the forces of the masked particles.
+                if forces.ndim == 2 and len(forces) == len(mask) != len(particle_ids):
+                    forces = forces[mask]
+            elif forces.ndim == 2:
+                particle_ids = np.arange(len(forces))
+            else:
+                raise Exception("If forces is a single force, particle_ids or mask must be set.")
+        if forces.shape[-1] != 3 or forces.ndim > 2:
+            raise Exception(f"Invalid forces shape: {forces.shape}")
+        if forces.ndim == 2 and len(forces) != len(particle_ids):
+            raise Exception(f"There are {len(forces)} forces but {len(particle_ids)} particle IDs.")
+        forces_and_ids = np.empty(shape=(len(particle_ids), 4), dtype=np.float32)
+        forces_and_ids[:, :3] = forces
+        forces_and_ids[:, 3] = particle_ids
+        return forces_and_ids.tobytes()
+
     @staticmethod
     def color_to_hashable(color: Union[np.array, Tuple[int, int, int]]) -> int:
         """
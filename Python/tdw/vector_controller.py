@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Union, Optional
+import zmq
+from tdw.controller import Controller
+
+
+class VectorController:
+    """
+    Step many builds at the same time from one Python process. This is useful for reinforcement learning with many environments per machine.
+
+    A `VectorController` has one [`Controller`](controller.md) per build. `communicate()` sends every controller's commands before receiving any output data, so the builds simulate their frames in parallel. Responses are received as soon as each build is done, and each controller's add-ons process the response in a pool of worker threads while the `VectorController` waits for the other builds.
+
+    ```python
+    from tdw.vector_controller import VectorController
+    from tdw.tdw_utils import TDWUtils
+    from tdw.add_ons.object_manager import ObjectManager
+
+    c = VectorController(ports=[1071, 1072, 1073, 1074])
+    # Each environment has its own add-ons.
+    object_managers = list()
+    for controller in c.controllers:
+        object_manager = ObjectManager()
+        controller.add_ons.append(object_manager)
+        object_managers.append(object_manager)
+    # Each environment has its own commands.
+    c.communicate([[TDWUtils.create_empty_room(12, 12),
+                    c.controllers[i].get_add_object(model_name="iron_box",
+                                                    position={"x": 0, "y": i, "z": 0},
+                                                    object_id=0)] for i in range(len(c.controllers))])
+    for i in range(100):
+        resp = c.communicate([[] for _ in range(len(c.controllers))])
+    c.communicate([{"$type": "terminate"} for _ in range(len(c.controllers))])
+    c.close()
+    ```
+
+    Add-ons of different controllers are processed in parallel threads and therefore must not share data with each other. Because of Python's global interpreter lock, add-on processing is only faster than it would be in sequence if the add-ons spend most of their time in numpy or I/O; in all cases, the add-ons of each controller start processing as soon as its build responds rather than after every build has responded.
+    """
+
+    def __init__(self, ports: List[int], check_version: bool = True, launch_build: bool = True, ipc: bool = False,
+                 num_threads: int = None):
+        """
+        :param ports: The port of each build. A controller is created for each port.
+        :param check_version: If True, the first controller will check the version of the build and print the result. See: `Controller.__init__()`.
+        :param launch_build: If True, automatically launch a build for each port. If a build doesn't exist or is the wrong version, it is downloaded once before the builds are launched. The builds are launched at the same time.
+        :param ipc: If True, each controller's socket is also bound to an inter-process communication endpoint. See: `Controller.get_ipc_endpoint(port)`.
+        :param num_threads: The number of worker threads that process the add-ons. If None, there is one thread per controller.
+        """
+
+        if len(ports) == 0:
+            raise Exception("There must be at least one port.")
+        if len(set(ports)) != len(ports):
+            raise Exception(f"Ports must be unique: {ports}")
+        # Download the build once in this thread. Otherwise, each controller would try to download the build at the same time.
+        if launch_build and not Controller._download_build():
+            launch_build = False
+        self._pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=len(ports) if num_threads is None else num_threads)
+        # Create the controllers at the same time so that the builds launch in parallel.
+        # The build has already been downloaded, so the controllers only launch it.
+        # Only the first controller checks the version because the builds are all the same version.
+        futures: List[Future] = [self._pool.submit(Controller, port=port, check_version=check_version and i == 0,
+                                                   launch_build=launch_build, ipc=ipc)
+                                 for i, port in enumerate(ports)]
+        """:field
+        The controllers, in the same order as `ports`. Add add-ons to each controller's `add_ons` list.
+        """
+        self.controllers: List[Controller] = [future.result() for future in futures]
+
+    def communicate(self, commands: List[Union[dict, List[dict]]]) -> List[list]:
+        """
+        Send commands to each build and receive output data in response. This is the same as calling `communicate()` for each controller, except that every build receives its commands before any response is received.
+
+        :param commands: A list of commands per controller, in the same order as `self.controllers`. Each element can be a command or a list of commands.
+
+        :return: The output data of each build, in the same order as `self.controllers`.
+        """
+
+        if len(commands) != len(self.controllers):
+            raise Exception(f"Got {len(commands)} lists of commands but there are {len(self.controllers)} controllers.")
+        # Append the add-ons' commands and serialize in the worker threads.
+        messages: List[List[bytes]] = list(self._pool.map(VectorController._get_message, self.controllers, commands))
+        # Send all of the commands before receiving any output data.
+        poller = zmq.Poller()
+        indices: Dict[zmq.Socket, int] = dict()
+        for i, (controller, message) in enumerate(zip(self.controllers, messages)):
+            controller.socket.send_multipart(message)
+            poller.register(controller.socket, zmq.POLLIN)
+            indices[controller.socket] = i
+        # Receive each response as soon as it is ready and send it to the controller's add-ons.
+        futures: List[Optional[Future]] = [None for _ in range(len(self.controllers))]
+        while len(indices) > 0:
+            for socket, event in poller.poll():
+                i = indices.pop(socket)
+                # The controller might re-send the message in `_on_receive()`, so the socket can't be polled here.
+                poller.unregister(socket)
+                futures[i] = self._pool.submit(self.controllers[i]._on_receive, msg=messages[i],
+                                               resp=socket.recv_multipart())
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """
+        Close the socket of each controller and stop the worker threads. Call this after sending `{"$type": "terminate"}` to each build. After calling this, the `VectorController` can't be used.
+        """
+
+        self._pool.shutdown(wait=True)
+        for controller in self.controllers:
+            controller.socket.close()
+
+    @staticmethod
+    def _get_message(controller: Controller, commands: Union[dict, List[dict]]) -> List[bytes]:
+        """
+        :param controller: The controller.
+        :param commands: The commands.
+
+        :return: The message that will be sent to the controller's build.
+        """
+
+        if isinstance(commands, dict):
+            commands = [commands]
+        return controller._get_message(commands=commands)